@@ -1,4 +1,5 @@
 import asyncio
+import sys
 from typing import Annotated
 from genai_session.session import GenAISession
 from genai_session.utils.context import GenAIContext
@@ -6,31 +7,49 @@ import os
 from dotenv import load_dotenv
 import logging
 
+logger = logging.getLogger(__name__)
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+from profile_store import attach_astro_features, profile_store  # noqa: E402
+
 load_dotenv()
 
 # If AGENT_JWT is present, replace with os.environ.get usage
 AGENT_JWT = os.environ.get("ASTRO_DATA_AGENT_JWT", "")
 session = GenAISession(jwt_token=AGENT_JWT)
 
+
 @session.bind(
     name="astro_data_agent",
     description=(
         "Receives a user profile dictionary from the frontend with the following fields: 'name' (str), 'dob' (str, e.g., '2000-01-01'), 'tob' (str, e.g., '06:00'), 'place' (str, e.g., 'Chennai, India'), 'gender' (str), 'occupation' (str). "
-        "Returns the same user profile dictionary as output. "
+        "Returns the same user profile dictionary with an 'astro_features' dict added: moon 'nakshatra' (id, name, pada), 'rasi', "
+        "'koot' attributes (varna, vasya, yoni, gana, nadi), 'manglik' status and the feature 'version'. "
         "Input: user_profile (dict with 'name', 'dob', 'tob', 'place', 'gender', 'occupation'). "
-        "Output: user_profile (dict with the same fields as input)."
-    )
+        "Output: user_profile (dict with the same fields as input plus 'astro_features')."
+    ),
 )
 async def astro_data_agent(
     agent_context: GenAIContext,
-    user_profile: Annotated[dict, "User profile with name, dob, tob, place, gender, occupation"]
+    user_profile: Annotated[
+        dict, "User profile with name, dob, tob, place, gender, occupation"
+    ],
 ):
-    # Just return the profile as-is, or with a placeholder for lat/lon
-    return user_profile
+    """
+    Attach locally computed astro features to the profile. Features already
+    stored for this profile are reused unless the engine version changed,
+    in which case the stored ones are replaced.
+    """
+    return await attach_astro_features(user_profile)
+
 
 async def main():
     logging.info("Astro data agent started.")
-    await session.process_events()
+    try:
+        await session.process_events()
+    finally:
+        await profile_store.close()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
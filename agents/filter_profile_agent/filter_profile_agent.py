@@ -1,8 +1,8 @@
 import asyncio
 import os
-import supabase
+import sys
 import logging
-from typing import List, Dict, Annotated
+from typing import List, Dict, Annotated, Optional, Union
 from genai_session.session import GenAISession
 from genai_session.utils.context import GenAIContext
 from dotenv import load_dotenv
@@ -13,49 +13,24 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+from profile_store import profile_store  # noqa: E402
+from candidate_search import (  # noqa: E402
+    CANDIDATE_PAGE_LIMIT,
+    candidate_filters,
+    get_profiles,
+)
+from candidate_batch import BATCH_FORMAT, to_batch  # noqa: E402
+
 AGENT_JWT = os.environ.get("FILTER_PROFILE_AGENT_JWT", "")
 session = GenAISession(jwt_token=AGENT_JWT)
 
-SUPABASE_URL = os.environ.get('SUPABASE_URL')
-SUPABASE_KEY = os.environ.get('SUPABASE_KEY')
+# "records" returns a list of dicts, "columnar" a candidate_batch dict with one array per field
+CANDIDATE_BATCH_FORMAT = os.environ.get("CANDIDATE_BATCH_FORMAT", "records")
 
-if not SUPABASE_URL or not SUPABASE_KEY:
-    logger.error("SUPABASE_URL or SUPABASE_KEY not found in environment variables!")
-else:
-    try:
-        supabase_client = supabase.create_client(SUPABASE_URL, SUPABASE_KEY)
-        logger.info("Supabase client created successfully")
-    except Exception as e:
-        logger.error(f"Failed to create Supabase client: {e}")
-        supabase_client = None
+if not profile_store.configured:
+    logger.error("PROFILES_DATABASE_URL not found in environment variables!")
 
-def get_profiles(opposite_gender: str) -> List[Dict]:
-    logger.info(f"Fetching profiles for gender: {opposite_gender}")
-    
-    if not supabase_client:
-        logger.error("Supabase client not available")
-        return []
-    
-    try:
-        # First, let's check ALL profiles to see what's in the database
-        logger.info("Checking ALL profiles in database...")
-        all_profiles_response = supabase_client.table('profiles').select('*').execute()
-        
-        if all_profiles_response.data:
-            for i, profile in enumerate(all_profiles_response.data):
-                logger.info(f"Profile {i+1}: {profile}")
-        
-        # Now try the specific gender query
-        logger.info(f"Executing Supabase query for gender: '{opposite_gender}'")
-        response = supabase_client.table('profiles').select('*').eq('gender', opposite_gender).execute()
-        
-        if response.data:
-            logger.info(f"Sample profile: {response.data[0] if response.data else 'No data'}")
-        
-        return response.data if response.data else []
-    except Exception as e:
-        logger.error(f"Error fetching profiles from Supabase: {e}")
-        return []
 
 @session.bind(
     name="filter_profile_agent",
@@ -63,29 +38,68 @@ def get_profiles(opposite_gender: str) -> List[Dict]:
         "Receives a user profile dictionary with fields including 'lat' (float), 'lon' (float), 'gender' (str), etc. "
         "Returns a filtered list of candidate profile dictionaries, each with fields like 'name', 'dob', 'tob', 'place', 'gender', 'occupation', 'lat', 'lon'. "
         "Input: user_profile (dict with 'lat', 'lon', 'gender', ...). "
-        "Output: candidates (list of dicts, each a candidate profile, e.g., [{'name': 'Priya', 'dob': '1995-02-02', ...}, ...])."
-    )
+        "Optional filters: max_distance_km (km from the user's lat/lon), min_age and max_age (years), occupation, "
+        "min_guna (minimum Guna Milan points out of 36, needs the user's 'dob' and 'tob'). "
+        "Candidates come in id order, at most 'limit' per call; pass the last candidate's 'id' as after_id for the next page. "
+        "Output: candidates (list of dicts, each a candidate profile, e.g., [{'id': 7, 'name': 'Priya', 'dob': '1995-02-02', ...}, ...]), "
+        "or {'error': ...}. "
+        "With output_format 'columnar', candidates is a columnar batch dict ('format', 'schema', 'columns') accepted by kundli_match_agent."
+    ),
 )
 async def filter_profile_agent(
     agent_context: GenAIContext,
-    user_profile: Annotated[dict, "User profile with lat, lon, gender, etc."]
-):
-    
-    user_gender = user_profile.get('gender')
-    
-    if user_gender not in ('male', 'female'):
-        logger.error(f"Invalid gender: {user_gender}")
-        return {"error": "User gender must be 'male' or 'female'"}
-    
-    opposite_gender = 'female' if user_gender == 'male' else 'male'
-    
-    matches = get_profiles(opposite_gender)
-    
+    user_profile: Annotated[dict, "User profile with lat, lon, gender, etc."],
+    max_distance_km: Annotated[
+        Optional[float], "Maximum distance from the user's lat/lon in km (optional)"
+    ] = None,
+    min_age: Annotated[
+        Optional[int], "Minimum candidate age in years (optional)"
+    ] = None,
+    max_age: Annotated[
+        Optional[int], "Maximum candidate age in years (optional)"
+    ] = None,
+    occupation: Annotated[Optional[str], "Candidate occupation (optional)"] = None,
+    min_guna: Annotated[
+        Optional[float], "Minimum Guna Milan points out of 36 (optional)"
+    ] = None,
+    output_format: Annotated[
+        Optional[str], "'records' or 'columnar' (optional)"
+    ] = None,
+    limit: Annotated[
+        Optional[int], "Maximum candidates to return, 0 for all (optional)"
+    ] = None,
+    after_id: Annotated[
+        Optional[int], "Return candidates after this id, for the next page (optional)"
+    ] = None,
+) -> Union[List[Dict], Dict]:
+    selection = candidate_filters(
+        user_profile, max_distance_km, min_age, max_age, occupation, min_guna
+    )
+    if isinstance(selection, dict):
+        return selection
+    opposite_gender, filters = selection
+
+    matches = await get_profiles(
+        opposite_gender,
+        filters,
+        CANDIDATE_PAGE_LIMIT if limit is None else limit,
+        after_id,
+    )
+    if isinstance(matches, dict):
+        return matches
+
+    if (output_format or CANDIDATE_BATCH_FORMAT) == BATCH_FORMAT:
+        return to_batch(matches)
     return matches
 
+
 async def main():
     logging.info("Filter profile agent started.")
-    await session.process_events()
+    try:
+        await session.process_events()
+    finally:
+        await profile_store.close()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,85 +1,77 @@
 import asyncio
 import sys
 import os
-from typing import Annotated, List, Dict, Any
+from typing import Annotated, List, Dict, Any, Optional, Union
 from genai_session.session import GenAISession
 from genai_session.utils.context import GenAIContext
 from dotenv import load_dotenv
 import logging
 
+logger = logging.getLogger(__name__)
+
 # Add the current directory to the path so we can import prokerala
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'shared_utils'))
-from prokerala import get_kundli_match
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+from prokerala import close_http_client  # noqa: E402
+from candidate_batch import as_records, is_batch, to_batch  # noqa: E402
+from kundli_scoring import score_candidates  # noqa: E402
+from scoring_pool import close_scoring_pool  # noqa: E402
 
 load_dotenv()
 
 AGENT_JWT = os.environ.get("KUNDLI_MATCH_AGENT_JWT", "")
 session = GenAISession(jwt_token=AGENT_JWT)
 
+
 @session.bind(
     name="kundli_match_agent",
     description=(
-        "For each candidate profile, calculate kundli compatibility with the user profile using Prokerala API."
+        "For each candidate profile, calculate kundli compatibility with the user profile using the local Ashtakoot engine or Prokerala API. "
         "Receives a user profile dictionary and a list of candidate profile dictionaries. "
         "Input: user_profile (dict with 'name', 'dob', 'tob', 'place', 'gender', 'occupation', 'lat', 'lon', ...), candidates (list of dicts, each a candidate profile). "
-        "Returns a list of match result dictionaries, each with 'match' (candidate profile dict) and 'compatibility' (dict with 'compatibility_score', 'summary', etc.). "
+        "Returns a list of match result dictionaries, each with 'match' (candidate profile dict) and 'compatibility' (dict with 'compatibility_score', 'summary', "
+        "'details' with boy_info/girl_info nakshatra, rasi and koot, koot_points and message, etc.). "
+        "candidates may also be a columnar batch from filter_profile_agent; the results are then returned as a columnar batch too. "
+        "With Prokerala, only the top_k best local estimates (at most max_paid_calls) are scored remotely; the rest have 'estimated': true. "
         "Output: list of dicts, e.g., [{'match': {...}, 'compatibility': {...}}, ...]."
-    )
+    ),
 )
 async def kundli_match_agent(
     agent_context: GenAIContext,
-    user_profile: Annotated[dict, "User profile details (with dob, tob, lat, lon, etc.)"],
-    candidates: Annotated[List[Dict[str, Any]], "List of candidate profiles to match against"]
+    user_profile: Annotated[
+        dict, "User profile details (with dob, tob, lat, lon, etc.)"
+    ],
+    candidates: Annotated[
+        Union[List[Dict[str, Any]], Dict[str, Any]],
+        "List or columnar batch of candidate profiles to match against",
+    ],
+    top_k: Annotated[
+        Optional[int],
+        "Number of best local estimates to score with Prokerala (optional)",
+    ] = None,
+    max_paid_calls: Annotated[
+        Optional[int], "Maximum Prokerala calls for this request (optional)"
+    ] = None,
 ):
     """
     For each candidate profile, calculate kundli compatibility with the user profile using Prokerala API.
-    Returns a list of dicts: {match: <candidate_profile>, compatibility: <compatibility_result>}
+    Returns a list of dicts: {match: <candidate_profile>, compatibility: <compatibility_result>},
+    or a columnar batch of them when the candidates came as one.
     """
-    results = []
-    for candidate in candidates:
-        user_data = {
-            "dob": user_profile.get("dob"),
-            "tob": user_profile.get("tob"),
-            "lat": user_profile.get("lat"),
-            "lon": user_profile.get("lon")
-        }
-        match_data = {
-            "dob": candidate.get("dob"),
-            "tob": candidate.get("tob"),
-            "lat": candidate.get("lat"),
-            "lon": candidate.get("lon")
-        }
-        try:
-            compatibility_result = await get_kundli_match(user_data, match_data)
-            if "error" in compatibility_result:
-                compatibility = {
-                    "compatibility_score": 0,
-                    "summary": f"Error: {compatibility_result['error']}",
-                    "message_type": "error"
-                }
-            else:
-                compatibility = {
-                    "compatibility_score": compatibility_result.get("compatibility_score", 0),
-                    "total_points": compatibility_result.get("total_points", 0),
-                    "maximum_points": compatibility_result.get("maximum_points", 36),
-                    "summary": compatibility_result.get("message", "Compatibility analysis completed"),
-                    "message_type": compatibility_result.get("message_type", "neutral"),
-                    "raw_response": compatibility_result.get("raw_response", {})
-                }
-        except Exception as e:
-            compatibility = {
-                "compatibility_score": 0,
-                "total_points": 0,
-                "maximum_points": 36,
-                "summary": f"Error: {str(e)}",
-                "message_type": "error"
-            }
-        results.append({"match": candidate, "compatibility": compatibility})
-    return results
+    columnar = is_batch(candidates)
+    results = await score_candidates(
+        user_profile, as_records(candidates), top_k, max_paid_calls
+    )
+    return to_batch(results) if columnar else results
+
 
 async def main():
     logging.info("Kundli matching agent started.")
-    await session.process_events()
+    try:
+        await session.process_events()
+    finally:
+        await close_http_client()
+        await close_scoring_pool()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import sys
+import logging
+from typing import Annotated, Optional
+from genai_session.session import GenAISession
+from genai_session.utils.context import GenAIContext
+from dotenv import load_dotenv
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+from geocode import close_http_client as close_geocode_client  # noqa: E402
+from prokerala import close_http_client as close_prokerala_client  # noqa: E402
+from profile_store import profile_store  # noqa: E402
+from matchmaking import run_pipeline  # noqa: E402
+from scoring_pool import close_scoring_pool  # noqa: E402
+
+AGENT_JWT = os.environ.get("MATCHMAKING_PIPELINE_AGENT_JWT", "")
+session = GenAISession(jwt_token=AGENT_JWT)
+
+
+@session.bind(
+    name="matchmaking_pipeline_agent",
+    description=(
+        "Runs the whole matchmaking flow in one step: geocodes the user's birth place, attaches astro features, "
+        "fetches opposite-gender candidates, scores kundli compatibility and formats the results. "
+        "Use it instead of calling astro_data_agent, geocode_agent, filter_profile_agent, kundli_match_agent and results_formatter_agent in turn. "
+        "Input: user_profile (dict with 'name', 'dob', 'tob', 'place', 'gender', 'occupation'); optional filters max_distance_km, min_age, max_age, occupation, min_guna; "
+        "optional top_k and max_paid_calls for Prokerala, results_top_k, ranking_mode ('score' or 'weighted') and tenant for ranking. "
+        "Output: the results_formatter_agent dict with keys 'user_profile', 'matches' (list), 'total_matches' (int), 'best_match' (dict), 'analysis' (dict), "
+        "plus 'candidates_scored' (int) and 'timings' (milliseconds per stage: geocode, astro, filter, score, format, total)."
+    ),
+)
+async def matchmaking_pipeline_agent(
+    agent_context: GenAIContext,
+    user_profile: Annotated[
+        dict, "User profile with name, dob, tob, place, gender, occupation"
+    ],
+    max_distance_km: Annotated[
+        Optional[float], "Maximum distance from the user's birth place in km (optional)"
+    ] = None,
+    min_age: Annotated[
+        Optional[int], "Minimum candidate age in years (optional)"
+    ] = None,
+    max_age: Annotated[
+        Optional[int], "Maximum candidate age in years (optional)"
+    ] = None,
+    occupation: Annotated[Optional[str], "Candidate occupation (optional)"] = None,
+    min_guna: Annotated[
+        Optional[float], "Minimum Guna Milan points out of 36 (optional)"
+    ] = None,
+    top_k: Annotated[
+        Optional[int],
+        "Number of best local estimates to score with Prokerala (optional)",
+    ] = None,
+    max_paid_calls: Annotated[
+        Optional[int], "Maximum Prokerala calls for this request (optional)"
+    ] = None,
+    results_top_k: Annotated[
+        Optional[int], "Number of good matches to return (optional)"
+    ] = None,
+    ranking_mode: Annotated[Optional[str], "'score' or 'weighted' (optional)"] = None,
+    tenant: Annotated[
+        Optional[str], "Tenant whose ranking weights apply in weighted mode (optional)"
+    ] = None,
+):
+    """
+    Geocode, filter, score and format in-process, without a router hop or an
+    LLM call between the stages.
+    """
+    filters = {
+        "max_distance_km": max_distance_km,
+        "min_age": min_age,
+        "max_age": max_age,
+        "occupation": occupation,
+        "min_guna": min_guna,
+    }
+    response = await run_pipeline(
+        user_profile,
+        filters,
+        top_k,
+        max_paid_calls,
+        results_top_k,
+        ranking_mode,
+        tenant,
+    )
+    logger.info(f"Matchmaking pipeline timings (ms): {response['timings']}")
+    return response
+
+
+async def main():
+    logging.info("Matchmaking pipeline agent started.")
+    try:
+        await session.process_events()
+    finally:
+        await close_geocode_client()
+        await close_prokerala_client()
+        await profile_store.close()
+        await close_scoring_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,431 @@
+import logging
+from typing import Dict, Any, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Moon nakshatras and rasis in zodiacal order. Indices into these tuples are the
+# canonical nakshatra (0-26) and rasi (0-11) ids used throughout the engine.
+NAKSHATRAS = (
+    "Ashwini",
+    "Bharani",
+    "Krittika",
+    "Rohini",
+    "Mrigashira",
+    "Ardra",
+    "Punarvasu",
+    "Pushya",
+    "Ashlesha",
+    "Magha",
+    "Purva Phalguni",
+    "Uttara Phalguni",
+    "Hasta",
+    "Chitra",
+    "Swati",
+    "Vishakha",
+    "Anuradha",
+    "Jyeshtha",
+    "Mula",
+    "Purva Ashadha",
+    "Uttara Ashadha",
+    "Shravana",
+    "Dhanishta",
+    "Shatabhisha",
+    "Purva Bhadrapada",
+    "Uttara Bhadrapada",
+    "Revati",
+)
+RASIS = (
+    "Mesha",
+    "Vrishabha",
+    "Mithuna",
+    "Karka",
+    "Simha",
+    "Kanya",
+    "Tula",
+    "Vrischika",
+    "Dhanu",
+    "Makara",
+    "Kumbha",
+    "Meena",
+)
+
+KOOTAS = ("varna", "vashya", "tara", "yoni", "graha_maitri", "gana", "bhakoot", "nadi")
+KOOTA_MAXIMUM_POINTS = {
+    "varna": 1.0,
+    "vashya": 2.0,
+    "tara": 3.0,
+    "yoni": 4.0,
+    "graha_maitri": 5.0,
+    "gana": 6.0,
+    "bhakoot": 7.0,
+    "nadi": 8.0,
+}
+MAXIMUM_POINTS = 36.0
+
+# Guna Milan threshold below which a match is traditionally not recommended
+GOOD_MATCH_MIN_POINTS = 18.0
+
+# --- Per-nakshatra attributes ---------------------------------------------
+
+# Yoni animals: horse, elephant, sheep, serpent, dog, cat, rat, cow, buffalo,
+# tiger, deer, monkey, mongoose, lion
+YONIS = (
+    "Horse",
+    "Elephant",
+    "Sheep",
+    "Serpent",
+    "Dog",
+    "Cat",
+    "Rat",
+    "Cow",
+    "Buffalo",
+    "Tiger",
+    "Deer",
+    "Monkey",
+    "Mongoose",
+    "Lion",
+)
+NAKSHATRA_YONI = np.array(
+    [
+        0,
+        1,
+        2,
+        3,
+        3,
+        4,
+        5,
+        2,
+        5,
+        6,
+        6,
+        7,
+        8,
+        9,
+        8,
+        9,
+        10,
+        10,
+        4,
+        11,
+        12,
+        11,
+        13,
+        0,
+        13,
+        7,
+        1,
+    ],
+    dtype=np.int8,
+)
+YONI_POINTS = np.array(
+    [
+        # Ho El Sh Se Do Ca Ra Co Bu Ti De Mo Mg Li
+        [4, 2, 2, 3, 2, 2, 2, 1, 0, 1, 3, 3, 2, 1],  # Horse
+        [2, 4, 3, 3, 2, 2, 2, 2, 3, 1, 2, 3, 2, 0],  # Elephant
+        [2, 3, 4, 2, 1, 2, 1, 3, 3, 1, 2, 0, 3, 1],  # Sheep
+        [3, 3, 2, 4, 2, 1, 1, 1, 1, 2, 2, 2, 0, 2],  # Serpent
+        [2, 2, 1, 2, 4, 2, 1, 2, 2, 1, 0, 2, 1, 1],  # Dog
+        [2, 2, 2, 1, 2, 4, 0, 2, 2, 1, 3, 3, 2, 1],  # Cat
+        [2, 2, 1, 1, 1, 0, 4, 2, 2, 2, 2, 2, 1, 2],  # Rat
+        [1, 2, 3, 1, 2, 2, 2, 4, 3, 0, 3, 2, 2, 1],  # Cow
+        [0, 3, 3, 1, 2, 2, 2, 3, 4, 1, 2, 2, 2, 1],  # Buffalo
+        [1, 1, 1, 2, 1, 1, 2, 0, 1, 4, 1, 1, 2, 1],  # Tiger
+        [3, 2, 2, 2, 0, 3, 2, 3, 2, 1, 4, 2, 2, 1],  # Deer
+        [3, 3, 0, 2, 2, 3, 2, 2, 2, 1, 2, 4, 3, 2],  # Monkey
+        [2, 2, 3, 0, 1, 2, 1, 2, 2, 2, 2, 3, 4, 2],  # Mongoose
+        [1, 0, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 2, 4],  # Lion
+    ],
+    dtype=np.float32,
+)
+
+GANAS = ("Deva", "Manushya", "Rakshasa")
+NAKSHATRA_GANA = np.array(
+    [0, 1, 2, 1, 0, 1, 0, 0, 2, 2, 1, 1, 0, 2, 0, 2, 0, 2, 2, 1, 1, 0, 2, 2, 1, 1, 0],
+    dtype=np.int8,
+)
+# Rows: boy's gana, columns: girl's gana
+GANA_POINTS = np.array(
+    [
+        [6, 6, 1],
+        [5, 6, 0],
+        [1, 0, 6],
+    ],
+    dtype=np.float32,
+)
+
+# Nadi follows a fixed Adi, Madhya, Antya, Antya, Madhya, Adi cycle
+NADIS = ("Adi", "Madhya", "Antya")
+NAKSHATRA_NADI = np.tile(np.array([0, 1, 2, 2, 1, 0], dtype=np.int8), 5)[:27]
+
+# --- Per-rasi attributes ----------------------------------------------------
+
+# Varna follows the element of the sign: fire, earth, air, water
+VARNAS = ("Shudra", "Vaishya", "Kshatriya", "Brahmin")
+RASI_VARNA = np.tile(np.array([2, 1, 0, 3], dtype=np.int8), 3)
+
+VASHYAS = ("Chatushpada", "Manava", "Jalachara", "Vanachara", "Keeta")
+RASI_VASHYA = np.array([0, 0, 1, 2, 3, 1, 1, 4, 1, 0, 1, 2], dtype=np.int8)
+# Rows: boy's vashya, columns: girl's vashya
+VASHYA_POINTS = np.array(
+    [
+        [2.0, 1.0, 1.0, 0.5, 1.0],
+        [0.0, 2.0, 0.5, 0.0, 1.0],
+        [1.0, 0.5, 2.0, 1.0, 1.0],
+        [0.5, 0.0, 0.0, 2.0, 0.0],
+        [1.0, 1.0, 1.0, 0.0, 2.0],
+    ],
+    dtype=np.float32,
+)
+
+PLANETS = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn")
+RASI_LORD = np.array([2, 5, 3, 1, 0, 3, 5, 2, 4, 6, 6, 4], dtype=np.int8)
+# Natural relationship of row planet towards column planet:
+# 2 = friend, 1 = neutral, 0 = enemy
+PLANET_RELATION = np.array(
+    [
+        # Su Mo Ma Me Ju Ve Sa
+        [2, 2, 2, 1, 2, 0, 0],  # Sun
+        [2, 2, 1, 2, 1, 1, 1],  # Moon
+        [2, 2, 2, 0, 2, 1, 1],  # Mars
+        [2, 0, 1, 2, 1, 2, 1],  # Mercury
+        [2, 2, 2, 0, 2, 0, 1],  # Jupiter
+        [0, 0, 1, 2, 1, 2, 2],  # Venus
+        [0, 0, 0, 2, 1, 2, 2],  # Saturn
+    ],
+    dtype=np.int8,
+)
+# Points indexed by the two one-way relations (friend/neutral/enemy)
+MAITRI_POINTS = np.array(
+    [
+        # enemy neutral friend
+        [0.0, 0.5, 1.0],  # enemy
+        [0.5, 3.0, 4.0],  # neutral
+        [1.0, 4.0, 5.0],  # friend
+    ],
+    dtype=np.float32,
+)
+
+
+def _tara_table() -> np.ndarray:
+    """Tara points: 1.5 for each direction whose count does not fall on 3, 5 or 7 (mod 9)"""
+    boy = np.arange(27)[:, None]
+    girl = np.arange(27)[None, :]
+    from_girl = ((boy - girl) % 27 + 1) % 9
+    from_boy = ((girl - boy) % 27 + 1) % 9
+    inauspicious = np.array([3, 5, 7])
+    points = np.where(np.isin(from_girl, inauspicious), 0.0, 1.5)
+    points = points + np.where(np.isin(from_boy, inauspicious), 0.0, 1.5)
+    return points.astype(np.float32)
+
+
+def _bhakoot_table() -> np.ndarray:
+    """Bhakoot points: 0 for 2/12, 5/9 and 6/8 rasi placements, 7 otherwise"""
+    boy = np.arange(12)[:, None]
+    girl = np.arange(12)[None, :]
+    distance = (girl - boy) % 12 + 1
+    dosha = np.isin(distance, [2, 12, 5, 9, 6, 8])
+    return np.where(dosha, 0.0, 7.0).astype(np.float32)
+
+
+def _graha_maitri_table() -> np.ndarray:
+    boy_lord = RASI_LORD[:, None]
+    girl_lord = RASI_LORD[None, :]
+    points = MAITRI_POINTS[
+        PLANET_RELATION[boy_lord, girl_lord], PLANET_RELATION[girl_lord, boy_lord]
+    ]
+    return np.where(boy_lord == girl_lord, 5.0, points).astype(np.float32)
+
+
+def _build_tables() -> Dict[str, np.ndarray]:
+    """Precompute 27x27 nakshatra and 12x12 rasi point tables, rows = boy, columns = girl"""
+    varna = RASI_VARNA[:, None] >= RASI_VARNA[None, :]
+    return {
+        "varna": varna.astype(np.float32),
+        "vashya": VASHYA_POINTS[RASI_VASHYA[:, None], RASI_VASHYA[None, :]],
+        "tara": _tara_table(),
+        "yoni": YONI_POINTS[NAKSHATRA_YONI[:, None], NAKSHATRA_YONI[None, :]],
+        "graha_maitri": _graha_maitri_table(),
+        "gana": GANA_POINTS[NAKSHATRA_GANA[:, None], NAKSHATRA_GANA[None, :]],
+        "bhakoot": _bhakoot_table(),
+        "nadi": np.where(
+            NAKSHATRA_NADI[:, None] == NAKSHATRA_NADI[None, :], 0.0, 8.0
+        ).astype(np.float32),
+    }
+
+
+KOOTA_TABLES = _build_tables()
+NAKSHATRA_KOOTAS = ("tara", "yoni", "gana", "nadi")
+RASI_KOOTAS = ("varna", "vashya", "graha_maitri", "bhakoot")
+
+# Summed tables so that the total is two gathers and one add per pair
+NAKSHATRA_POINTS = sum(KOOTA_TABLES[k] for k in NAKSHATRA_KOOTAS)
+RASI_POINTS = sum(KOOTA_TABLES[k] for k in RASI_KOOTAS)
+
+for _table in KOOTA_TABLES.values():
+    _table.setflags(write=False)
+NAKSHATRA_POINTS.setflags(write=False)
+RASI_POINTS.setflags(write=False)
+
+
+def rasi_from_nakshatra(nakshatra, pada) -> np.ndarray:
+    """Moon rasi (0-11) from nakshatra (0-26) and pada (1-4); each rasi spans nine padas"""
+    nakshatra = np.asarray(nakshatra, dtype=np.int16)
+    pada = np.asarray(pada, dtype=np.int16)
+    return ((nakshatra * 4 + pada - 1) // 9).astype(np.int8)
+
+
+def _pada_points_table() -> np.ndarray:
+    # Row/column i is nakshatra i // 4, pada i % 4 + 1
+    nakshatra = np.arange(108) // 4
+    rasi = rasi_from_nakshatra(nakshatra, np.arange(108) % 4 + 1).astype(np.intp)
+    return (
+        NAKSHATRA_POINTS[nakshatra[:, None], nakshatra[None, :]]
+        + RASI_POINTS[rasi[:, None], rasi[None, :]]
+    )
+
+
+# Total points of every boy x girl nakshatra-pada pair (108 x 108); the
+# guna_scores table of the profiles database holds the same values
+PADA_POINTS = _pada_points_table()
+PADA_POINTS.setflags(write=False)
+
+
+def score_kootas(
+    boy_nakshatra, boy_rasi, girl_nakshatra, girl_rasi
+) -> Dict[str, np.ndarray]:
+    """
+    Score all eight kootas for arrays of boy/girl moon positions.
+
+    Inputs broadcast against each other, so a single user can be scored against
+    a whole candidate array in one call.
+
+    Returns:
+        Dict mapping koota name to an array of points, plus 'total_points'
+    """
+    boy_nakshatra = np.asarray(boy_nakshatra, dtype=np.intp)
+    girl_nakshatra = np.asarray(girl_nakshatra, dtype=np.intp)
+    boy_rasi = np.asarray(boy_rasi, dtype=np.intp)
+    girl_rasi = np.asarray(girl_rasi, dtype=np.intp)
+
+    points = {}
+    for koota in NAKSHATRA_KOOTAS:
+        points[koota] = KOOTA_TABLES[koota][boy_nakshatra, girl_nakshatra]
+    for koota in RASI_KOOTAS:
+        points[koota] = KOOTA_TABLES[koota][boy_rasi, girl_rasi]
+    points["total_points"] = sum(points[k] for k in KOOTAS)
+    return points
+
+
+def score_total(boy_nakshatra, boy_rasi, girl_nakshatra, girl_rasi) -> np.ndarray:
+    """Total Guna Milan points only; cheaper than score_kootas when the breakdown is not needed"""
+    return (
+        NAKSHATRA_POINTS[
+            np.asarray(boy_nakshatra, dtype=np.intp),
+            np.asarray(girl_nakshatra, dtype=np.intp),
+        ]
+        + RASI_POINTS[
+            np.asarray(boy_rasi, dtype=np.intp), np.asarray(girl_rasi, dtype=np.intp)
+        ]
+    )
+
+
+def compatibility_scores(total_points) -> np.ndarray:
+    """Percentage score (0-100) in the same integer form get_kundli_match returns"""
+    return (np.asarray(total_points, dtype=np.float64) / MAXIMUM_POINTS * 100).astype(
+        np.int64
+    )
+
+
+def match_message(total_points: float, nadi: float, bhakoot: float) -> Dict[str, str]:
+    """Prokerala-style message for a single pair"""
+    if total_points >= GOOD_MATCH_MIN_POINTS:
+        message_type = "good"
+        verdict = "which is considered a good match"
+    else:
+        message_type = "bad"
+        verdict = "which is below the 18 points traditionally required"
+
+    doshas = []
+    if nadi == 0:
+        doshas.append("Nadi")
+    if bhakoot == 0:
+        doshas.append("Bhakoot")
+
+    description = f"The couple has {total_points:g} out of {MAXIMUM_POINTS:g} Guna Milan points, {verdict}."
+    if doshas:
+        description += f" {' and '.join(doshas)} dosha present."
+    return {"type": message_type, "description": description}
+
+
+def local_kundli_match(
+    boy_nakshatra, boy_rasi, girl_nakshatra, girl_rasi
+) -> List[Dict[str, Any]]:
+    """
+    Score a batch of pairs locally and return one result per pair in the
+    same shape as prokerala.get_kundli_match.
+    """
+    points = score_kootas(boy_nakshatra, boy_rasi, girl_nakshatra, girl_rasi)
+    total = np.atleast_1d(points["total_points"])
+    scores = compatibility_scores(total)
+    koota_points = {k: np.broadcast_to(points[k], total.shape) for k in KOOTAS}
+
+    results = []
+    for i in range(total.shape[0]):
+        total_points = float(total[i])
+        message = match_message(
+            total_points,
+            float(koota_points["nadi"][i]),
+            float(koota_points["bhakoot"][i]),
+        )
+        results.append(
+            {
+                "compatibility_score": int(scores[i]),
+                "total_points": total_points,
+                "maximum_points": MAXIMUM_POINTS,
+                "message": message["description"],
+                "message_type": message["type"],
+                "koot_points": {k: float(koota_points[k][i]) for k in KOOTAS},
+            }
+        )
+    return results
+
+
+NAKSHATRA_LORDS = (
+    "Ketu",
+    "Venus",
+    "Sun",
+    "Moon",
+    "Mars",
+    "Rahu",
+    "Jupiter",
+    "Saturn",
+    "Mercury",
+)
+
+
+def moon_info(nakshatra: int, pada: int, rasi: int) -> Dict[str, Any]:
+    """Describe a moon position in the layout of Prokerala's girl_info/boy_info block"""
+    nakshatra = int(nakshatra)
+    rasi = int(rasi)
+    return {
+        "nakshatra": {
+            "id": nakshatra,
+            "name": NAKSHATRAS[nakshatra],
+            "lord": {"name": NAKSHATRA_LORDS[nakshatra % 9]},
+            "pada": int(pada),
+        },
+        "rasi": {
+            "id": rasi,
+            "name": RASIS[rasi],
+            "lord": {"name": PLANETS[RASI_LORD[rasi]]},
+        },
+        "koot": {
+            "varna": VARNAS[RASI_VARNA[rasi]],
+            "vasya": VASHYAS[RASI_VASHYA[rasi]],
+            "yoni": YONIS[NAKSHATRA_YONI[nakshatra]],
+            "gana": GANAS[NAKSHATRA_GANA[nakshatra]],
+            "nadi": NADIS[NAKSHATRA_NADI[nakshatra]],
+        },
+    }
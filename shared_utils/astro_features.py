@@ -0,0 +1,190 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ashtakoot import moon_info
+from manglik import manglik_status
+from moon import julian_days, moon_positions, DEFAULT_TZ_OFFSET
+
+logger = logging.getLogger(__name__)
+
+# Bump when the engine changes results; stored features of another version are recomputed
+ASTRO_FEATURE_VERSION = 1
+
+# Profile columns holding the moon features, see migrations/profiles/0004
+FEATURE_COLUMNS = ("moon_nakshatra", "moon_pada", "moon_rasi", "nakshatra_pada")
+
+
+def nakshatra_pada_index(nakshatra, pada) -> np.ndarray:
+    """Index 0-107 of a nakshatra (0-26) and pada (1-4), the key of the guna_scores table"""
+    return (
+        np.asarray(nakshatra, dtype=np.int16) * 4 + np.asarray(pada, dtype=np.int16) - 1
+    )
+
+
+def valid_birth_data(profile: Dict[str, Any]) -> bool:
+    """Check that dob ('YYYY-MM-DD') and tob ('HH:MM', seconds ignored) are present and parseable"""
+    try:
+        datetime.strptime(profile.get("dob") or "", "%Y-%m-%d")
+        datetime.strptime((profile.get("tob") or "")[:5], "%H:%M")
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _has_coordinates(profile: Dict[str, Any]) -> bool:
+    return profile.get("lat") not in (None, "") and profile.get("lon") not in (None, "")
+
+
+def features_current(profile: Dict[str, Any]) -> bool:
+    """
+    True when the profile carries astro features of the current version.
+
+    Features computed before the profile had lat/lon lack the lagna based
+    manglik check and count as stale once coordinates are known.
+    """
+    features = profile.get("astro_features")
+    if (
+        not isinstance(features, dict)
+        or features.get("version") != ASTRO_FEATURE_VERSION
+    ):
+        return False
+    return features["manglik"]["from_lagna"] is not None or not _has_coordinates(
+        profile
+    )
+
+
+def compute_astro_features(
+    profiles: List[Dict[str, Any]],
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Moon nakshatra/pada/rasi, koot attributes and manglik status per profile.
+
+    Profiles are computed together in one vectorized pass. Each result is
+    stamped with ASTRO_FEATURE_VERSION; profiles with missing or invalid
+    birth data give None.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(profiles)
+    rows = [i for i, p in enumerate(profiles) if valid_birth_data(p)]
+    if not rows:
+        return results
+
+    dob = [profiles[i]["dob"] for i in rows]
+    tob = [profiles[i]["tob"][:5] for i in rows]
+    tz_offset = [profiles[i].get("tz_offset", DEFAULT_TZ_OFFSET) for i in rows]
+    positions = moon_positions(dob, tob, tz_offset)
+    located = np.array([_has_coordinates(profiles[i]) for i in rows], dtype=bool)
+    lat = np.array(
+        [float(profiles[i]["lat"]) if located[j] else 0.0 for j, i in enumerate(rows)]
+    )
+    lon = np.array(
+        [float(profiles[i]["lon"]) if located[j] else 0.0 for j, i in enumerate(rows)]
+    )
+    manglik = manglik_status(
+        julian_days(dob, tob, tz_offset), positions["rasi"], lat, lon
+    )
+
+    for j, i in enumerate(rows):
+        nakshatra, pada, rasi = (
+            int(positions["nakshatra"][j]),
+            int(positions["pada"][j]),
+            int(positions["rasi"][j]),
+        )
+        from_moon = bool(manglik["from_moon"][j])
+        from_lagna = bool(manglik["from_lagna"][j]) if located[j] else None
+        results[i] = {
+            "version": ASTRO_FEATURE_VERSION,
+            **moon_info(nakshatra, pada, rasi),
+            "nakshatra_pada": int(nakshatra_pada_index(nakshatra, pada)),
+            "manglik": {
+                "status": from_moon or bool(from_lagna),
+                "from_moon": from_moon,
+                "from_lagna": from_lagna,
+                "mars_rasi": int(manglik["mars_rasi"][j]),
+            },
+        }
+    return results
+
+
+def ensure_astro_features(
+    profiles: List[Dict[str, Any]],
+) -> List[Optional[Dict[str, Any]]]:
+    """Current astro features per profile, reusing attached ones and computing only the stale"""
+    results = [
+        p.get("astro_features") if features_current(p) else None for p in profiles
+    ]
+    stale = [i for i, features in enumerate(results) if features is None]
+    if stale:
+        for i, features in zip(
+            stale, compute_astro_features([profiles[i] for i in stale])
+        ):
+            results[i] = features
+    return results
+
+
+def moon_features(profiles: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Moon nakshatra, pada, rasi and nakshatra-pada index of each profile.
+
+    Attached astro features of the current version are reused; the rest are
+    computed in one vectorized pass. Profiles with missing or invalid birth
+    data get -1 in every array and False in 'valid'.
+    """
+    features = {
+        name: np.full(len(profiles), -1, dtype=np.int16)
+        for name in ("nakshatra", "pada", "rasi")
+    }
+    valid = np.zeros(len(profiles), dtype=bool)
+    compute = []
+    for i, profile in enumerate(profiles):
+        if features_current(profile):
+            stored = profile["astro_features"]
+            features["nakshatra"][i] = stored["nakshatra"]["id"]
+            features["pada"][i] = stored["nakshatra"]["pada"]
+            features["rasi"][i] = stored["rasi"]["id"]
+            valid[i] = True
+        elif valid_birth_data(profile):
+            compute.append(i)
+    if compute:
+        positions = moon_positions(
+            [profiles[i]["dob"] for i in compute],
+            [profiles[i]["tob"][:5] for i in compute],
+            [profiles[i].get("tz_offset", DEFAULT_TZ_OFFSET) for i in compute],
+        )
+        for name in features:
+            features[name][compute] = positions[name]
+        valid[compute] = True
+    features["nakshatra_pada"] = np.where(
+        valid, nakshatra_pada_index(features["nakshatra"], features["pada"]), -1
+    )
+    features["valid"] = valid
+    return features
+
+
+def profile_feature_columns(
+    profiles: List[Dict[str, Any]],
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Values of the profile table's astro columns per profile, or None where
+    the birth data is invalid: FEATURE_COLUMNS plus manglik,
+    astro_features_version and the full astro_features document.
+    """
+    columns = []
+    for features in ensure_astro_features(profiles):
+        if features is None:
+            columns.append(None)
+            continue
+        columns.append(
+            {
+                "moon_nakshatra": features["nakshatra"]["id"],
+                "moon_pada": features["nakshatra"]["pada"],
+                "moon_rasi": features["rasi"]["id"],
+                "nakshatra_pada": features["nakshatra_pada"],
+                "manglik": features["manglik"]["status"],
+                "astro_features_version": features["version"],
+                "astro_features": features,
+            }
+        )
+    return columns
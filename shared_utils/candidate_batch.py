@@ -0,0 +1,170 @@
+import base64
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BATCH_FORMAT = "columnar"
+BATCH_VERSION = 1
+
+# Dicts under these top-level keys are split into "parent.child" columns by default
+NESTED_KEYS = ("match", "compatibility")
+SEPARATOR = "."
+
+
+def is_batch(value: Any) -> bool:
+    return isinstance(value, dict) and value.get("format") == BATCH_FORMAT
+
+
+def _flatten(record: Dict[str, Any], nested: Iterable[str]) -> Dict[str, Any]:
+    flat = {}
+    for key, value in record.items():
+        if key in nested and isinstance(value, dict):
+            for child, child_value in value.items():
+                flat[f"{key}{SEPARATOR}{child}"] = child_value
+        else:
+            flat[key] = value
+    return flat
+
+
+def _column_type(values: List[Any]) -> str:
+    """'bool', 'int64', 'float64' or 'json' for the non-null values of a column"""
+    present = [v for v in values if v is not None]
+    if not present:
+        return "json"
+    if all(isinstance(v, bool) for v in present):
+        return "bool" if len(present) == len(values) else "json"
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in present):
+        # NaN would turn missing ints into floats; keep such columns as JSON
+        return "int64" if len(present) == len(values) else "json"
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        return "float64"
+    return "json"
+
+
+def _encode(array: np.ndarray) -> str:
+    return base64.b64encode(
+        np.ascontiguousarray(array).astype(array.dtype.newbyteorder("<")).tobytes()
+    ).decode("ascii")
+
+
+def to_batch(
+    records: Iterable[Dict[str, Any]],
+    columns: Optional[Iterable[str]] = None,
+    binary: bool = True,
+    nested: Iterable[str] = NESTED_KEYS,
+) -> Dict[str, Any]:
+    """
+    Convert a list of dicts to a columnar batch.
+
+    The batch is a JSON-serializable dict with a schema header and one entry
+    per column. With `binary`, numeric and boolean columns are packed as
+    base64 little-endian NumPy buffers (missing floats as NaN); other columns
+    are plain JSON lists. Dicts under the `nested` keys, like the 'match' and
+    'compatibility' of a kundli result, are split into "match.name" style
+    columns; other dicts stay whole in a JSON column. `columns` restricts the
+    batch to the given (flattened) names.
+    """
+    nested = tuple(nested)
+    flat = [_flatten(record, nested) for record in records]
+    names: List[str] = list(columns) if columns is not None else []
+    if columns is None:
+        seen = set()
+        for record in flat:
+            for name in record:
+                if name not in seen:
+                    seen.add(name)
+                    names.append(name)
+
+    schema = []
+    data: Dict[str, Any] = {}
+    for name in names:
+        values = [record.get(name) for record in flat]
+        column_type = _column_type(values) if binary else "json"
+        if column_type == "json":
+            data[name] = values
+            schema.append({"name": name, "type": "json"})
+        else:
+            array = np.array(
+                [np.nan if v is None else v for v in values], dtype=column_type
+            )
+            data[name] = _encode(array)
+            schema.append({"name": name, "type": column_type, "encoding": "base64"})
+
+    return {
+        "format": BATCH_FORMAT,
+        "version": BATCH_VERSION,
+        "count": len(flat),
+        "nested": list(nested),
+        "schema": schema,
+        "columns": data,
+    }
+
+
+def batch_column(batch: Dict[str, Any], name: str) -> Union[np.ndarray, List[Any]]:
+    """One column of a batch: a NumPy array for packed columns, else a list"""
+    field = next((f for f in batch["schema"] if f["name"] == name), None)
+    if field is None:
+        raise KeyError(name)
+    value = batch["columns"][name]
+    if field.get("encoding") == "base64":
+        return np.frombuffer(
+            base64.b64decode(value), dtype=np.dtype(field["type"]).newbyteorder("<")
+        )
+    return value
+
+
+def _to_python(value: Any, column_type: str) -> Any:
+    if column_type == "float64":
+        return None if np.isnan(value) else float(value)
+    if column_type == "int64":
+        return int(value)
+    if column_type == "bool":
+        return bool(value)
+    return value
+
+
+def from_batch(
+    batch: Dict[str, Any], rows: Optional[Iterable[int]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Convert a columnar batch back to a list of dicts, or only the given rows.
+
+    Flattened columns are nested again. Keys whose value was missing come
+    back as None.
+    """
+    rows = list(range(batch["count"])) if rows is None else list(rows)
+    nested = set(batch.get("nested", ()))
+    columns = []
+    for field in batch["schema"]:
+        values = batch_column(batch, field["name"])
+        if field.get("encoding") == "base64":
+            values = [_to_python(values[i], field["type"]) for i in rows]
+        else:
+            values = [values[i] for i in rows]
+        path = field["name"].split(SEPARATOR, 1)
+        columns.append((path if path[0] in nested else [field["name"]], values))
+
+    records = []
+    for i in range(len(rows)):
+        record: Dict[str, Any] = {}
+        for path, values in columns:
+            if len(path) == 2:
+                record.setdefault(path[0], {})[path[1]] = values[i]
+            else:
+                record[path[0]] = values[i]
+        records.append(record)
+    return records
+
+
+def as_records(
+    value: Union[List[Dict[str, Any]], Dict[str, Any], None],
+) -> List[Dict[str, Any]]:
+    """Accept either a columnar batch or a list of dicts and return a list of dicts"""
+    if value is None:
+        return []
+    if is_batch(value):
+        return from_batch(value)
+    return list(value)
@@ -0,0 +1,106 @@
+import os
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from profile_store import profile_store
+from astro_features import profile_feature_columns
+
+logger = logging.getLogger(__name__)
+
+PROFILE_CHUNK_SIZE = int(os.getenv("PROFILE_CHUNK_SIZE", "1000"))
+# Most candidates filter_profile_agent returns per call; 0 returns all
+CANDIDATE_PAGE_LIMIT = int(os.getenv("CANDIDATE_PAGE_LIMIT", "1000"))
+
+
+def candidate_filters(
+    user_profile: Dict[str, Any],
+    max_distance_km: Optional[float] = None,
+    min_age: Optional[int] = None,
+    max_age: Optional[int] = None,
+    occupation: Optional[str] = None,
+    min_guna: Optional[float] = None,
+) -> Union[Tuple[str, Dict[str, Any]], Dict[str, str]]:
+    """The opposite gender and the profile store filters for a user, or {'error': ...}"""
+    user_gender = user_profile.get("gender")
+
+    if user_gender not in ("male", "female"):
+        logger.error(f"Invalid gender: {user_gender}")
+        return {"error": "User gender must be 'male' or 'female'"}
+
+    opposite_gender = "female" if user_gender == "male" else "male"
+
+    filters = {
+        "max_distance_km": max_distance_km,
+        "min_age": min_age,
+        "max_age": max_age,
+        "occupation": occupation,
+    }
+    if max_distance_km is not None:
+        if user_profile.get("lat") is None or user_profile.get("lon") is None:
+            return {"error": "max_distance_km needs the user's lat and lon"}
+        filters["lat"] = user_profile["lat"]
+        filters["lon"] = user_profile["lon"]
+    if min_guna is not None:
+        features = profile_feature_columns([user_profile])[0]
+        if features is None:
+            return {
+                "error": "min_guna needs the user's dob (YYYY-MM-DD) and tob (HH:MM)"
+            }
+        filters["min_guna"] = min_guna
+        filters["nakshatra_pada"] = features["nakshatra_pada"]
+    return opposite_gender, filters
+
+
+async def stream_profiles(
+    opposite_gender: str,
+    filters: Optional[Dict] = None,
+    after_id: Optional[Any] = None,
+    chunk_size: Optional[int] = None,
+) -> AsyncIterator[List[Dict]]:
+    """Yield candidate profiles in fixed-size chunks, paging through the store with a keyset cursor"""
+    async for chunk in profile_store.iter_candidates(
+        opposite_gender,
+        chunk_size=chunk_size or PROFILE_CHUNK_SIZE,
+        filters=filters,
+        after_id=after_id,
+    ):
+        yield chunk
+
+
+async def get_profiles(
+    opposite_gender: str,
+    filters: Optional[Dict] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[Any] = None,
+) -> Union[List[Dict], Dict[str, str]]:
+    """
+    Candidate profiles in id order, or {'error': ...} when the store fails.
+
+    At most `limit` profiles are returned (None or 0 for all); pass the last
+    one's 'id' as `after_id` to fetch the next page. Without a limit every
+    candidate is held in memory, so large scans should use stream_profiles.
+    """
+    logger.info(f"Fetching profiles for gender: {opposite_gender}, filters: {filters}")
+
+    if not profile_store.configured:
+        logger.error("Profile store not available")
+        return {"error": "Profile store not available"}
+
+    limit = limit or None
+    chunk_size = PROFILE_CHUNK_SIZE if limit is None else min(PROFILE_CHUNK_SIZE, limit)
+    profiles: List[Dict] = []
+    try:
+        async for chunk in stream_profiles(
+            opposite_gender, filters, after_id, chunk_size
+        ):
+            if limit is not None:
+                chunk = chunk[: limit - len(profiles)]
+            profiles.extend(chunk)
+            if limit is not None and len(profiles) >= limit:
+                break
+    except Exception as e:
+        # Partial results would look like a complete candidate list
+        logger.error(f"Error fetching profiles from profile store: {e}")
+        return {"error": "Failed to fetch candidate profiles"}
+    logger.info(f"Fetched {len(profiles)} profiles for gender: '{opposite_gender}'")
+    return profiles
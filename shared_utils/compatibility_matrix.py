@@ -0,0 +1,486 @@
+import os
+import sys
+import json
+import fcntl
+import asyncio
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ashtakoot import NAKSHATRA_POINTS, RASI_POINTS
+from astro_features import ASTRO_FEATURE_VERSION, moon_features
+from scoring_pool import SCORING_WORKERS, shards
+
+logger = logging.getLogger(__name__)
+
+# Directory of the precomputed male x female score matrix; empty disables it
+COMPATIBILITY_MATRIX_DIR = os.getenv("COMPATIBILITY_MATRIX_DIR", "")
+# Cells scored per vectorized pass
+MATRIX_CHUNK_CELLS = int(os.getenv("MATRIX_CHUNK_CELLS", str(4 * 1024 * 1024)))
+
+# Rows are male profiles (scored as the boy), columns female profiles
+ROW_GENDER = "male"
+COLUMN_GENDER = "female"
+
+# Points are stored doubled, so the half points of Ashtakoot fit in a uint8
+UNKNOWN_POINTS = 255
+HALF_NAKSHATRA_POINTS = np.rint(NAKSHATRA_POINTS * 2).astype(np.uint8)
+HALF_RASI_POINTS = np.rint(RASI_POINTS * 2).astype(np.uint8)
+
+PROFILE_DTYPE = np.dtype(
+    [
+        ("id", "<i8"),
+        ("nakshatra", "i1"),
+        ("pada", "i1"),
+        ("rasi", "i1"),
+    ]
+)
+
+META_FILE = "meta.json"
+ROWS_FILE = "rows.npy"
+COLUMNS_FILE = "columns.npy"
+POINTS_FILE = "points.u8"
+LOCK_FILE = ".lock"
+
+MISSING_ID = -1
+
+
+def birth_features(profiles: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Moon nakshatra, pada and rasi of each profile as a PROFILE_DTYPE array.
+
+    Profiles need 'id', 'dob' and 'tob'; missing or invalid birth data gives -1
+    features, which score as unknown. Profiles without an integer 'id', such
+    as UUID ids of a legacy table, are left out.
+    """
+    keyed = [p for p in profiles if isinstance(p.get("id"), int)]
+    if len(keyed) < len(profiles):
+        logger.warning(
+            f"Skipping {len(profiles) - len(keyed)} profiles without an integer id"
+        )
+        profiles = keyed
+    features = np.zeros(len(profiles), dtype=PROFILE_DTYPE)
+    features["id"] = [int(p["id"]) for p in profiles]
+    moon = moon_features(profiles)
+    for field in ("nakshatra", "pada", "rasi"):
+        features[field] = moon[field]
+    return features
+
+
+def score_block(rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    """Doubled total points of every row x column pair as a uint8 block"""
+    row_nakshatra = rows["nakshatra"].astype(np.intp)[:, None]
+    row_rasi = rows["rasi"].astype(np.intp)[:, None]
+    column_nakshatra = columns["nakshatra"].astype(np.intp)[None, :]
+    column_rasi = columns["rasi"].astype(np.intp)[None, :]
+    block = (
+        HALF_NAKSHATRA_POINTS[row_nakshatra, column_nakshatra]
+        + HALF_RASI_POINTS[row_rasi, column_rasi]
+    )
+    block[(row_nakshatra < 0) | (column_nakshatra < 0)] = UNKNOWN_POINTS
+    return block
+
+
+# Worker-resident state of a sharded build: the points file and the column features
+_fill_state: Dict[str, Any] = {}
+
+
+def _init_fill_worker(path: str, shape: tuple, columns: np.ndarray, chunk_cells: int):
+    _fill_state.update(
+        points=np.memmap(path, dtype=np.uint8, mode="r+", shape=shape),
+        columns=columns,
+        chunk_cells=chunk_cells,
+    )
+
+
+def _fill_rows(row_start: int, rows: np.ndarray) -> int:
+    """Score rows against every column straight into the points file; runs in a build worker"""
+    points, columns = _fill_state["points"], _fill_state["columns"]
+    step = max(1, _fill_state["chunk_cells"] // max(1, len(columns)))
+    for start in range(0, len(rows), step):
+        stop = min(start + step, len(rows))
+        points[row_start + start : row_start + stop, : len(columns)] = score_block(
+            rows[start:stop], columns
+        )
+    points.flush()
+    return len(rows)
+
+
+def _save_atomic(path: str, array: np.ndarray):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+class CompatibilityMatrix:
+    """
+    Guna Milan points of every male x female profile pair, stored on disk.
+
+    The matrix is a raw uint8 file of doubled points, memory-mapped so readers
+    share pages and only touch the rows they read. It is allocated with spare
+    capacity in both dimensions, so a new profile is added by scoring just its
+    row or column in place. Profile ids and moon features of the rows and
+    columns are kept alongside in .npy files. Writers serialize on a lock
+    file; readers map the points read-only and reload when meta.json
+    changes. A matrix built with another ASTRO_FEATURE_VERSION is ignored
+    until it is rebuilt.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.meta: Dict[str, Any] = {}
+        self.rows = np.zeros(0, dtype=PROFILE_DTYPE)
+        self.columns = np.zeros(0, dtype=PROFILE_DTYPE)
+        self.points: Optional[np.memmap] = None
+        self._row_index: Dict[int, int] = {}
+        self._column_index: Dict[int, int] = {}
+        self._id_orders: Dict[str, np.ndarray] = {}
+        self._loaded_mtime = None
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _lock(self):
+        os.makedirs(self.path, exist_ok=True)
+        lock = open(self._file(LOCK_FILE), "w")
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    def exists(self) -> bool:
+        return os.path.exists(self._file(META_FILE))
+
+    def _open_points(self, mode: str) -> np.memmap:
+        return np.memmap(
+            self._file(POINTS_FILE),
+            dtype=np.uint8,
+            mode=mode,
+            shape=(self.meta["row_capacity"], self.meta["column_capacity"]),
+        )
+
+    def _index(self):
+        self._row_index = {int(i): n for n, i in enumerate(self.rows["id"])}
+        self._column_index = {int(i): n for n, i in enumerate(self.columns["id"])}
+        self._id_orders = {}
+
+    def refresh(self):
+        """(Re)open the files if another process has changed them"""
+        try:
+            mtime = os.stat(self._file(META_FILE)).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._loaded_mtime:
+            return
+        with open(self._file(META_FILE)) as f:
+            meta = json.load(f)
+        self._loaded_mtime = mtime
+        if meta.get("astro_feature_version") != ASTRO_FEATURE_VERSION:
+            logger.warning(
+                f"Ignoring compatibility matrix in {self.path} built with astro feature "
+                f"version {meta.get('astro_feature_version')}; rebuild it"
+            )
+            self.meta, self.points = {}, None
+            self.rows = self.columns = np.zeros(0, dtype=PROFILE_DTYPE)
+            self._index()
+            return
+        self.meta = meta
+        self.rows = np.load(self._file(ROWS_FILE))
+        self.columns = np.load(self._file(COLUMNS_FILE))
+        self.points = self._open_points("r")
+        self._index()
+
+    def _write_meta(self):
+        self.meta["rows"] = len(self.rows)
+        self.meta["columns"] = len(self.columns)
+        self.meta["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        tmp = self._file(META_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.meta, f)
+        os.replace(tmp, self._file(META_FILE))
+        self._loaded_mtime = os.stat(self._file(META_FILE)).st_mtime_ns
+
+    def _allocate(self, row_capacity: int, column_capacity: int):
+        """Replace the points file with a larger one, copying the scored cells"""
+        tmp = self._file(POINTS_FILE + ".tmp")
+        points = np.memmap(
+            tmp, dtype=np.uint8, mode="w+", shape=(row_capacity, column_capacity)
+        )
+        if self.points is not None:
+            points[: len(self.rows), : len(self.columns)] = self.points[
+                : len(self.rows), : len(self.columns)
+            ]
+        points.flush()
+        os.replace(tmp, self._file(POINTS_FILE))
+        self.points = points
+        self.meta["row_capacity"] = row_capacity
+        self.meta["column_capacity"] = column_capacity
+
+    def _fill(self, row_start: int, row_stop: int, column_start: int, column_stop: int):
+        """Score a rectangle of the matrix in blocks of about MATRIX_CHUNK_CELLS cells"""
+        width = max(1, column_stop - column_start)
+        step = max(1, MATRIX_CHUNK_CELLS // width)
+        columns = self.columns[column_start:column_stop]
+        for start in range(row_start, row_stop, step):
+            stop = min(start + step, row_stop)
+            self.points[start:stop, column_start:column_stop] = score_block(
+                self.rows[start:stop], columns
+            )
+
+    def _fill_sharded(self, workers: int) -> bool:
+        """
+        Score all rows in `workers` processes, each writing its row shards into
+        the points file. The column features are sent to each worker once.
+        Returns False when the rows make a single shard.
+        """
+        block_rows = max(1, MATRIX_CHUNK_CELLS // max(1, len(self.columns)))
+        parts = shards(
+            len(self.rows), workers, min_size=block_rows, max_size=len(self.rows)
+        )
+        if len(parts) < 2:
+            return False
+        initargs = (
+            self._file(POINTS_FILE),
+            self.points.shape,
+            self.columns,
+            MATRIX_CHUNK_CELLS,
+        )
+        with ProcessPoolExecutor(
+            workers, initializer=_init_fill_worker, initargs=initargs
+        ) as pool:
+            scored = sum(
+                pool.map(
+                    _fill_rows,
+                    [part.start for part in parts],
+                    [self.rows[part] for part in parts],
+                )
+            )
+        logger.info(f"Scored {scored} rows in {len(parts)} shards on {workers} workers")
+        return True
+
+    def build(
+        self,
+        rows: np.ndarray,
+        columns: np.ndarray,
+        headroom: float = 0.25,
+        workers: int = SCORING_WORKERS,
+    ):
+        """
+        Score every pair of the given row and column profiles from scratch,
+        sharded by rows over `workers` processes when above 0
+        """
+        with self._lock():
+            self.rows = rows
+            self.columns = columns
+            self.points = None
+            self.meta = {"astro_feature_version": ASTRO_FEATURE_VERSION}
+            self._allocate(
+                max(1, int(len(rows) * (1 + headroom))),
+                max(1, int(len(columns) * (1 + headroom))),
+            )
+            if workers <= 0 or not self._fill_sharded(workers):
+                self._fill(0, len(rows), 0, len(columns))
+            self.points.flush()
+            _save_atomic(self._file(ROWS_FILE), self.rows)
+            _save_atomic(self._file(COLUMNS_FILE), self.columns)
+            self._index()
+            self._write_meta()
+            self.points = self._open_points("r")
+        logger.info(
+            f"Built compatibility matrix of {len(rows)} x {len(columns)} profiles in {self.path}"
+        )
+
+    def add_profile(self, profile: Dict[str, Any]) -> bool:
+        """
+        Add or rescore one profile's row (male) or column (female).
+
+        Returns False when the gender has no side in the matrix, the id is
+        not an integer or the matrix has not been built yet.
+        """
+        gender = profile.get("gender")
+        if gender not in (ROW_GENDER, COLUMN_GENDER):
+            return False
+        features = birth_features([profile])
+        if not len(features):
+            return False
+        with self._lock():
+            self.refresh()
+            if not self.meta:
+                return False
+            self.points = self._open_points("r+")
+            profile_id = int(features["id"][0])
+            if gender == ROW_GENDER:
+                n = self._row_index.get(profile_id, len(self.rows))
+                if n == len(self.rows):
+                    if n >= self.meta["row_capacity"]:
+                        self._allocate(n * 2, self.meta["column_capacity"])
+                    self.rows = np.concatenate([self.rows, features])
+                    self._row_index[profile_id] = n
+                else:
+                    self.rows[n] = features[0]
+                self._fill(n, n + 1, 0, len(self.columns))
+                _save_atomic(self._file(ROWS_FILE), self.rows)
+            else:
+                n = self._column_index.get(profile_id, len(self.columns))
+                if n == len(self.columns):
+                    if n >= self.meta["column_capacity"]:
+                        self._allocate(self.meta["row_capacity"], n * 2)
+                    self.columns = np.concatenate([self.columns, features])
+                    self._column_index[profile_id] = n
+                else:
+                    self.columns[n] = features[0]
+                self._fill(0, len(self.rows), n, n + 1)
+                _save_atomic(self._file(COLUMNS_FILE), self.columns)
+            self.points.flush()
+            self._id_orders = {}
+            self._write_meta()
+            self.points = self._open_points("r")
+        return True
+
+    def features(self, profile_id: Any, gender: str) -> Optional[np.void]:
+        """Stored moon features of a profile, or None if it is not in the matrix"""
+        self.refresh()
+        if gender == ROW_GENDER and int(profile_id) in self._row_index:
+            return self.rows[self._row_index[int(profile_id)]]
+        if gender == COLUMN_GENDER and int(profile_id) in self._column_index:
+            return self.columns[self._column_index[int(profile_id)]]
+        return None
+
+    def lookup(self, profile_ids: Iterable[Any], gender: str) -> np.ndarray:
+        """
+        Stored moon features of the given ids of one gender, in the same order.
+
+        Missing ids get id MISSING_ID. Refreshes once per call, so callers look
+        up a whole candidate batch at a time.
+        """
+        self.refresh()
+        ids = np.fromiter((int(i) for i in profile_ids), dtype=np.int64)
+        result = np.zeros(len(ids), dtype=PROFILE_DTYPE)
+        result["id"] = MISSING_ID
+        stored = {ROW_GENDER: self.rows, COLUMN_GENDER: self.columns}.get(gender)
+        if stored is None or not len(stored) or not len(ids):
+            return result
+        if gender not in self._id_orders:
+            self._id_orders[gender] = np.argsort(stored["id"], kind="stable")
+        order = self._id_orders[gender]
+        sorted_ids = stored["id"][order]
+        positions = np.clip(np.searchsorted(sorted_ids, ids), 0, len(sorted_ids) - 1)
+        found = sorted_ids[positions] == ids
+        result[found] = stored[order[positions[found]]]
+        return result
+
+    def scores(
+        self, profile_id: Any, gender: str, candidate_ids: Iterable[Any]
+    ) -> np.ndarray:
+        """
+        Total points between a profile and each candidate of the opposite gender.
+
+        NaN where either profile is missing from the matrix or lacks valid
+        birth data.
+        """
+        self.refresh()
+        candidate_ids = [int(c) for c in candidate_ids]
+        result = np.full(len(candidate_ids), np.nan)
+        if gender == ROW_GENDER:
+            own, other = self._row_index, self._column_index
+        else:
+            own, other = self._column_index, self._row_index
+        n = own.get(int(profile_id))
+        if n is None or self.points is None:
+            return result
+        found = [i for i, c in enumerate(candidate_ids) if c in other]
+        indexes = [other[candidate_ids[i]] for i in found]
+        raw = (
+            self.points[n, indexes] if gender == ROW_GENDER else self.points[indexes, n]
+        )
+        values = raw.astype(np.float64) / 2
+        values[raw == UNKNOWN_POINTS] = np.nan
+        result[found] = values
+        return result
+
+    def row(self, profile_id: Any, gender: str) -> Dict[str, np.ndarray]:
+        """All opposite-gender profile ids and their points for one profile, e.g. for match emails"""
+        self.refresh()
+        if gender == ROW_GENDER:
+            n, ids = self._row_index.get(int(profile_id)), self.columns["id"]
+        else:
+            n, ids = self._column_index.get(int(profile_id)), self.rows["id"]
+        if n is None or self.points is None:
+            return {"ids": np.zeros(0, dtype=np.int64), "points": np.zeros(0)}
+        raw = (
+            self.points[n, : len(ids)]
+            if gender == ROW_GENDER
+            else self.points[: len(ids), n]
+        )
+        points = raw.astype(np.float64) / 2
+        points[raw == UNKNOWN_POINTS] = np.nan
+        return {"ids": ids.copy(), "points": points}
+
+
+_matrix: Optional[CompatibilityMatrix] = None
+
+
+def get_compatibility_matrix() -> Optional[CompatibilityMatrix]:
+    """Shared matrix for this process, or None when COMPATIBILITY_MATRIX_DIR is not set"""
+    global _matrix
+    # Read at call time so agents may load .env after importing this module
+    path = os.getenv("COMPATIBILITY_MATRIX_DIR", COMPATIBILITY_MATRIX_DIR)
+    if _matrix is None and path:
+        _matrix = CompatibilityMatrix(path)
+    return _matrix
+
+
+async def load_features(store, gender: str) -> np.ndarray:
+    """Moon features of every profile of a gender, streamed from the profile store"""
+    chunks = [np.zeros(0, dtype=PROFILE_DTYPE)]
+    async for page in store.iter_candidates(gender, columns=("id", "dob", "tob")):
+        chunks.append(birth_features(page))
+    return np.concatenate(chunks)
+
+
+async def build_from_store(path: str, workers: int = SCORING_WORKERS):
+    """Batch job: score all male x female pairs in the profile store"""
+    from profile_store import profile_store
+
+    try:
+        rows = await load_features(profile_store, ROW_GENDER)
+        columns = await load_features(profile_store, COLUMN_GENDER)
+    finally:
+        await profile_store.close()
+    started = datetime.now()
+    await asyncio.to_thread(
+        CompatibilityMatrix(path).build, rows, columns, workers=workers
+    )
+    logger.info(
+        f"Scored {len(rows) * len(columns)} pairs in {(datetime.now() - started).total_seconds():.1f}s"
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Precompute Guna Milan points for every male x female profile pair"
+    )
+    parser.add_argument(
+        "matrix_dir",
+        nargs="?",
+        default=COMPATIBILITY_MATRIX_DIR,
+        help="Output directory (default: COMPATIBILITY_MATRIX_DIR)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SCORING_WORKERS,
+        help="Processes scoring row shards (default: SCORING_WORKERS; 0 scores in this process)",
+    )
+    args = parser.parse_args(argv)
+    if not args.matrix_dir:
+        parser.error("matrix_dir or COMPATIBILITY_MATRIX_DIR is required")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(build_from_store(args.matrix_dir, args.workers))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
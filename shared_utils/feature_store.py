@@ -0,0 +1,390 @@
+import os
+import sys
+import json
+import math
+import uuid
+import fcntl
+import asyncio
+import logging
+import argparse
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from astro_features import ASTRO_FEATURE_VERSION, moon_features
+
+logger = logging.getLogger(__name__)
+
+# Directory of the memory-mapped astro feature file; empty disables it
+FEATURE_STORE_DIR = os.getenv("FEATURE_STORE_DIR", "")
+
+GENDERS = ("male", "female")
+UNKNOWN = -1
+# Side of the lat/lon grid cells the records are partitioned by
+REGION_DEGREES = 10
+REGION_COLUMNS = 360 // REGION_DEGREES
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# Fixed-width record per profile; -1 for unknown gender, moon position and
+# region, NaN for unknown lat/lon and 0 for an unknown dob
+FEATURE_DTYPE = np.dtype(
+    [
+        ("id", "<i8"),
+        ("gender", "i1"),
+        ("nakshatra", "i1"),
+        ("pada", "i1"),
+        ("rasi", "i1"),
+        ("lat", "<f4"),
+        ("lon", "<f4"),
+        ("dob_ordinal", "<i4"),
+    ]
+)
+# Records of one gender and region are the slice [start, stop)
+PARTITION_DTYPE = np.dtype(
+    [
+        ("gender", "i1"),
+        ("region", "<i2"),
+        ("start", "<i8"),
+        ("stop", "<i8"),
+    ]
+)
+
+META_FILE = "meta.json"
+LOCK_FILE = ".lock"
+
+
+def region_of(lat, lon) -> np.ndarray:
+    """Grid cell index of each lat/lon, -1 where either is unknown"""
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    known = ~(np.isnan(lat) | np.isnan(lon))
+    row = np.clip(
+        np.floor((np.nan_to_num(lat) + 90) / REGION_DEGREES),
+        0,
+        180 // REGION_DEGREES - 1,
+    )
+    column = np.floor((np.nan_to_num(lon) + 180) / REGION_DEGREES) % REGION_COLUMNS
+    return np.where(known, row * REGION_COLUMNS + column, UNKNOWN).astype(np.int16)
+
+
+def regions_within(lat: float, lon: float, radius_km: float) -> Optional[np.ndarray]:
+    """Regions overlapping the bounding box of a circle, or None when it spans every longitude"""
+    dlat = radius_km / KM_PER_DEGREE
+    lat_min, lat_max = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+    widest = max(abs(lat_min), abs(lat_max))
+    if widest >= 89.9 or dlat / math.cos(math.radians(widest)) >= 180:
+        return None
+    dlon = dlat / math.cos(math.radians(widest))
+    rows = np.arange(
+        int(region_of(lat_min, 0) // REGION_COLUMNS),
+        int(region_of(lat_max, 0) // REGION_COLUMNS) + 1,
+    )
+    start = math.floor((lon - dlon + 180) / REGION_DEGREES)
+    stop = math.floor((lon + dlon + 180) / REGION_DEGREES)
+    columns = np.unique(np.arange(start, stop + 1) % REGION_COLUMNS)
+    return (rows[:, None] * REGION_COLUMNS + columns[None, :]).ravel()
+
+
+def _dob_ordinal(value: Any) -> int:
+    try:
+        return date.fromisoformat(str(value)[:10]).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def profile_features(profiles: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    FEATURE_DTYPE records of profiles with an integer 'id'; others, such as
+    UUID ids of a legacy table, are left out.
+
+    Reuses attached astro_features of the current version and computes the
+    rest, as astro_features.moon_features does.
+    """
+    keyed = [p for p in profiles if isinstance(p.get("id"), int)]
+    if len(keyed) < len(profiles):
+        logger.warning(
+            f"Skipping {len(profiles) - len(keyed)} profiles without an integer id"
+        )
+        profiles = keyed
+    records = np.zeros(len(profiles), dtype=FEATURE_DTYPE)
+    if not profiles:
+        return records
+    moon = moon_features(profiles)
+    records["id"] = [p["id"] for p in profiles]
+    records["gender"] = [
+        GENDERS.index(p.get("gender")) if p.get("gender") in GENDERS else UNKNOWN
+        for p in profiles
+    ]
+    for field in ("nakshatra", "pada", "rasi"):
+        records[field] = moon[field]
+    records["lat"] = [_float(p.get("lat")) for p in profiles]
+    records["lon"] = [_float(p.get("lon")) for p in profiles]
+    records["dob_ordinal"] = [_dob_ordinal(p.get("dob")) for p in profiles]
+    return records
+
+
+def _save(path: str, array: np.ndarray):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class FeatureStore:
+    """
+    Astro features of every profile in one memory-mapped file.
+
+    Records are sorted by gender, region and id, so each gender/region
+    partition is a contiguous slice, listed in a small partition index. Both
+    arrays are .npy files opened with np.memmap: processes on the host share
+    the pages, opening costs nothing and only touched partitions are read.
+
+    A build writes a new generation of files and then replaces meta.json,
+    which names the current generation, so readers switch over atomically on
+    their next refresh. Files of older generations are unlinked; readers
+    still holding them keep their mapping until they refresh.
+
+    The store is a snapshot: profiles added or updated later are not patched
+    in, so rebuild it after ingests (ids it lacks are computed from their
+    birth data meanwhile). A store built with another ASTRO_FEATURE_VERSION
+    is ignored until it is rebuilt.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.meta: Dict[str, Any] = {}
+        self.records = np.zeros(0, dtype=FEATURE_DTYPE)
+        self.partitions = np.zeros(0, dtype=PARTITION_DTYPE)
+        self._partition_index: Dict[tuple, tuple] = {}
+        self._id_order: Optional[np.ndarray] = None
+        self._loaded_mtime = None
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def exists(self) -> bool:
+        return os.path.exists(self._file(META_FILE))
+
+    def refresh(self):
+        """(Re)open the files if a build has replaced them"""
+        try:
+            mtime = os.stat(self._file(META_FILE)).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._loaded_mtime:
+            return
+        for attempt in range(3):
+            with open(self._file(META_FILE)) as f:
+                meta = json.load(f)
+            if meta.get("astro_feature_version") != ASTRO_FEATURE_VERSION:
+                logger.warning(
+                    f"Ignoring feature store in {self.path} built with astro feature "
+                    f"version {meta.get('astro_feature_version')}; rebuild it"
+                )
+                self.meta = {}
+                self.records = np.zeros(0, dtype=FEATURE_DTYPE)
+                self.partitions = np.zeros(0, dtype=PARTITION_DTYPE)
+                self._partition_index = {}
+                self._id_order = None
+                self._loaded_mtime = mtime
+                return
+            try:
+                records = np.load(self._file(meta["records"]), mmap_mode="r")
+                partitions = np.load(self._file(meta["partitions"]))
+                break
+            except FileNotFoundError:
+                # Another build replaced this generation meanwhile; read the new meta.json
+                if attempt == 2:
+                    raise
+        self.records, self.partitions = records, partitions
+        self._partition_index = {
+            (int(p["gender"]), int(p["region"])): (int(p["start"]), int(p["stop"]))
+            for p in self.partitions
+        }
+        self._id_order = None
+        self.meta = meta
+        self._loaded_mtime = mtime
+
+    def build(self, records: np.ndarray):
+        """Replace the store with `records` (FEATURE_DTYPE, any order)"""
+        os.makedirs(self.path, exist_ok=True)
+        regions = region_of(records["lat"], records["lon"])
+        order = np.lexsort((records["id"], regions, records["gender"]))
+        records, regions = records[order], regions[order]
+
+        keys = np.stack(
+            [records["gender"].astype(np.int32), regions.astype(np.int32)], axis=1
+        )
+        starts = (
+            np.flatnonzero(np.r_[True, (keys[1:] != keys[:-1]).any(axis=1)])
+            if len(records)
+            else np.zeros(0, int)
+        )
+        partitions = np.zeros(len(starts), dtype=PARTITION_DTYPE)
+        partitions["gender"] = records["gender"][starts]
+        partitions["region"] = regions[starts]
+        partitions["start"] = starts
+        partitions["stop"] = np.r_[starts[1:], len(records)]
+
+        with open(self._file(LOCK_FILE), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            generation = uuid.uuid4().hex[:12]
+            meta = {
+                "records": f"records-{generation}.npy",
+                "partitions": f"partitions-{generation}.npy",
+                "count": int(len(records)),
+                "astro_feature_version": ASTRO_FEATURE_VERSION,
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            _save(self._file(meta["records"]), records)
+            _save(self._file(meta["partitions"]), partitions)
+            tmp = self._file(META_FILE + ".tmp")
+            with open(tmp, "w") as f:
+                json.dump(meta, f)
+            os.replace(tmp, self._file(META_FILE))
+            for name in os.listdir(self.path):
+                if name.endswith(".npy") and name not in (
+                    meta["records"],
+                    meta["partitions"],
+                ):
+                    os.unlink(self._file(name))
+        logger.info(
+            f"Built feature store of {len(records)} profiles in {len(partitions)} partitions in {self.path}"
+        )
+
+    def _slice(self, code: int, region: int) -> np.ndarray:
+        start, stop = self._partition_index.get((code, region), (0, 0))
+        return self.records[start:stop]
+
+    def partition(self, gender: str, region: int) -> np.ndarray:
+        """Records of one gender and region as a read-only view"""
+        self.refresh()
+        return self._slice(GENDERS.index(gender), int(region))
+
+    def candidates(
+        self,
+        gender: str,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+        max_distance_km: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Records of a gender, optionally within max_distance_km of (lat, lon).
+
+        Without a distance the gender's partitions are one contiguous view;
+        with one, only the partitions of nearby regions are read and then
+        filtered on the great-circle distance.
+        """
+        self.refresh()
+        code = GENDERS.index(gender)
+        spans = [
+            (start, stop)
+            for (g, _), (start, stop) in self._partition_index.items()
+            if g == code
+        ]
+        if max_distance_km is None or lat is None or lon is None:
+            if not spans:
+                return self.records[:0]
+            return self.records[min(s for s, _ in spans) : max(e for _, e in spans)]
+
+        nearby = regions_within(float(lat), float(lon), float(max_distance_km))
+        if nearby is None:
+            chunks = [
+                self._slice(g, r)
+                for g, r in self._partition_index
+                if g == code and r != UNKNOWN
+            ]
+        else:
+            chunks = [self._slice(code, r) for r in nearby.tolist()]
+        chunks = [c for c in chunks if len(c)]
+        if not chunks:
+            return self.records[:0]
+        found = np.concatenate(chunks)
+        phi, other_phi = (
+            np.radians(float(lat)),
+            np.radians(found["lat"].astype(np.float64)),
+        )
+        a = (
+            np.sin((other_phi - phi) / 2) ** 2
+            + np.cos(phi)
+            * np.cos(other_phi)
+            * np.sin(np.radians(found["lon"] - float(lon)) / 2) ** 2
+        )
+        distance = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        return found[distance <= float(max_distance_km)]
+
+    def lookup(self, profile_ids: Iterable[Any]) -> np.ndarray:
+        """Records of the given ids in the same order; missing ids get id -1"""
+        self.refresh()
+        ids = np.fromiter((int(i) for i in profile_ids), dtype=np.int64)
+        result = np.zeros(len(ids), dtype=FEATURE_DTYPE)
+        result["id"] = UNKNOWN
+        if not len(self.records) or not len(ids):
+            return result
+        if self._id_order is None:
+            self._id_order = np.argsort(self.records["id"], kind="stable")
+        sorted_ids = self.records["id"][self._id_order]
+        positions = np.clip(np.searchsorted(sorted_ids, ids), 0, len(sorted_ids) - 1)
+        found = sorted_ids[positions] == ids
+        result[found] = self.records[self._id_order[positions[found]]]
+        return result
+
+
+_feature_store: Optional[FeatureStore] = None
+
+
+def get_feature_store() -> Optional[FeatureStore]:
+    """Shared feature store for this process, or None when FEATURE_STORE_DIR is not set"""
+    global _feature_store
+    # Read at call time so agents may load .env after importing this module
+    path = os.getenv("FEATURE_STORE_DIR", FEATURE_STORE_DIR)
+    if _feature_store is None and path:
+        _feature_store = FeatureStore(path)
+    return _feature_store
+
+
+async def build_from_store(path: str):
+    """Batch job: write the features of every male and female profile in the profile store"""
+    from profile_store import profile_store
+
+    chunks = [np.zeros(0, dtype=FEATURE_DTYPE)]
+    try:
+        for gender in GENDERS:
+            columns = ("id", "gender", "dob", "tob", "lat", "lon", "astro_features")
+            async for page in profile_store.iter_candidates(gender, columns=columns):
+                chunks.append(profile_features(page))
+    finally:
+        await profile_store.close()
+    await asyncio.to_thread(FeatureStore(path).build, np.concatenate(chunks))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Write the memory-mapped astro feature store from the profile store"
+    )
+    parser.add_argument(
+        "store_dir",
+        nargs="?",
+        default=FEATURE_STORE_DIR,
+        help="Output directory (default: FEATURE_STORE_DIR)",
+    )
+    args = parser.parse_args(argv)
+    if not args.store_dir:
+        parser.error("store_dir or FEATURE_STORE_DIR is required")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(build_from_store(args.store_dir))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
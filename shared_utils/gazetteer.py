@@ -0,0 +1,265 @@
+import os
+import re
+import sys
+import json
+import logging
+import argparse
+import unicodedata
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NAME_WIDTH = 48
+RECORD_DTYPE = np.dtype(
+    [
+        ("lat", "<f4"),
+        ("lon", "<f4"),
+        ("population", "<i4"),
+        ("country", "S2"),
+    ]
+)
+
+NAMES_FILE = "names.npy"
+RECORDS_FILE = "records.npy"
+COUNTRIES_FILE = "countries.json"
+
+# GeoNames dump columns (https://download.geonames.org/export/dump/readme.txt)
+GEONAMES_NAME = 1
+GEONAMES_ASCIINAME = 2
+GEONAMES_LATITUDE = 4
+GEONAMES_LONGITUDE = 5
+GEONAMES_FEATURE_CLASS = 6
+GEONAMES_COUNTRY = 8
+GEONAMES_POPULATION = 14
+
+# Fuzzy matching only scans names sharing this many leading characters whose
+# length is within the edit-distance limit, and gives up on larger windows
+FUZZY_PREFIX = 3
+FUZZY_MAX_CANDIDATES = 20000
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fold_text(text: str) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace"""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return _WHITESPACE.sub(" ", _NON_WORD.sub(" ", text)).strip()
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, giving up early once it exceeds `limit`"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def build_index(
+    geonames_path: str, index_dir: str, country_info_path: Optional[str] = None
+) -> int:
+    """
+    Build a memory-mappable index from a GeoNames TSV dump (e.g. cities500.txt).
+
+    Writes a sorted fixed-width name array and a parallel record array
+    (lat, lon, population, country) as .npy files, plus a country name map
+    when countryInfo.txt is given. Returns the number of indexed names.
+    """
+    names: List[bytes] = []
+    records = []
+    with open(geonames_path, encoding="utf-8") as f:
+        for line in f:
+            columns = line.rstrip("\n").split("\t")
+            if (
+                len(columns) <= GEONAMES_POPULATION
+                or columns[GEONAMES_FEATURE_CLASS] != "P"
+            ):
+                continue
+            record = (
+                float(columns[GEONAMES_LATITUDE]),
+                float(columns[GEONAMES_LONGITUDE]),
+                int(columns[GEONAMES_POPULATION] or 0),
+                columns[GEONAMES_COUNTRY].encode("ascii", "ignore")[:2],
+            )
+            keys = {
+                fold_text(columns[GEONAMES_NAME]),
+                fold_text(columns[GEONAMES_ASCIINAME]),
+            }
+            for key in keys:
+                encoded = key.encode("ascii", "ignore")
+                if encoded:
+                    names.append(encoded[:NAME_WIDTH])
+                    records.append(record)
+
+    names_array = np.array(names, dtype=f"S{NAME_WIDTH}")
+    records_array = np.array(records, dtype=RECORD_DTYPE)
+    # Sort by name, most populous first within a name
+    order = np.lexsort((-records_array["population"], names_array))
+
+    os.makedirs(index_dir, exist_ok=True)
+    np.save(os.path.join(index_dir, NAMES_FILE), names_array[order])
+    np.save(os.path.join(index_dir, RECORDS_FILE), records_array[order])
+
+    countries = {}
+    if country_info_path:
+        with open(country_info_path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#"):
+                    continue
+                columns = line.rstrip("\n").split("\t")
+                if len(columns) > 4:
+                    countries[fold_text(columns[4])] = columns[0]
+    with open(os.path.join(index_dir, COUNTRIES_FILE), "w") as f:
+        json.dump(countries, f)
+
+    logger.info(f"Indexed {len(names_array)} place names into {index_dir}")
+    return len(names_array)
+
+
+class Gazetteer:
+    """
+    Offline place resolver over an index written by build_index().
+
+    Arrays are opened with mmap, so startup is instant and worker processes
+    share the same pages. Lookups binary-search the sorted name array and fall
+    back to a bounded edit-distance scan over names with the same prefix.
+    A country named in the place restricts matches to that country.
+    """
+
+    def __init__(self, index_dir: str):
+        self.names = np.load(os.path.join(index_dir, NAMES_FILE), mmap_mode="r")
+        self.records = np.load(os.path.join(index_dir, RECORDS_FILE), mmap_mode="r")
+        countries_path = os.path.join(index_dir, COUNTRIES_FILE)
+        self.countries: Dict[str, str] = {}
+        if os.path.exists(countries_path):
+            with open(countries_path) as f:
+                self.countries = json.load(f)
+        # ISO codes a two-letter place part may name
+        self.country_codes = {code.encode() for code in self.countries.values()}
+        self.country_codes.update(np.unique(self.records["country"]).tolist())
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _range(self, prefix: bytes, exact: bool) -> slice:
+        start = int(np.searchsorted(self.names, prefix, side="left"))
+        end = int(
+            np.searchsorted(
+                self.names, prefix if exact else prefix + b"\xff", side="right"
+            )
+        )
+        return slice(start, end)
+
+    def _country_codes(self, parts: List[str]) -> set:
+        """
+        Countries named in the parts. Full names win over two-letter parts,
+        which are often state abbreviations ("Pune, MH, India") and count
+        only when they are a known country code; other parts are ignored.
+        """
+        names = {
+            self.countries[part].encode() for part in parts if part in self.countries
+        }
+        if names:
+            return names
+        codes = {part.upper().encode() for part in parts if len(part) == 2}
+        return codes & self.country_codes
+
+    def _in_countries(self, rows: np.ndarray, countries: set) -> np.ndarray:
+        if not countries:
+            return rows
+        return rows[np.isin(self.records["country"][rows], list(countries))]
+
+    def _best(self, rows: np.ndarray, countries: set) -> Optional[int]:
+        """Most populous row, only among rows in one of the given countries if any"""
+        rows = self._in_countries(rows, countries)
+        if len(rows) == 0:
+            return None
+        return int(rows[np.argmax(self.records["population"][rows])])
+
+    def _fuzzy(self, name: bytes, countries: set) -> Optional[int]:
+        window = self._range(name[:FUZZY_PREFIX], exact=False)
+        if window.stop - window.start > FUZZY_MAX_CANDIDATES:
+            return None
+        limit = max(1, len(name) // 5)
+        rows = self._in_countries(np.arange(window.start, window.stop), countries)
+        lengths = np.char.str_len(self.names[rows])
+        rows = rows[np.abs(lengths - len(name)) <= limit]
+        text = name.decode()
+        best_distance = limit + 1
+        matches: List[int] = []
+        for row in rows:
+            distance = edit_distance(text, self.names[row].decode(), limit)
+            if distance < best_distance:
+                best_distance = distance
+                matches = [row]
+            elif distance == best_distance and distance <= limit:
+                matches.append(row)
+        return (
+            self._best(np.array(matches, dtype=np.int64), countries)
+            if best_distance <= limit
+            else None
+        )
+
+    def lookup(self, place: str, fuzzy: bool = True) -> Optional[Dict[str, object]]:
+        """
+        Resolve "City[, State][, Country]" to coordinates.
+
+        Returns a dict with 'lat', 'lon', 'country' and 'match' ('exact' or
+        'fuzzy'), or None when the place is not in the gazetteer (or not in
+        the named country). The fuzzy scan is pure Python and can take
+        milliseconds; callers on an event loop should run it in a thread.
+        """
+        parts = [fold_text(part) for part in (place or "").split(",")]
+        parts = [part for part in parts if part]
+        if not parts or len(self.names) == 0:
+            return None
+
+        name = parts[0].encode("ascii", "ignore")[:NAME_WIDTH]
+        countries = self._country_codes(parts[1:])
+
+        match = "exact"
+        window = self._range(name, exact=True)
+        row = self._best(np.arange(window.start, window.stop), countries)
+        if row is None and fuzzy:
+            match = "fuzzy"
+            row = self._fuzzy(name, countries)
+        if row is None:
+            return None
+
+        record = self.records[row]
+        return {
+            "lat": round(float(record["lat"]), 5),
+            "lon": round(float(record["lon"]), 5),
+            "country": record["country"].decode(),
+            "match": match,
+        }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Build an offline gazetteer index from a GeoNames dump"
+    )
+    parser.add_argument("geonames", help="GeoNames TSV file, e.g. cities500.txt")
+    parser.add_argument("index_dir", help="Output directory for the index")
+    parser.add_argument(
+        "--country-info", help="GeoNames countryInfo.txt for country name matching"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    build_index(args.geonames, args.index_dir, args.country_info)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import os
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from gazetteer import Gazetteer, fold_text
+from rate_limit import TokenBucket
+from resilience import get_endpoint, is_transient
+from result_cache import ResultCache, DEFAULT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+NOMINATIM_USER_AGENT = os.getenv("NOMINATIM_USER_AGENT", "matchmystar-geocode-agent")
+# Nominatim usage policy: at most one request per second
+NOMINATIM_RATE_LIMIT = float(os.getenv("NOMINATIM_RATE_LIMIT", "1"))
+NOMINATIM_TIMEOUT = float(os.getenv("NOMINATIM_TIMEOUT", "10"))
+
+GEOCODE_CACHE_ENABLED = os.getenv("GEOCODE_CACHE_ENABLED", "true").lower() == "true"
+GEOCODE_CACHE_PATH = os.getenv(
+    "GEOCODE_CACHE_PATH", os.path.join(DEFAULT_CACHE_DIR, "geocode.sqlite3")
+)
+GEOCODE_CACHE_TTL = float(os.getenv("GEOCODE_CACHE_TTL", str(365 * 24 * 3600)))
+# Places that did not resolve are retried after this many seconds
+GEOCODE_NEGATIVE_CACHE_TTL = float(
+    os.getenv("GEOCODE_NEGATIVE_CACHE_TTL", str(24 * 3600))
+)
+GEOCODE_CACHE_MEMORY_SIZE = int(os.getenv("GEOCODE_CACHE_MEMORY_SIZE", "5000"))
+
+# Directory of an index built with `python shared_utils/gazetteer.py`; resolves places offline
+GAZETTEER_INDEX_DIR = os.getenv("GAZETTEER_INDEX_DIR", "")
+
+nominatim_rate_limiter = TokenBucket(NOMINATIM_RATE_LIMIT, 1)
+# Retries and circuit breaker; no hedging, the usage policy forbids parallel requests
+nominatim_endpoint = get_endpoint("nominatim")
+_http_client: Optional[httpx.AsyncClient] = None
+_geocode_cache: Optional[ResultCache] = None
+_gazetteer: Optional[Gazetteer] = None
+
+
+def normalize_place(place: str) -> str:
+    """
+    Canonical cache key for a free-text place name.
+
+    Folds case and accents, drops punctuation other than commas, collapses
+    whitespace and orders the comma-separated parts, so "Chennai, India",
+    " chennai ,INDIA." and "India, Chennai" share one key.
+    """
+    parts = {fold_text(part) for part in (place or "").split(",")}
+    return ", ".join(sorted(part for part in parts if part))
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one in-flight call"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.shared_calls = 0
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._inflight.get(key)
+        if future is not None:
+            self.shared_calls += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved so it is not logged as unhandled
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+
+_single_flight = SingleFlight()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            headers={"User-Agent": NOMINATIM_USER_AGENT},
+            timeout=httpx.Timeout(NOMINATIM_TIMEOUT),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+def get_geocode_cache() -> Optional[ResultCache]:
+    global _geocode_cache, GEOCODE_CACHE_ENABLED
+    if _geocode_cache is None and GEOCODE_CACHE_ENABLED:
+        try:
+            _geocode_cache = ResultCache(
+                GEOCODE_CACHE_PATH,
+                table="geocode",
+                memory_size=GEOCODE_CACHE_MEMORY_SIZE,
+                ttl=GEOCODE_CACHE_TTL,
+            )
+        except Exception as e:
+            logger.error(f"Geocode cache disabled: {e}")
+            GEOCODE_CACHE_ENABLED = False
+    return _geocode_cache
+
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """Memory-mapped offline gazetteer, or None when no index is configured"""
+    global _gazetteer, GAZETTEER_INDEX_DIR
+    if _gazetteer is None and GAZETTEER_INDEX_DIR:
+        try:
+            _gazetteer = Gazetteer(GAZETTEER_INDEX_DIR)
+            logger.info(
+                f"Loaded gazetteer with {len(_gazetteer)} names from {GAZETTEER_INDEX_DIR}"
+            )
+        except Exception as e:
+            logger.error(f"Gazetteer disabled: {e}")
+            GAZETTEER_INDEX_DIR = ""
+    return _gazetteer
+
+
+def get_geocode_stats() -> Dict[str, Any]:
+    """Cache counters plus the number of lookups that shared an in-flight request"""
+    cache = get_geocode_cache()
+    stats = cache.stats() if cache else {}
+    stats["single_flight_shared"] = _single_flight.shared_calls
+    return stats
+
+
+async def nominatim_search(place: str) -> Optional[Dict[str, float]]:
+    """
+    Query Nominatim; returns None when the place does not resolve.
+
+    Transient failures are retried, and CircuitOpenError is raised without
+    a request while Nominatim keeps failing.
+    """
+
+    async def request() -> httpx.Response:
+        await nominatim_rate_limiter.acquire()
+        response = await get_http_client().get(
+            NOMINATIM_URL, params={"q": place, "format": "json", "limit": 1}
+        )
+        response.raise_for_status()
+        return response
+
+    response = await nominatim_endpoint.call(request)
+    data = response.json()
+    if not data:
+        return None
+    return {"lat": float(data[0]["lat"]), "lon": float(data[0]["lon"])}
+
+
+async def geocode_place(place: str, remote: bool = True) -> Optional[Dict[str, float]]:
+    """
+    Resolve a place name to {'lat', 'lon'}, or None if it cannot be found.
+
+    An exact match in the offline gazetteer is used first when configured;
+    its fuzzy matching (slower, run in a thread) is only tried with `remote`
+    False, so typos are otherwise left to Nominatim. Nominatim results,
+    including misses, are cached by normalized place name, and concurrent
+    lookups of the same place share one upstream request. When Nominatim is
+    down (circuit open or retries exhausted) the gazetteer resolves the
+    place's coarser parts instead, e.g. the city of "Andheri, Mumbai, India";
+    other upstream errors, and outages without a fallback, are raised and
+    not cached. With `remote` False only the gazetteer and the cache are
+    consulted.
+    """
+    key = normalize_place(place)
+    if not key:
+        return None
+
+    gazetteer = get_gazetteer()
+    if gazetteer:
+        entry = gazetteer.lookup(place, fuzzy=False)
+        if entry:
+            return {"lat": entry["lat"], "lon": entry["lon"]}
+
+    cache = get_geocode_cache()
+    if cache:
+        cached = await cache.aget(key)
+        if cached is not None:
+            return (
+                {"lat": cached["lat"], "lon": cached["lon"]}
+                if cached.get("found")
+                else None
+            )
+    if not remote:
+        entry = await asyncio.to_thread(gazetteer.lookup, place) if gazetteer else None
+        return {"lat": entry["lat"], "lon": entry["lon"]} if entry else None
+
+    async def lookup() -> Optional[Dict[str, float]]:
+        coordinates = await nominatim_search(place)
+        if cache:
+            if coordinates:
+                await cache.aset(key, {"found": True, **coordinates})
+            else:
+                await cache.aset(key, {"found": False}, ttl=GEOCODE_NEGATIVE_CACHE_TTL)
+        return coordinates
+
+    try:
+        return await _single_flight.run(key, lookup)
+    except Exception as e:
+        if not is_transient(e):
+            raise
+        coordinates = coarse_gazetteer_lookup(place)
+        if coordinates is None:
+            raise
+        logger.warning(
+            f"Nominatim unavailable ({e}), using the gazetteer's match for a coarser part of the place"
+        )
+        return coordinates
+
+
+def coarse_gazetteer_lookup(place: str) -> Optional[Dict[str, float]]:
+    """Gazetteer coordinates of the first resolvable enclosing part of "Locality, City, ..., Country" """
+    gazetteer = get_gazetteer()
+    if not gazetteer:
+        return None
+    parts = [part.strip() for part in (place or "").split(",") if part.strip()]
+    # The last part alone is usually the country, which is too coarse to be useful
+    for start in range(1, len(parts) - 1):
+        entry = gazetteer.lookup(", ".join(parts[start:]), fuzzy=False)
+        if entry:
+            return {"lat": entry["lat"], "lon": entry["lon"]}
+    return None
@@ -0,0 +1,371 @@
+import os
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from prokerala import get_kundli_match, kundli_match_endpoint
+from ashtakoot import local_kundli_match, moon_info
+from astro_features import (
+    features_current,
+    moon_features as astro_moon_features,
+    valid_birth_data,
+)
+from compatibility_matrix import (
+    COLUMN_GENDER,
+    ROW_GENDER,
+    get_compatibility_matrix,
+)
+from feature_store import UNKNOWN, get_feature_store
+from match_details import project_match_details, store_raw_response
+from scoring_pool import (
+    SCORING_MIN_SHARD_SIZE,
+    SCORING_WORKERS,
+    get_scoring_pool,
+    map_shards,
+    shards,
+)
+
+logger = logging.getLogger(__name__)
+
+# "prokerala" (the authoritative source) confirms the best local estimates with the
+# remote API; "local" scores with the offline Ashtakoot engine only. The local moon
+# positions are checked against Swiss Ephemeris, not against Prokerala responses.
+KUNDLI_MATCH_BACKEND = os.getenv("KUNDLI_MATCH_BACKEND", "prokerala")
+# Maximum Prokerala requests in flight per invocation
+KUNDLI_MATCH_CONCURRENCY = int(os.getenv("KUNDLI_MATCH_CONCURRENCY", "8"))
+# Seconds after which the scored subset is returned; 0 disables the deadline
+KUNDLI_MATCH_DEADLINE = float(os.getenv("KUNDLI_MATCH_DEADLINE", "60"))
+# With the prokerala backend, only the best KUNDLI_MATCH_TOP_K local estimates are sent to Prokerala; 0 sends all
+KUNDLI_MATCH_TOP_K = int(os.getenv("KUNDLI_MATCH_TOP_K", "10"))
+# Maximum paid Prokerala calls per request; 0 means no limit beyond the top-K
+KUNDLI_MATCH_PAID_CALL_BUDGET = int(os.getenv("KUNDLI_MATCH_PAID_CALL_BUDGET", "0"))
+
+# Candidate fields local_compatibility reads; only these are copied to scoring workers
+SCORING_FIELDS = ("id", "gender", "dob", "tob", "tz_offset", "lat", "lon")
+
+
+def _fill_stored(
+    stored: np.ndarray, keyed: List[int], arrays: Tuple[Any, Any, Any]
+) -> List[int]:
+    """Copy known stored features into the profiles' arrays; returns the filled indexes"""
+    found = (stored["id"] != UNKNOWN) & (stored["nakshatra"] >= 0)
+    rows = [i for i, hit in zip(keyed, found) if hit]
+    for array, field in zip(arrays, ("nakshatra", "pada", "rasi")):
+        array[rows] = stored[field][found]
+    return rows
+
+
+def moon_features(profiles: List[Dict[str, Any]]) -> Tuple[Any, Any, Any]:
+    """
+    Nakshatra, pada and rasi arrays for profiles with valid birth data.
+
+    Profiles carrying current 'astro_features' use them. The others reuse
+    the features stored in the precomputed compatibility matrix (matched by
+    integer 'id' and 'gender') or the feature store (by 'id'), each looked
+    up once for the whole batch; the rest are computed locally.
+    """
+    arrays = (
+        np.zeros(len(profiles), dtype=np.int8),
+        np.zeros(len(profiles), dtype=np.int8),
+        np.zeros(len(profiles), dtype=np.int8),
+    )
+    missing = [
+        i
+        for i, profile in enumerate(profiles)
+        if isinstance(profile.get("id"), int) and not features_current(profile)
+    ]
+    filled: set = set()
+
+    matrix = get_compatibility_matrix()
+    if matrix and missing:
+        try:
+            for gender in (ROW_GENDER, COLUMN_GENDER):
+                keyed = [i for i in missing if profiles[i].get("gender") == gender]
+                if keyed:
+                    stored = matrix.lookup((profiles[i]["id"] for i in keyed), gender)
+                    filled.update(_fill_stored(stored, keyed, arrays))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Compatibility matrix lookup failed: {e}")
+
+    feature_store = get_feature_store()
+    keyed = [i for i in missing if i not in filled]
+    if feature_store and keyed:
+        try:
+            stored = feature_store.lookup(profiles[i]["id"] for i in keyed)
+            filled.update(_fill_stored(stored, keyed, arrays))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Feature store lookup failed: {e}")
+
+    rest = [i for i in range(len(profiles)) if i not in filled]
+    if rest:
+        # Reuses astro_features attached by astro_data_agent or the profile store
+        positions = astro_moon_features([profiles[i] for i in rest])
+        for array, field in zip(arrays, ("nakshatra", "pada", "rasi")):
+            array[rest] = positions[field]
+    return arrays
+
+
+def local_compatibility(
+    user_profile: Dict[str, Any], candidates: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Score all candidates against the user in one vectorized pass with the local engine"""
+    valid = [i for i, c in enumerate(candidates) if valid_birth_data(c)]
+    compatibilities = [
+        {
+            "compatibility_score": 0,
+            "total_points": 0,
+            "maximum_points": 36,
+            "summary": "Error: Missing or invalid birth date/time",
+            "message_type": "error",
+        }
+        for _ in candidates
+    ]
+
+    if not valid_birth_data(user_profile):
+        for compatibility in compatibilities:
+            compatibility["summary"] = "Error: Missing or invalid user birth date/time"
+        return compatibilities
+    if not valid:
+        return compatibilities
+
+    profiles = [user_profile] + [candidates[i] for i in valid]
+    nakshatra, pada, rasi = moon_features(profiles)
+
+    # The user is scored as the boy, as in get_kundli_match
+    results = local_kundli_match(nakshatra[0], rasi[0], nakshatra[1:], rasi[1:])
+    boy_info = moon_info(nakshatra[0], pada[0], rasi[0])
+    for j, (i, result) in enumerate(zip(valid, results), start=1):
+        compatibilities[i] = {
+            "compatibility_score": result["compatibility_score"],
+            "total_points": result["total_points"],
+            "maximum_points": result["maximum_points"],
+            "summary": result["message"],
+            "message_type": result["message_type"],
+            "details": {
+                "boy_info": boy_info,
+                "girl_info": moon_info(nakshatra[j], pada[j], rasi[j]),
+                "koot_points": result["koot_points"],
+                "message": {
+                    "type": result["message_type"],
+                    "description": result["message"],
+                },
+            },
+        }
+    return compatibilities
+
+
+def _scoring_view(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """The part of a candidate local_compatibility reads, with astro_features cut to the moon position"""
+    view = {k: candidate[k] for k in SCORING_FIELDS if k in candidate}
+    features = candidate.get("astro_features")
+    if isinstance(features, dict) and "nakshatra" in features:
+        view["astro_features"] = {
+            "version": features.get("version"),
+            "nakshatra": {
+                "id": features["nakshatra"]["id"],
+                "pada": features["nakshatra"]["pada"],
+            },
+            "rasi": {"id": features["rasi"]["id"]},
+            "manglik": {
+                "from_lagna": (features.get("manglik") or {}).get("from_lagna")
+            },
+        }
+    return view
+
+
+async def sharded_local_compatibility(
+    user_profile: Dict[str, Any], candidates: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    local_compatibility spread over the scoring pool (SCORING_WORKERS).
+
+    Candidates are split into consecutive shards sized from the candidate
+    and worker counts, and the shards' results are concatenated in order.
+    Without a pool, or with too few candidates for two shards, scores in
+    this process.
+    """
+    parts = shards(len(candidates), SCORING_WORKERS, SCORING_MIN_SHARD_SIZE)
+    pool = get_scoring_pool(warm=("kundli_scoring",)) if len(parts) > 1 else None
+    if pool is None:
+        return local_compatibility(user_profile, candidates)
+    shard_args = (
+        (user_profile, [_scoring_view(c) for c in candidates[part]]) for part in parts
+    )
+    results = await map_shards(pool, local_compatibility, shard_args)
+    return [compatibility for shard in results for compatibility in shard]
+
+
+async def prokerala_compatibility(
+    user_data: Dict[str, Any], candidate: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Score one candidate with the Prokerala API.
+
+    Only the projected 'details' travel with the result; the full response is
+    kept in the raw response store when enabled and referenced by 'raw_response_id'.
+    """
+    match_data = {
+        "dob": candidate.get("dob"),
+        "tob": candidate.get("tob"),
+        "lat": candidate.get("lat"),
+        "lon": candidate.get("lon"),
+    }
+    try:
+        compatibility_result = await get_kundli_match(user_data, match_data)
+        if "error" in compatibility_result:
+            return {
+                "compatibility_score": 0,
+                "summary": f"Error: {compatibility_result['error']}",
+                "message_type": "error",
+            }
+        raw_response = compatibility_result.get("raw_response", {})
+        compatibility = {
+            "compatibility_score": compatibility_result.get("compatibility_score", 0),
+            "total_points": compatibility_result.get("total_points", 0),
+            "maximum_points": compatibility_result.get("maximum_points", 36),
+            "summary": compatibility_result.get(
+                "message", "Compatibility analysis completed"
+            ),
+            "message_type": compatibility_result.get("message_type", "neutral"),
+            "details": project_match_details(raw_response),
+        }
+        response_id = await store_raw_response(raw_response)
+        if response_id:
+            compatibility["raw_response_id"] = response_id
+        return compatibility
+    except Exception as e:
+        return {
+            "compatibility_score": 0,
+            "total_points": 0,
+            "maximum_points": 36,
+            "summary": f"Error: {str(e)}",
+            "message_type": "error",
+        }
+
+
+async def remote_compatibility(
+    user_profile: Dict[str, Any],
+    candidates: List[Dict[str, Any]],
+    deadline: Optional[float] = None,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Score candidates with Prokerala concurrently, at most KUNDLI_MATCH_CONCURRENCY
+    requests in flight. Requests are additionally paced by the shared Prokerala
+    rate limiter.
+
+    Returns (candidate index, compatibility) pairs in the original candidate order.
+    Candidates not scored within the deadline are left out.
+    """
+    if not candidates:
+        return []
+    deadline = KUNDLI_MATCH_DEADLINE if deadline is None else deadline
+    user_data = {
+        "dob": user_profile.get("dob"),
+        "tob": user_profile.get("tob"),
+        "lat": user_profile.get("lat"),
+        "lon": user_profile.get("lon"),
+    }
+    semaphore = asyncio.Semaphore(KUNDLI_MATCH_CONCURRENCY)
+
+    async def score(candidate: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await prokerala_compatibility(user_data, candidate)
+
+    tasks = [asyncio.create_task(score(candidate)) for candidate in candidates]
+    done, pending = await asyncio.wait(
+        tasks, timeout=deadline if deadline > 0 else None
+    )
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning(
+            f"Deadline of {deadline}s reached, returning {len(done)} of {len(tasks)} scored candidates"
+        )
+
+    return [(i, task.result()) for i, task in enumerate(tasks) if task in done]
+
+
+def select_for_remote(
+    estimates: List[Dict[str, Any]], top_k: int, budget: int
+) -> List[int]:
+    """Indexes of the best locally estimated candidates to confirm with Prokerala, best first"""
+    scored = [
+        i
+        for i, estimate in enumerate(estimates)
+        if estimate.get("message_type") != "error"
+    ]
+    limit = len(scored) if top_k <= 0 else top_k
+    if budget > 0:
+        limit = min(limit, budget)
+    scored.sort(key=lambda i: estimates[i]["total_points"], reverse=True)
+    return scored[:limit]
+
+
+async def two_stage_compatibility(
+    user_profile: Dict[str, Any],
+    candidates: List[Dict[str, Any]],
+    top_k: int = KUNDLI_MATCH_TOP_K,
+    budget: int = KUNDLI_MATCH_PAID_CALL_BUDGET,
+) -> List[Dict[str, Any]]:
+    """
+    Estimate every candidate locally, then score only the top-K with Prokerala.
+
+    Returns one compatibility per candidate in the original order. Results not
+    confirmed by Prokerala (outside the top-K, over the deadline or failed)
+    keep the local score with 'estimated': True. While the Prokerala circuit
+    is open no remote calls are made at all.
+    """
+    compatibilities = await sharded_local_compatibility(user_profile, candidates)
+    for compatibility in compatibilities:
+        if compatibility["message_type"] != "error":
+            compatibility["estimated"] = True
+
+    selected = select_for_remote(compatibilities, top_k, budget)
+    if selected and not kundli_match_endpoint.available:
+        logger.warning("Prokerala circuit is open, keeping the local estimates")
+        selected = []
+    results = await remote_compatibility(
+        user_profile, [candidates[i] for i in selected]
+    )
+    confirmed = 0
+    for j, compatibility in results:
+        if compatibility.get("message_type") != "error":
+            compatibility["estimated"] = False
+            compatibilities[selected[j]] = compatibility
+            confirmed += 1
+    estimated = sum(
+        1 for compatibility in compatibilities if compatibility.get("estimated")
+    )
+    logger.info(
+        f"Confirmed {confirmed} of {len(selected)} selected candidates with Prokerala, {estimated} estimated locally"
+    )
+    return compatibilities
+
+
+async def score_candidates(
+    user_profile: Dict[str, Any],
+    candidates: List[Dict[str, Any]],
+    top_k: Optional[int] = None,
+    max_paid_calls: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Score candidates with the configured KUNDLI_MATCH_BACKEND.
+
+    Returns one {'match': candidate, 'compatibility': ...} dict per candidate
+    in the original order.
+    """
+    if KUNDLI_MATCH_BACKEND == "local":
+        compatibilities = await sharded_local_compatibility(user_profile, candidates)
+    else:
+        compatibilities = await two_stage_compatibility(
+            user_profile,
+            candidates,
+            KUNDLI_MATCH_TOP_K if top_k is None else top_k,
+            KUNDLI_MATCH_PAID_CALL_BUDGET if max_paid_calls is None else max_paid_calls,
+        )
+    return [
+        {"match": c, "compatibility": comp}
+        for c, comp in zip(candidates, compatibilities)
+    ]
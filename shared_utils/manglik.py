@@ -0,0 +1,131 @@
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+
+from moon import J2000, delta_t_days, lahiri_ayanamsa
+
+logger = logging.getLogger(__name__)
+
+# Houses counted from the lagna or the moon sign that make Mars cause Mangal dosha
+MANGLIK_HOUSES = (1, 2, 4, 7, 8, 12)
+
+# Keplerian elements and rates per Julian century for the J2000 ecliptic
+# (Standish, "Keplerian Elements for Approximate Positions of the Major
+# Planets", table 1, valid 1800-2050): a, e, I, L, longitude of perihelion,
+# longitude of ascending node
+_EARTH_MOON_ELEMENTS = np.array(
+    [
+        [1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0],
+        [0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0],
+    ]
+)
+_MARS_ELEMENTS = np.array(
+    [
+        [1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891],
+        [0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343],
+    ]
+)
+
+
+def _heliocentric_position(elements: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Heliocentric J2000 ecliptic x, y, z (au) from Keplerian elements at centuries t"""
+    a, e, inclination, mean_longitude, perihelion, node = (
+        elements[0, i] + elements[1, i] * t for i in range(6)
+    )
+    inclination, node = np.radians(inclination), np.radians(node)
+    argument = np.radians(perihelion) - node
+    anomaly = np.radians(np.mod(mean_longitude - perihelion + 180.0, 360.0) - 180.0)
+
+    eccentric = anomaly + e * np.sin(anomaly)
+    for _ in range(6):
+        eccentric -= (eccentric - e * np.sin(eccentric) - anomaly) / (
+            1 - e * np.cos(eccentric)
+        )
+
+    x_orbit = a * (np.cos(eccentric) - e)
+    y_orbit = a * np.sqrt(1 - e * e) * np.sin(eccentric)
+    cos_w, sin_w = np.cos(argument), np.sin(argument)
+    cos_n, sin_n = np.cos(node), np.sin(node)
+    cos_i, sin_i = np.cos(inclination), np.sin(inclination)
+    return np.stack(
+        [
+            (cos_w * cos_n - sin_w * sin_n * cos_i) * x_orbit
+            + (-sin_w * cos_n - cos_w * sin_n * cos_i) * y_orbit,
+            (cos_w * sin_n + sin_w * cos_n * cos_i) * x_orbit
+            + (-sin_w * sin_n + cos_w * cos_n * cos_i) * y_orbit,
+            (sin_w * sin_i) * x_orbit + (cos_w * sin_i) * y_orbit,
+        ]
+    )
+
+
+def sidereal_mars_longitude(jd_ut) -> np.ndarray:
+    """Geocentric sidereal (Lahiri) longitude of Mars in degrees for Julian days in UT"""
+    jd_ut = np.asarray(jd_ut, dtype=np.float64)
+    jd_tt = jd_ut + delta_t_days(jd_ut)
+    t = (jd_tt - J2000) / 36525.0
+    geocentric = _heliocentric_position(_MARS_ELEMENTS, t) - _heliocentric_position(
+        _EARTH_MOON_ELEMENTS, t
+    )
+    longitude_j2000 = np.degrees(np.arctan2(geocentric[1], geocentric[0]))
+    # Precess from the J2000 equinox to the equinox of date
+    precession = (5028.796195 * t + 1.1054348 * t * t) / 3600.0
+    return np.mod(longitude_j2000 + precession - lahiri_ayanamsa(jd_tt), 360.0)
+
+
+def sidereal_ascendant(jd_ut, lat, lon) -> np.ndarray:
+    """Sidereal (Lahiri) longitude of the ascendant in degrees for a place (east longitude positive)"""
+    jd_ut = np.asarray(jd_ut, dtype=np.float64)
+    t = (jd_ut - J2000) / 36525.0
+    sidereal_time = (
+        280.46061837
+        + 360.98564736629 * (jd_ut - J2000)
+        + 0.000387933 * t * t
+        - t**3 / 38710000
+        + np.asarray(lon, dtype=np.float64)
+    )
+    theta = np.radians(np.mod(sidereal_time, 360.0))
+    obliquity = np.radians(23.439291 - 0.0130042 * t)
+    latitude = np.radians(np.asarray(lat, dtype=np.float64))
+    ascendant = np.degrees(
+        np.arctan2(
+            np.cos(theta),
+            -(np.sin(theta) * np.cos(obliquity) + np.tan(latitude) * np.sin(obliquity)),
+        )
+    )
+    jd_tt = jd_ut + delta_t_days(jd_ut)
+    return np.mod(ascendant - lahiri_ayanamsa(jd_tt), 360.0)
+
+
+def house_from(rasi, reference_rasi) -> np.ndarray:
+    """Whole-sign house (1-12) of a rasi counted from a reference rasi"""
+    return np.mod(np.asarray(rasi) - np.asarray(reference_rasi), 12) + 1
+
+
+def manglik_status(
+    jd_ut, moon_rasi, lat=None, lon=None
+) -> Dict[str, Optional[np.ndarray]]:
+    """
+    Mangal dosha for arrays of births.
+
+    Mars in the 1st, 2nd, 4th, 7th, 8th or 12th house counted from the lagna
+    or from the moon sign makes a chart manglik. The lagna needs lat/lon;
+    without them only the moon sign is checked and 'from_lagna' is None.
+
+    Returns:
+        Dict with 'mars_rasi', 'from_moon', 'from_lagna' and 'status' arrays
+    """
+    mars_rasi = (sidereal_mars_longitude(jd_ut) // 30).astype(np.int8)
+    from_moon = np.isin(house_from(mars_rasi, moon_rasi), MANGLIK_HOUSES)
+    from_lagna = None
+    status = from_moon
+    if lat is not None and lon is not None:
+        lagna_rasi = (sidereal_ascendant(jd_ut, lat, lon) // 30).astype(np.int8)
+        from_lagna = np.isin(house_from(mars_rasi, lagna_rasi), MANGLIK_HOUSES)
+        status = from_moon | from_lagna
+    return {
+        "mars_rasi": mars_rasi,
+        "from_moon": from_moon,
+        "from_lagna": from_lagna,
+        "status": status,
+    }
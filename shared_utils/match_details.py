@@ -0,0 +1,153 @@
+import os
+import json
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+from result_cache import ResultCache, DEFAULT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Raw Prokerala responses are kept out of the agent payloads; set to true to store them for lookup by id
+RAW_RESPONSE_STORE_ENABLED = (
+    os.getenv("RAW_RESPONSE_STORE_ENABLED", "false").lower() == "true"
+)
+RAW_RESPONSE_STORE_PATH = os.getenv(
+    "RAW_RESPONSE_STORE_PATH", os.path.join(DEFAULT_CACHE_DIR, "raw_responses.sqlite3")
+)
+RAW_RESPONSE_STORE_TTL = float(os.getenv("RAW_RESPONSE_STORE_TTL", str(30 * 24 * 3600)))
+RAW_RESPONSE_STORE_MAX_ROWS = int(os.getenv("RAW_RESPONSE_STORE_MAX_ROWS", "1000000"))
+
+# Prokerala guna names that differ from the koota keys used by the local engine
+_KOOTA_ALIASES = {"vasya": "vashya", "maitri": "graha_maitri", "bhakut": "bhakoot"}
+
+_raw_response_store: Optional[ResultCache] = None
+
+
+def _koota_key(name: str) -> str:
+    key = name.lower().replace(" koot", "").strip().replace(" ", "_")
+    return _KOOTA_ALIASES.get(key, key)
+
+
+def _person_details(info: Dict[str, Any]) -> Dict[str, Any]:
+    details = {}
+    nakshatra = info.get("nakshatra")
+    if nakshatra:
+        details["nakshatra"] = {
+            "id": nakshatra.get("id"),
+            "name": nakshatra.get("name", ""),
+            "lord": {"name": (nakshatra.get("lord") or {}).get("name", "")},
+            "pada": nakshatra.get("pada", ""),
+        }
+    rasi = info.get("rasi")
+    if rasi:
+        details["rasi"] = {
+            "id": rasi.get("id"),
+            "name": rasi.get("name", ""),
+            "lord": {"name": (rasi.get("lord") or {}).get("name", "")},
+        }
+    koot = info.get("koot")
+    if koot:
+        details["koot"] = {k: v for k, v in koot.items() if isinstance(v, str)}
+    return details
+
+
+def koot_points(guna_milan: Dict[str, Any]) -> Dict[str, float]:
+    """Points per koota from either the local 'koot_points' dict or Prokerala's 'guna' list"""
+    if guna_milan.get("koot_points"):
+        return dict(guna_milan["koot_points"])
+    points = {}
+    for guna in guna_milan.get("guna") or []:
+        if guna.get("name") is not None:
+            points[_koota_key(guna["name"])] = guna.get("obtained_points", 0)
+    return points
+
+
+def project_match_details(raw_response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Keep only what the formatter and the UI read from a kundli matching response.
+
+    The result uses the response's own layout ('boy_info'/'girl_info' with
+    'nakshatra', 'rasi' and 'koot', plus 'message') so it can stand in for
+    the raw response, with the per-koota points under 'koot_points'.
+    """
+    if not raw_response:
+        return {}
+    details = {
+        key: _person_details(raw_response[key])
+        for key in ("boy_info", "girl_info")
+        if raw_response.get(key)
+    }
+    points = koot_points(raw_response.get("guna_milan") or {})
+    if points:
+        details["koot_points"] = points
+    message = raw_response.get("message")
+    if isinstance(message, dict):
+        details["message"] = {
+            "type": message.get("type", ""),
+            "description": message.get("description", ""),
+        }
+    return details
+
+
+def raw_response_id(raw_response: Dict[str, Any]) -> str:
+    """Content hash of a raw response, so identical responses share one stored copy"""
+    encoded = json.dumps(
+        raw_response, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()[:32]
+
+
+def get_raw_response_store() -> Optional[ResultCache]:
+    global _raw_response_store, RAW_RESPONSE_STORE_ENABLED
+    if _raw_response_store is None and RAW_RESPONSE_STORE_ENABLED:
+        try:
+            _raw_response_store = ResultCache(
+                RAW_RESPONSE_STORE_PATH,
+                table="raw_responses",
+                # Lookups by id are rare, keep the memory tier small
+                memory_size=100,
+                ttl=RAW_RESPONSE_STORE_TTL,
+                max_rows=RAW_RESPONSE_STORE_MAX_ROWS,
+            )
+        except Exception as e:
+            logger.error(f"Raw response store disabled: {e}")
+            RAW_RESPONSE_STORE_ENABLED = False
+    return _raw_response_store
+
+
+async def store_raw_response(raw_response: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Store a raw response and return its id, or None when the store is disabled"""
+    store = get_raw_response_store()
+    if not store or not raw_response:
+        return None
+    response_id = raw_response_id(raw_response)
+    try:
+        await store.aset(response_id, raw_response)
+    except Exception as e:
+        logger.error(f"Failed to store raw response: {e}")
+        return None
+    return response_id
+
+
+async def get_raw_response(response_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch a stored raw response by id; None when unknown, expired or the store is disabled"""
+    store = get_raw_response_store()
+    if not store:
+        return None
+    return await store.aget(response_id)
+
+
+if __name__ == "__main__":
+    import sys
+    import asyncio
+
+    if len(sys.argv) != 2:
+        print("usage: python shared_utils/match_details.py <raw_response_id>")
+        sys.exit(2)
+    RAW_RESPONSE_STORE_ENABLED = True
+    response = asyncio.run(get_raw_response(sys.argv[1]))
+    if response is None:
+        print(f"No raw response stored for {sys.argv[1]}")
+        sys.exit(1)
+    print(json.dumps(response, indent=2))
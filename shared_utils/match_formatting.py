@@ -0,0 +1,247 @@
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+from candidate_batch import as_records
+from match_details import project_match_details
+from ranking import rank_results
+from top_matches import DEFAULT_GOOD_K, TopMatches
+
+# Good matches shown per request; without good matches only the best bad match is shown
+RESULTS_TOP_K = int(os.getenv("RESULTS_TOP_K", str(DEFAULT_GOOD_K)))
+# "score" ranks by compatibility_score, "weighted" by the per-tenant criteria in shared_utils/ranking.py
+RANKING_MODE = os.getenv("RANKING_MODE", "score")
+
+
+def format_results(
+    compatibility_results: Union[List[Dict[str, Any]], Dict[str, Any]],
+    user_profile: Optional[Dict[str, Any]] = None,
+    top_k: Optional[int] = None,
+    ranking_mode: Optional[str] = None,
+    tenant: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Select, format and summarize kundli results given as a list or columnar batch.
+    Only the best top_k matches are formatted.
+    """
+    top_k = RESULTS_TOP_K if top_k is None else top_k
+    if (ranking_mode or RANKING_MODE) == "weighted":
+        # Ranks the columnar batch directly, decoding only the selected rows
+        return summarize_matches(
+            rank_results(user_profile or {}, compatibility_results, top_k, tenant),
+            user_profile,
+        )
+
+    selector = TopMatches(good_k=top_k)
+    selector.extend(as_records(compatibility_results))
+    return summarize_matches(selector.results(), user_profile)
+
+
+def summarize_matches(results: list, user_profile: Optional[dict] = None) -> dict:
+    """Format the selected results, best first, and analyze them"""
+    filtered_matches = [format_match(result) for result in results]
+
+    # Analyze overall results
+    analysis = analyze_compatibility_results(filtered_matches)
+
+    return {
+        "user_profile": user_profile,
+        "matches": filtered_matches,
+        "total_matches": len(filtered_matches),
+        "best_match": filtered_matches[0] if filtered_matches else None,
+        "analysis": analysis,
+    }
+
+
+def format_match(result: dict) -> dict:
+    """Build the match card for one kundli_match_agent result"""
+    match = result.get("match", {})
+    compatibility = result.get("compatibility", {})
+
+    # Calculate age if DOB is available
+    age = 0
+    if match.get("dob"):
+        try:
+            dob = datetime.strptime(match["dob"], "%Y-%m-%d")
+            current_year = datetime.now().year
+            age = current_year - dob.year
+        except Exception:
+            age = 0
+
+    # Get compatibility data
+    compatibility_score = compatibility.get("compatibility_score", 0)
+    message_type = compatibility.get("message_type", "neutral")
+
+    # Projected match details; results from older producers still carry the full raw_response
+    details = compatibility.get("details") or project_match_details(
+        compatibility.get("raw_response")
+    )
+
+    # Use the message description from API response
+    message_data = details.get("message", {})
+
+    if isinstance(message_data, dict):
+        message_description = message_data.get("description", "")
+    else:
+        message_description = compatibility.get("message", "")
+        if isinstance(message_description, dict):
+            message_description = message_description.get("description", "")
+        elif not isinstance(message_description, str):
+            message_description = ""
+
+    # Create simple compatibility level
+    compatibility_level = get_compatibility_level(compatibility_score, message_type)
+
+    # Create enhanced match card with person details and compatibility
+    formatted_match = {
+        "id": match.get("id", ""),
+        "name": match.get("name", "Unknown"),
+        "age": age,
+        "location": match.get("place", "Unknown"),
+        "occupation": match.get("occupation", "Unknown"),
+        "dob": match.get("dob", ""),
+        "tob": match.get("tob", ""),
+        "gender": match.get("gender", ""),
+        "compatibility_score": compatibility_score,
+        "compatibility_level": compatibility_level,
+        "message_type": message_type,
+        "message_description": message_description,
+        "total_points": compatibility.get("total_points", 0),
+        "maximum_points": compatibility.get("maximum_points", 36),
+        "koot_points": details.get("koot_points", {}),
+        # Astrological details for display
+        "astrological_details": extract_astrological_details(
+            details, match.get("gender", "")
+        ),
+    }
+    if compatibility.get("raw_response_id"):
+        formatted_match["raw_response_id"] = compatibility["raw_response_id"]
+    if "rank_score" in result:
+        formatted_match["rank_score"] = result["rank_score"]
+
+    return formatted_match
+
+
+def extract_astrological_details(match_details: dict, gender: str) -> dict:
+    """Extract astrological details for display"""
+    details = {}
+
+    if not match_details:
+        return details
+
+    # Get the person's info (girl_info or boy_info)
+    person_key = "girl_info" if gender == "female" else "boy_info"
+    person_info = match_details.get(person_key, {})
+
+    if person_info:
+        # Nakshatra details
+        nakshatra = person_info.get("nakshatra", {})
+        if nakshatra:
+            details["nakshatra"] = {
+                "name": nakshatra.get("name", ""),
+                "lord": nakshatra.get("lord", {}).get("name", ""),
+                "pada": nakshatra.get("pada", ""),
+            }
+
+        # Rashi details
+        rashi = person_info.get("rasi", {})
+        if rashi:
+            details["rashi"] = {
+                "name": rashi.get("name", ""),
+                "lord": rashi.get("lord", {}).get("name", ""),
+            }
+
+        # Koot details
+        koot = person_info.get("koot", {})
+        if koot:
+            details["koot"] = {
+                "varna": koot.get("varna", ""),
+                "gana": koot.get("gana", ""),
+                "nadi": koot.get("nadi", ""),
+            }
+
+    return details
+
+
+def get_compatibility_level(score: int, message_type: str) -> str:
+    """Get simple compatibility level based on score and message type"""
+
+    if message_type == "not-preferable":
+        return "Not Recommended"
+    elif score >= 70:
+        return "Good Compatibility"
+    elif score >= 50:
+        return "Moderate Compatibility"
+    else:
+        return "Low Compatibility"
+
+
+def analyze_compatibility_results(matches: list) -> dict:
+    """Analyze overall compatibility results"""
+
+    if not matches:
+        return {
+            "overall_assessment": "No matches found",
+            "recommendation": "Try adjusting your search criteria or adding more profiles to the database.",
+            "message": "We couldn't find any compatible matches in our database.",
+        }
+
+    # Calculate statistics
+    scores = [match["compatibility_score"] for match in matches]
+    avg_score = sum(scores) / len(scores) if scores else 0
+    max_score = max(scores) if scores else 0
+    min_score = min(scores) if scores else 0
+
+    # Count by categories
+    good_matches = len([m for m in matches if m["compatibility_score"] >= 70])
+    moderate_matches = len([m for m in matches if 50 <= m["compatibility_score"] < 70])
+    low_matches = len([m for m in matches if m["compatibility_score"] < 50])
+
+    # Determine overall assessment and filtering message
+    if good_matches > 0:
+        overall_assessment = f"Found {good_matches} good match(es)"
+        recommendation = "You have some compatible matches. Consider these top choices."
+        filtering_message = f"Showing top {min(good_matches, 5)} good matches out of available profiles."
+    elif moderate_matches > 0:
+        overall_assessment = f"Found {moderate_matches} moderate match(es)"
+        recommendation = "Some matches show potential. Consider consulting an astrologer for guidance."
+        filtering_message = f"Showing top {min(moderate_matches, 5)} moderate matches out of available profiles."
+    else:
+        overall_assessment = "Limited compatibility found"
+        recommendation = "The available matches have low compatibility. Consider consulting an astrologer."
+        filtering_message = (
+            "Showing the best available match despite low compatibility."
+        )
+
+    # Create analysis
+    analysis = {
+        "overall_assessment": overall_assessment,
+        "recommendation": recommendation,
+        "filtering_message": filtering_message,
+        "statistics": {
+            "total_matches": len(matches),
+            "average_score": round(avg_score, 1),
+            "highest_score": max_score,
+            "lowest_score": min_score,
+            "good_matches": good_matches,
+            "moderate_matches": moderate_matches,
+            "low_matches": low_matches,
+        },
+        "message": generate_analysis_message(matches, avg_score, max_score),
+    }
+
+    return analysis
+
+
+def generate_analysis_message(matches: list, avg_score: float, max_score: int) -> str:
+    """Generate analysis message based on actual data"""
+
+    if not matches:
+        return "No matches were found in our database."
+
+    if max_score >= 70:
+        return f"Your best match has a {max_score}% compatibility score."
+    elif max_score >= 50:
+        return f"Your best match shows {max_score}% compatibility."
+    else:
+        return f"Your best match shows {max_score}% compatibility. Consider consulting an astrologer for guidance."
@@ -0,0 +1,156 @@
+import time
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from geocode import geocode_place
+from profile_store import attach_astro_features, profile_store
+from compatibility_matrix import get_compatibility_matrix
+from candidate_search import candidate_filters, get_profiles, stream_profiles
+from kundli_scoring import KUNDLI_MATCH_BACKEND, score_candidates
+from match_formatting import (
+    RANKING_MODE,
+    RESULTS_TOP_K,
+    format_results,
+    summarize_matches,
+)
+from top_matches import TopMatches
+
+logger = logging.getLogger(__name__)
+
+
+async def geocode_profile(user_profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add 'lat' and 'lon' for the profile's place and register the profile in
+    the store (and the compatibility matrix) if it is new.
+
+    Returns the enriched copy, or {'error': ...}.
+    """
+    place = user_profile.get("place", "")
+    try:
+        coordinates = await geocode_place(place)
+        if coordinates:
+            lat, lon = coordinates["lat"], coordinates["lon"]
+            enriched_profile = user_profile.copy()
+            enriched_profile["lat"] = lat
+            enriched_profile["lon"] = lon
+
+            # Insert into the profile store if not already present (by identity hash)
+            try:
+                if profile_store.configured:
+                    profile_id, inserted = await profile_store.upsert_profile(
+                        enriched_profile
+                    )
+                    # Score only the new profile's row/column of the precomputed matrix
+                    matrix = get_compatibility_matrix() if inserted else None
+                    if matrix:
+                        await asyncio.to_thread(
+                            matrix.add_profile, {**enriched_profile, "id": profile_id}
+                        )
+            except Exception:
+                # Log error without exposing sensitive info
+                logging.warning("Profile insert skipped or failed.")
+
+            return enriched_profile
+        else:
+            return {"error": f"No coordinates found for {place}"}
+    except Exception as e:
+        return {"error": f"Geocoding failed: {str(e)}"}
+
+
+@contextmanager
+def _stage(timings: Dict[str, float], name: str) -> Iterator[None]:
+    """Add the time spent in the block to timings[name] (milliseconds)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+
+async def run_pipeline(
+    user_profile: Dict[str, Any],
+    filters: Optional[Dict[str, Any]] = None,
+    top_k: Optional[int] = None,
+    max_paid_calls: Optional[int] = None,
+    results_top_k: Optional[int] = None,
+    ranking_mode: Optional[str] = None,
+    tenant: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Geocode, attach astro features, filter, score and format in one process.
+
+    Returns what results_formatter_agent returns for the same profile, plus
+    'timings' with the milliseconds spent per stage and 'candidates_scored'.
+    With the local backend and score ranking, candidate chunks are scored as
+    the store yields them and only the best matches are kept; otherwise all
+    candidates are collected first, as top-K Prokerala selection and
+    weighted ranking need the full set.
+    """
+    timings: Dict[str, float] = {}
+    ranking_mode = ranking_mode or RANKING_MODE
+    results_top_k = RESULTS_TOP_K if results_top_k is None else results_top_k
+
+    def timed(response: Dict[str, Any]) -> Dict[str, Any]:
+        timings["total"] = sum(timings.values())
+        response["timings"] = {name: round(ms, 1) for name, ms in timings.items()}
+        return response
+
+    with _stage(timings, "geocode"):
+        profile = await geocode_profile(user_profile)
+    if "error" in profile:
+        return timed(profile)
+
+    with _stage(timings, "astro"):
+        profile = await attach_astro_features(profile)
+
+    selection = candidate_filters(profile, **(filters or {}))
+    if isinstance(selection, dict):
+        return timed(selection)
+    opposite_gender, store_filters = selection
+    if not profile_store.configured:
+        logger.error("Profile store not available")
+        return timed({"error": "Profile store not available"})
+
+    scored = 0
+    if KUNDLI_MATCH_BACKEND == "local" and ranking_mode != "weighted":
+        selector = TopMatches(good_k=results_top_k)
+        chunks = stream_profiles(opposite_gender, store_filters)
+        while True:
+            with _stage(timings, "filter"):
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    chunk = None
+                except Exception as e:
+                    # As in get_profiles, matches of a partial scan are not returned
+                    logger.error(f"Error fetching profiles from profile store: {e}")
+                    return timed({"error": "Failed to fetch candidate profiles"})
+            if chunk is None:
+                break
+            with _stage(timings, "score"):
+                selector.extend(await score_candidates(profile, chunk))
+            scored += len(chunk)
+            # Let other requests run between chunks
+            await asyncio.sleep(0)
+        with _stage(timings, "format"):
+            response = summarize_matches(selector.results(), profile)
+    else:
+        with _stage(timings, "filter"):
+            candidates = await get_profiles(opposite_gender, store_filters)
+        if isinstance(candidates, dict):
+            return timed(candidates)
+        with _stage(timings, "score"):
+            results = await score_candidates(profile, candidates, top_k, max_paid_calls)
+        scored = len(candidates)
+        with _stage(timings, "format"):
+            response = format_results(
+                results, profile, results_top_k, ranking_mode, tenant
+            )
+
+    logger.info(
+        f"Pipeline scored {scored} candidates in {sum(timings.values()):.0f} ms"
+    )
+    response["candidates_scored"] = scored
+    return timed(response)
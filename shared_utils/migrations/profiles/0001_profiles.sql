@@ -0,0 +1,16 @@
+-- Profiles table as used by geocode_agent and filter_profile_agent.
+-- Existing Supabase tables are left as they are.
+CREATE TABLE IF NOT EXISTS profiles (
+    id BIGSERIAL PRIMARY KEY,
+    name TEXT,
+    dob DATE,
+    tob TIME,
+    place TEXT,
+    gender TEXT,
+    occupation TEXT,
+    lat DOUBLE PRECISION,
+    lon DOUBLE PRECISION,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS profiles_gender_idx ON profiles (gender);
@@ -0,0 +1,3 @@
+-- Keyset pagination of candidates: WHERE gender = $1 AND id > $2 ORDER BY id
+CREATE INDEX IF NOT EXISTS profiles_gender_id_idx ON profiles (gender, id);
+DROP INDEX IF EXISTS profiles_gender_idx;
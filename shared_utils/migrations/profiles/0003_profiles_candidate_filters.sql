@@ -0,0 +1,9 @@
+-- Indexed candidate prefilters: distance via 1-degree grid cells, age via dob, occupation.
+-- geo_cell = floor(lat + 90) * 360 + floor(lon + 180) mod 360; must match profile_store.geo_cells().
+ALTER TABLE profiles ADD COLUMN IF NOT EXISTS geo_cell INTEGER GENERATED ALWAYS AS (
+    floor(lat + 90)::int * 360 + mod(floor(lon + 180)::int, 360)
+) STORED;
+
+CREATE INDEX IF NOT EXISTS profiles_gender_geo_cell_idx ON profiles (gender, geo_cell);
+CREATE INDEX IF NOT EXISTS profiles_gender_dob_idx ON profiles (gender, dob);
+CREATE INDEX IF NOT EXISTS profiles_gender_occupation_idx ON profiles (gender, lower(occupation));
@@ -0,0 +1,135 @@
+-- Precomputed moon features of each profile and the Ashtakoot score of every
+-- nakshatra-pada pair, so guna filters become an indexed join.
+-- nakshatra_pada = moon_nakshatra * 4 + moon_pada - 1 (0-107).
+ALTER TABLE profiles
+    ADD COLUMN IF NOT EXISTS moon_nakshatra SMALLINT,
+    ADD COLUMN IF NOT EXISTS moon_pada SMALLINT,
+    ADD COLUMN IF NOT EXISTS moon_rasi SMALLINT,
+    ADD COLUMN IF NOT EXISTS nakshatra_pada SMALLINT;
+
+CREATE INDEX IF NOT EXISTS profiles_gender_nakshatra_pada_idx ON profiles (gender, nakshatra_pada);
+
+-- Total Guna Milan points (0-36) by boy and girl nakshatra-pada; generated
+-- from ashtakoot.PADA_POINTS, one array of 108 girl scores per boy_pada.
+-- The primary key serves "girl_pada WHERE boy_pada = $1 AND points >= $2".
+CREATE TABLE IF NOT EXISTS guna_scores (
+    boy_pada SMALLINT NOT NULL,
+    girl_pada SMALLINT NOT NULL,
+    points REAL NOT NULL,
+    PRIMARY KEY (boy_pada, girl_pada)
+);
+
+INSERT INTO guna_scores (boy_pada, girl_pada, points)
+SELECT row_scores.boy_pada, scores.ordinality - 1, scores.points
+FROM (VALUES
+    (0, '{28,28,28,28,34,34,34,34,27.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,24.5,24.5,28,28,19,19,19,19,19,19,19,21.5,29.5,29.5,29.5,29.5,26,26,26,26,20.5,20.5,20.5,20.5,25.5,25.5,25.5,25.5,15,11,11,11,10,10,10,10,14,14,23.5,23.5,27.5,27.5,27.5,27.5,23.5,23.5,23.5,17.5,24.5,24.5,24.5,24.5,13,13,13,13,13,13,13,13,27,27,27,27,24.5,28,28,28,29,29,29,29,22,22,21,21,16,16,16,16,18,18,18,14.5,22.5,22.5,22.5,22.5,25,25,25,25}'),
+    (1, '{28,28,28,28,34,34,34,34,27.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,24.5,24.5,28,28,19,19,19,19,19,19,19,21.5,29.5,29.5,29.5,29.5,26,26,26,26,20.5,20.5,20.5,20.5,25.5,25.5,25.5,25.5,15,11,11,11,10,10,10,10,14,14,23.5,23.5,27.5,27.5,27.5,27.5,23.5,23.5,23.5,17.5,24.5,24.5,24.5,24.5,13,13,13,13,13,13,13,13,27,27,27,27,24.5,28,28,28,29,29,29,29,22,22,21,21,16,16,16,16,18,18,18,14.5,22.5,22.5,22.5,22.5,25,25,25,25}'),
+    (2, '{28,28,28,28,34,34,34,34,27.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,24.5,24.5,28,28,19,19,19,19,19,19,19,21.5,29.5,29.5,29.5,29.5,26,26,26,26,20.5,20.5,20.5,20.5,25.5,25.5,25.5,25.5,15,11,11,11,10,10,10,10,14,14,23.5,23.5,27.5,27.5,27.5,27.5,23.5,23.5,23.5,17.5,24.5,24.5,24.5,24.5,13,13,13,13,13,13,13,13,27,27,27,27,24.5,28,28,28,29,29,29,29,22,22,21,21,16,16,16,16,18,18,18,14.5,22.5,22.5,22.5,22.5,25,25,25,25}'),
+    (3, '{28,28,28,28,34,34,34,34,27.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,24.5,24.5,28,28,19,19,19,19,19,19,19,21.5,29.5,29.5,29.5,29.5,26,26,26,26,20.5,20.5,20.5,20.5,25.5,25.5,25.5,25.5,15,11,11,11,10,10,10,10,14,14,23.5,23.5,27.5,27.5,27.5,27.5,23.5,23.5,23.5,17.5,24.5,24.5,24.5,24.5,13,13,13,13,13,13,13,13,27,27,27,27,24.5,28,28,28,29,29,29,29,22,22,21,21,16,16,16,16,18,18,18,14.5,22.5,22.5,22.5,22.5,25,25,25,25}'),
+    (4, '{33,33,33,33,28,28,28,28,29,20,20,20,24.5,24.5,24.5,24.5,15.5,15.5,19,19,27,27,27,27,26,26,26,28.5,21.5,21.5,21.5,21.5,23.5,23.5,23.5,23.5,19.5,19.5,19.5,19.5,17.5,17.5,17.5,17.5,25.5,21.5,21.5,21.5,20,20,20,20,5,5,14.5,14.5,29.5,29.5,29.5,29.5,22.5,22.5,22.5,16.5,14.5,14.5,14.5,14.5,17.5,17.5,17.5,17.5,20,20,20,20,19,19,19,19,26,29.5,29.5,29.5,28,28,28,28,12,12,11,11,21,21,21,21,25,25,25,21.5,15.5,15.5,15.5,15.5,24.5,24.5,24.5,24.5}'),
+    (5, '{33,33,33,33,28,28,28,28,29,20,20,20,24.5,24.5,24.5,24.5,15.5,15.5,19,19,27,27,27,27,26,26,26,28.5,21.5,21.5,21.5,21.5,23.5,23.5,23.5,23.5,19.5,19.5,19.5,19.5,17.5,17.5,17.5,17.5,25.5,21.5,21.5,21.5,20,20,20,20,5,5,14.5,14.5,29.5,29.5,29.5,29.5,22.5,22.5,22.5,16.5,14.5,14.5,14.5,14.5,17.5,17.5,17.5,17.5,20,20,20,20,19,19,19,19,26,29.5,29.5,29.5,28,28,28,28,12,12,11,11,21,21,21,21,25,25,25,21.5,15.5,15.5,15.5,15.5,24.5,24.5,24.5,24.5}'),
+    (6, '{33,33,33,33,28,28,28,28,29,20,20,20,24.5,24.5,24.5,24.5,15.5,15.5,19,19,27,27,27,27,26,26,26,28.5,21.5,21.5,21.5,21.5,23.5,23.5,23.5,23.5,19.5,19.5,19.5,19.5,17.5,17.5,17.5,17.5,25.5,21.5,21.5,21.5,20,20,20,20,5,5,14.5,14.5,29.5,29.5,29.5,29.5,22.5,22.5,22.5,16.5,14.5,14.5,14.5,14.5,17.5,17.5,17.5,17.5,20,20,20,20,19,19,19,19,26,29.5,29.5,29.5,28,28,28,28,12,12,11,11,21,21,21,21,25,25,25,21.5,15.5,15.5,15.5,15.5,24.5,24.5,24.5,24.5}'),
+    (7, '{33,33,33,33,28,28,28,28,29,20,20,20,24.5,24.5,24.5,24.5,15.5,15.5,19,19,27,27,27,27,26,26,26,28.5,21.5,21.5,21.5,21.5,23.5,23.5,23.5,23.5,19.5,19.5,19.5,19.5,17.5,17.5,17.5,17.5,25.5,21.5,21.5,21.5,20,20,20,20,5,5,14.5,14.5,29.5,29.5,29.5,29.5,22.5,22.5,22.5,16.5,14.5,14.5,14.5,14.5,17.5,17.5,17.5,17.5,20,20,20,20,19,19,19,19,26,29.5,29.5,29.5,28,28,28,28,12,12,11,11,21,21,21,21,25,25,25,21.5,15.5,15.5,15.5,15.5,24.5,24.5,24.5,24.5}'),
+    (8, '{27.5,27.5,27.5,27.5,29,29,29,29,28,19,19,19,11,11,11,11,18.5,18.5,22,22,20,20,20,20,22,22,22,24.5,26.5,26.5,26.5,26.5,21.5,21.5,21.5,21.5,15,15,15,15,18.5,18.5,18.5,18.5,20.5,16.5,16.5,16.5,17.5,17.5,17.5,17.5,19,19,28.5,28.5,17.5,17.5,17.5,17.5,20.5,20.5,20.5,14.5,18.5,18.5,18.5,18.5,23.5,23.5,23.5,23.5,23.5,23.5,23.5,23.5,18,18,18,18,13,16.5,16.5,16.5,14.5,14.5,14.5,14.5,27,27,26,26,27,27,27,27,20,20,20,16.5,18.5,18.5,18.5,18.5,11.5,11.5,11.5,11.5}'),
+    (9, '{17.5,17.5,17.5,17.5,19,19,19,19,18,28,28,28,20,20,20,20,27.5,27.5,19.5,19.5,17.5,17.5,17.5,17.5,19.5,19.5,19.5,21,23,23,23,23,18,18,18,18,16,16,16,16,19.5,19.5,19.5,19.5,21.5,21,21,21,22,22,22,22,23.5,23.5,23.5,23.5,12.5,12.5,12.5,12.5,15.5,15.5,15.5,19.5,23.5,23.5,23.5,23.5,28.5,28.5,28.5,28.5,18,18,18,18,12.5,12.5,12.5,12.5,7.5,14,14,14,12,12,12,12,24.5,24.5,30.5,30.5,31.5,31.5,31.5,31.5,24.5,24.5,24.5,19,21,21,21,21,14,14,14,14}'),
+    (10, '{17.5,17.5,17.5,17.5,19,19,19,19,18,28,28,28,20,20,20,20,27.5,27.5,19.5,19.5,17.5,17.5,17.5,17.5,19.5,19.5,19.5,21,23,23,23,23,18,18,18,18,16,16,16,16,19.5,19.5,19.5,19.5,21.5,21,21,21,22,22,22,22,23.5,23.5,23.5,23.5,12.5,12.5,12.5,12.5,15.5,15.5,15.5,19.5,23.5,23.5,23.5,23.5,28.5,28.5,28.5,28.5,18,18,18,18,12.5,12.5,12.5,12.5,7.5,14,14,14,12,12,12,12,24.5,24.5,30.5,30.5,31.5,31.5,31.5,31.5,24.5,24.5,24.5,19,21,21,21,21,14,14,14,14}'),
+    (11, '{17.5,17.5,17.5,17.5,19,19,19,19,18,28,28,28,20,20,20,20,27.5,27.5,19.5,19.5,17.5,17.5,17.5,17.5,19.5,19.5,19.5,21,23,23,23,23,18,18,18,18,16,16,16,16,19.5,19.5,19.5,19.5,21.5,21,21,21,22,22,22,22,23.5,23.5,23.5,23.5,12.5,12.5,12.5,12.5,15.5,15.5,15.5,19.5,23.5,23.5,23.5,23.5,28.5,28.5,28.5,28.5,18,18,18,18,12.5,12.5,12.5,12.5,7.5,14,14,14,12,12,12,12,24.5,24.5,30.5,30.5,31.5,31.5,31.5,31.5,24.5,24.5,24.5,19,21,21,21,21,14,14,14,14}'),
+    (12, '{22.5,22.5,22.5,22.5,23.5,23.5,23.5,23.5,10,20,20,20,28,28,28,28,35,35,27,27,24.5,24.5,24.5,24.5,22.5,22.5,22.5,24,25,25,25,25,11,11,11,11,10,10,10,10,24,24,24,24,25.5,25,25,25,24,24,24,24,20,20,20,20,14.5,14.5,14.5,14.5,10.5,10.5,10.5,14.5,27.5,27.5,27.5,27.5,22.5,22.5,22.5,22.5,13,13,13,13,19,19,19,19,10.5,17,17,17,18,18,18,18,21,21,27,27,26.5,26.5,26.5,26.5,31.5,31.5,31.5,26,25,25,25,25,18,18,18,18}'),
+    (13, '{22.5,22.5,22.5,22.5,23.5,23.5,23.5,23.5,10,20,20,20,28,28,28,28,35,35,27,27,24.5,24.5,24.5,24.5,22.5,22.5,22.5,24,25,25,25,25,11,11,11,11,10,10,10,10,24,24,24,24,25.5,25,25,25,24,24,24,24,20,20,20,20,14.5,14.5,14.5,14.5,10.5,10.5,10.5,14.5,27.5,27.5,27.5,27.5,22.5,22.5,22.5,22.5,13,13,13,13,19,19,19,19,10.5,17,17,17,18,18,18,18,21,21,27,27,26.5,26.5,26.5,26.5,31.5,31.5,31.5,26,25,25,25,25,18,18,18,18}'),
+    (14, '{22.5,22.5,22.5,22.5,23.5,23.5,23.5,23.5,10,20,20,20,28,28,28,28,35,35,27,27,24.5,24.5,24.5,24.5,22.5,22.5,22.5,24,25,25,25,25,11,11,11,11,10,10,10,10,24,24,24,24,25.5,25,25,25,24,24,24,24,20,20,20,20,14.5,14.5,14.5,14.5,10.5,10.5,10.5,14.5,27.5,27.5,27.5,27.5,22.5,22.5,22.5,22.5,13,13,13,13,19,19,19,19,10.5,17,17,17,18,18,18,18,21,21,27,27,26.5,26.5,26.5,26.5,31.5,31.5,31.5,26,25,25,25,25,18,18,18,18}'),
+    (15, '{22.5,22.5,22.5,22.5,23.5,23.5,23.5,23.5,10,20,20,20,28,28,28,28,35,35,27,27,24.5,24.5,24.5,24.5,22.5,22.5,22.5,24,25,25,25,25,11,11,11,11,10,10,10,10,24,24,24,24,25.5,25,25,25,24,24,24,24,20,20,20,20,14.5,14.5,14.5,14.5,10.5,10.5,10.5,14.5,27.5,27.5,27.5,27.5,22.5,22.5,22.5,22.5,13,13,13,13,19,19,19,19,10.5,17,17,17,18,18,18,18,21,21,27,27,26.5,26.5,26.5,26.5,31.5,31.5,31.5,26,25,25,25,25,18,18,18,18}'),
+    (16, '{23.5,23.5,23.5,23.5,15.5,15.5,15.5,15.5,17.5,27.5,27.5,27.5,36,36,36,36,28,28,20,20,26,26,26,26,23.5,23.5,23.5,25,18,18,18,18,20,20,20,20,19,19,19,19,16,16,16,16,24,23.5,23.5,23.5,25,25,25,25,13,13,13,13,25,25,25,25,19.5,19.5,19.5,23.5,20.5,20.5,20.5,20.5,23.5,23.5,23.5,23.5,14,14,14,14,11,11,11,11,17,23.5,23.5,23.5,27,27,27,27,14,14,20,20,29,29,29,29,31.5,31.5,31.5,26,17,17,17,17,27,27,27,27}'),
+    (17, '{23.5,23.5,23.5,23.5,15.5,15.5,15.5,15.5,17.5,27.5,27.5,27.5,36,36,36,36,28,28,20,20,26,26,26,26,23.5,23.5,23.5,25,18,18,18,18,20,20,20,20,19,19,19,19,16,16,16,16,24,23.5,23.5,23.5,25,25,25,25,13,13,13,13,25,25,25,25,19.5,19.5,19.5,23.5,20.5,20.5,20.5,20.5,23.5,23.5,23.5,23.5,14,14,14,14,11,11,11,11,17,23.5,23.5,23.5,27,27,27,27,14,14,20,20,29,29,29,29,31.5,31.5,31.5,26,17,17,17,17,27,27,27,27}'),
+    (18, '{26,26,26,26,18,18,18,18,20,17.5,17.5,17.5,26,26,26,26,18,18,28,28,34,34,34,34,31.5,31.5,31.5,18,11,11,11,11,13,13,13,13,22.5,22.5,22.5,22.5,19.5,19.5,19.5,19.5,27.5,30.5,30.5,30.5,32,32,32,32,20,20,14,14,26,26,26,26,20.5,20.5,20.5,14,11,11,11,11,14,14,14,14,22,22,22,22,19,19,19,19,25,19.5,19.5,19.5,23,23,23,23,10,10,13,13,22,22,22,22,24.5,24.5,24.5,25.5,16.5,16.5,16.5,16.5,26.5,26.5,26.5,26.5}'),
+    (19, '{26,26,26,26,18,18,18,18,20,17.5,17.5,17.5,26,26,26,26,18,18,28,28,34,34,34,34,31.5,31.5,31.5,18,11,11,11,11,13,13,13,13,22.5,22.5,22.5,22.5,19.5,19.5,19.5,19.5,27.5,30.5,30.5,30.5,32,32,32,32,20,20,14,14,26,26,26,26,20.5,20.5,20.5,14,11,11,11,11,14,14,14,14,22,22,22,22,19,19,19,19,25,19.5,19.5,19.5,23,23,23,23,10,10,13,13,22,22,22,22,24.5,24.5,24.5,25.5,16.5,16.5,16.5,16.5,26.5,26.5,26.5,26.5}'),
+    (20, '{16,16,16,16,25,25,25,25,18,15.5,15.5,15.5,22.5,22.5,22.5,22.5,23,23,33,33,28,28,28,28,25,25,25,11.5,17,17,17,17,13,13,13,13,21.5,21.5,21.5,21.5,27.5,27.5,27.5,27.5,20.5,23.5,23.5,23.5,22.5,22.5,22.5,22.5,26,26,20,20,26,26,26,26,20,20,20,13.5,16,16,16,16,3,3,3,3,15,15,15,15,27,27,27,27,26,20.5,20.5,20.5,20.5,20.5,20.5,20.5,16,16,19,19,12,12,12,12,17,17,17,18,25.5,25.5,25.5,25.5,24.5,24.5,24.5,24.5}'),
+    (21, '{16,16,16,16,25,25,25,25,18,15.5,15.5,15.5,22.5,22.5,22.5,22.5,23,23,33,33,28,28,28,28,25,25,25,11.5,17,17,17,17,13,13,13,13,21.5,21.5,21.5,21.5,27.5,27.5,27.5,27.5,20.5,23.5,23.5,23.5,22.5,22.5,22.5,22.5,26,26,20,20,26,26,26,26,20,20,20,13.5,16,16,16,16,3,3,3,3,15,15,15,15,27,27,27,27,26,20.5,20.5,20.5,20.5,20.5,20.5,20.5,16,16,19,19,12,12,12,12,17,17,17,18,25.5,25.5,25.5,25.5,24.5,24.5,24.5,24.5}'),
+    (22, '{16,16,16,16,25,25,25,25,18,15.5,15.5,15.5,22.5,22.5,22.5,22.5,23,23,33,33,28,28,28,28,25,25,25,11.5,17,17,17,17,13,13,13,13,21.5,21.5,21.5,21.5,27.5,27.5,27.5,27.5,20.5,23.5,23.5,23.5,22.5,22.5,22.5,22.5,26,26,20,20,26,26,26,26,20,20,20,13.5,16,16,16,16,3,3,3,3,15,15,15,15,27,27,27,27,26,20.5,20.5,20.5,20.5,20.5,20.5,20.5,16,16,19,19,12,12,12,12,17,17,17,18,25.5,25.5,25.5,25.5,24.5,24.5,24.5,24.5}'),
+    (23, '{16,16,16,16,25,25,25,25,18,15.5,15.5,15.5,22.5,22.5,22.5,22.5,23,23,33,33,28,28,28,28,25,25,25,11.5,17,17,17,17,13,13,13,13,21.5,21.5,21.5,21.5,27.5,27.5,27.5,27.5,20.5,23.5,23.5,23.5,22.5,22.5,22.5,22.5,26,26,20,20,26,26,26,26,20,20,20,13.5,16,16,16,16,3,3,3,3,15,15,15,15,27,27,27,27,26,20.5,20.5,20.5,20.5,20.5,20.5,20.5,16,16,19,19,12,12,12,12,17,17,17,18,25.5,25.5,25.5,25.5,24.5,24.5,24.5,24.5}'),
+    (24, '{17,17,17,17,25,25,25,25,20,17.5,17.5,17.5,21.5,21.5,21.5,21.5,21.5,21.5,31.5,31.5,26,26,26,26,28,28,28,14.5,20.5,20.5,20.5,20.5,16,16,16,16,21.5,21.5,21.5,21.5,26.5,26.5,26.5,26.5,20.5,23.5,23.5,23.5,23.5,23.5,23.5,23.5,25.5,25.5,19.5,19.5,27,27,27,27,21,21,21,14.5,21.5,21.5,21.5,21.5,7,7,7,7,14,14,14,14,28,28,28,28,27,21.5,21.5,21.5,22.5,22.5,22.5,22.5,15.5,15.5,18.5,18.5,13,13,13,13,17,17,17,18,27,27,27,27,25.5,25.5,25.5,25.5}'),
+    (25, '{17,17,17,17,25,25,25,25,20,17.5,17.5,17.5,21.5,21.5,21.5,21.5,21.5,21.5,31.5,31.5,26,26,26,26,28,28,28,14.5,20.5,20.5,20.5,20.5,16,16,16,16,21.5,21.5,21.5,21.5,26.5,26.5,26.5,26.5,20.5,23.5,23.5,23.5,23.5,23.5,23.5,23.5,25.5,25.5,19.5,19.5,27,27,27,27,21,21,21,14.5,21.5,21.5,21.5,21.5,7,7,7,7,14,14,14,14,28,28,28,28,27,21.5,21.5,21.5,22.5,22.5,22.5,22.5,15.5,15.5,18.5,18.5,13,13,13,13,17,17,17,18,27,27,27,27,25.5,25.5,25.5,25.5}'),
+    (26, '{17,17,17,17,25,25,25,25,20,17.5,17.5,17.5,21.5,21.5,21.5,21.5,21.5,21.5,31.5,31.5,26,26,26,26,28,28,28,14.5,20.5,20.5,20.5,20.5,16,16,16,16,21.5,21.5,21.5,21.5,26.5,26.5,26.5,26.5,20.5,23.5,23.5,23.5,23.5,23.5,23.5,23.5,25.5,25.5,19.5,19.5,27,27,27,27,21,21,21,14.5,21.5,21.5,21.5,21.5,7,7,7,7,14,14,14,14,28,28,28,28,27,21.5,21.5,21.5,22.5,22.5,22.5,22.5,15.5,15.5,18.5,18.5,13,13,13,13,17,17,17,18,27,27,27,27,25.5,25.5,25.5,25.5}'),
+    (27, '{22.5,22.5,22.5,22.5,30.5,30.5,30.5,30.5,25.5,22,22,22,26,26,26,26,26,26,19,19,13.5,13.5,13.5,13.5,15.5,15.5,15.5,28,34,34,34,34,29.5,29.5,29.5,29.5,17.5,17.5,17.5,17.5,22.5,22.5,22.5,22.5,16.5,19,19,19,19,19,19,19,21,21,20.5,20.5,28,28,28,28,22,22,22,19,26,26,26,26,11.5,11.5,11.5,11.5,10,10,10,10,24,24,24,24,23,27,27,27,28,28,28,28,21,21,13.5,13.5,8,8,8,8,12,12,12,17,26,26,26,26,24.5,24.5,24.5,24.5}'),
+    (28, '{30.5,30.5,30.5,30.5,23.5,23.5,23.5,23.5,27.5,24,24,24,27,27,27,27,19,19,12,12,19,19,19,19,21.5,21.5,21.5,34,28,28,28,28,29,29,29,29,18.5,18.5,18.5,18.5,15.5,15.5,15.5,15.5,25.5,28,28,28,28,28,28,28,13,13,12.5,12.5,27.5,27.5,27.5,27.5,22,22,22,19,17,17,17,17,20,20,20,20,17,17,17,17,13,13,13,13,24,28,28,28,25,25,25,25,13,13,5.5,5.5,14.5,14.5,14.5,14.5,20,20,20,25,19,19,19,19,27,27,27,27}'),
+    (29, '{30.5,30.5,30.5,30.5,23.5,23.5,23.5,23.5,27.5,24,24,24,27,27,27,27,19,19,12,12,19,19,19,19,21.5,21.5,21.5,34,28,28,28,28,29,29,29,29,18.5,18.5,18.5,18.5,15.5,15.5,15.5,15.5,25.5,28,28,28,28,28,28,28,13,13,12.5,12.5,27.5,27.5,27.5,27.5,22,22,22,19,17,17,17,17,20,20,20,20,17,17,17,17,13,13,13,13,24,28,28,28,25,25,25,25,13,13,5.5,5.5,14.5,14.5,14.5,14.5,20,20,20,25,19,19,19,19,27,27,27,27}'),
+    (30, '{30.5,30.5,30.5,30.5,23.5,23.5,23.5,23.5,27.5,24,24,24,27,27,27,27,19,19,12,12,19,19,19,19,21.5,21.5,21.5,34,28,28,28,28,29,29,29,29,18.5,18.5,18.5,18.5,15.5,15.5,15.5,15.5,25.5,28,28,28,28,28,28,28,13,13,12.5,12.5,27.5,27.5,27.5,27.5,22,22,22,19,17,17,17,17,20,20,20,20,17,17,17,17,13,13,13,13,24,28,28,28,25,25,25,25,13,13,5.5,5.5,14.5,14.5,14.5,14.5,20,20,20,25,19,19,19,19,27,27,27,27}'),
+    (31, '{30.5,30.5,30.5,30.5,23.5,23.5,23.5,23.5,27.5,24,24,24,27,27,27,27,19,19,12,12,19,19,19,19,21.5,21.5,21.5,34,28,28,28,28,29,29,29,29,18.5,18.5,18.5,18.5,15.5,15.5,15.5,15.5,25.5,28,28,28,28,28,28,28,13,13,12.5,12.5,27.5,27.5,27.5,27.5,22,22,22,19,17,17,17,17,20,20,20,20,17,17,17,17,13,13,13,13,24,28,28,28,25,25,25,25,13,13,5.5,5.5,14.5,14.5,14.5,14.5,20,20,20,25,19,19,19,19,27,27,27,27}'),
+    (32, '{27,27,27,27,24.5,24.5,24.5,24.5,22.5,19,19,19,12,12,12,12,21,21,14,14,14,14,14,14,17,17,17,29.5,29,29,29,29,28,28,28,28,16,16,16,16,16.5,16.5,16.5,16.5,18.5,21,21,21,22,22,22,22,26,26,25.5,25.5,13.5,13.5,13.5,13.5,17.5,17.5,17.5,14.5,21,21,21,21,26,26,26,26,24.5,24.5,24.5,24.5,18,18,18,18,9,13,13,13,15,15,15,15,26,26,18.5,18.5,19.5,19.5,19.5,19.5,12.5,12.5,12.5,17.5,20,20,20,20,13,13,13,13}'),
+    (33, '{27,27,27,27,24.5,24.5,24.5,24.5,22.5,19,19,19,12,12,12,12,21,21,14,14,14,14,14,14,17,17,17,29.5,29,29,29,29,28,28,28,28,16,16,16,16,16.5,16.5,16.5,16.5,18.5,21,21,21,22,22,22,22,26,26,25.5,25.5,13.5,13.5,13.5,13.5,17.5,17.5,17.5,14.5,21,21,21,21,26,26,26,26,24.5,24.5,24.5,24.5,18,18,18,18,9,13,13,13,15,15,15,15,26,26,18.5,18.5,19.5,19.5,19.5,19.5,12.5,12.5,12.5,17.5,20,20,20,20,13,13,13,13}'),
+    (34, '{27,27,27,27,24.5,24.5,24.5,24.5,22.5,19,19,19,12,12,12,12,21,21,14,14,14,14,14,14,17,17,17,29.5,29,29,29,29,28,28,28,28,16,16,16,16,16.5,16.5,16.5,16.5,18.5,21,21,21,22,22,22,22,26,26,25.5,25.5,13.5,13.5,13.5,13.5,17.5,17.5,17.5,14.5,21,21,21,21,26,26,26,26,24.5,24.5,24.5,24.5,18,18,18,18,9,13,13,13,15,15,15,15,26,26,18.5,18.5,19.5,19.5,19.5,19.5,12.5,12.5,12.5,17.5,20,20,20,20,13,13,13,13}'),
+    (35, '{27,27,27,27,24.5,24.5,24.5,24.5,22.5,19,19,19,12,12,12,12,21,21,14,14,14,14,14,14,17,17,17,29.5,29,29,29,29,28,28,28,28,16,16,16,16,16.5,16.5,16.5,16.5,18.5,21,21,21,22,22,22,22,26,26,25.5,25.5,13.5,13.5,13.5,13.5,17.5,17.5,17.5,14.5,21,21,21,21,26,26,26,26,24.5,24.5,24.5,24.5,18,18,18,18,9,13,13,13,15,15,15,15,26,26,18.5,18.5,19.5,19.5,19.5,19.5,12.5,12.5,12.5,17.5,20,20,20,20,13,13,13,13}'),
+    (36, '{20.5,20.5,20.5,20.5,19.5,19.5,19.5,19.5,15,17,17,17,11,11,11,11,20,20,23.5,23.5,22.5,22.5,22.5,22.5,22.5,22.5,22.5,15.5,16.5,16.5,16.5,16.5,14,14,14,14,28,28,28,28,30,30,30,30,26.5,16.5,16.5,16.5,17.5,17.5,17.5,17.5,22.5,22.5,25.5,25.5,12.5,12.5,12.5,12.5,17.5,17.5,17.5,21.5,24.5,24.5,24.5,24.5,31,31,31,31,24,24,24,24,19,19,19,19,8.5,4,4,4,6,6,6,6,19,19,25.5,25.5,25.5,25.5,25.5,25.5,19.5,19.5,19.5,16.5,16.5,16.5,16.5,16.5,11,11,11,11}'),
+    (37, '{20.5,20.5,20.5,20.5,19.5,19.5,19.5,19.5,15,17,17,17,11,11,11,11,20,20,23.5,23.5,22.5,22.5,22.5,22.5,22.5,22.5,22.5,15.5,16.5,16.5,16.5,16.5,14,14,14,14,28,28,28,28,30,30,30,30,26.5,16.5,16.5,16.5,17.5,17.5,17.5,17.5,22.5,22.5,25.5,25.5,12.5,12.5,12.5,12.5,17.5,17.5,17.5,21.5,24.5,24.5,24.5,24.5,31,31,31,31,24,24,24,24,19,19,19,19,8.5,4,4,4,6,6,6,6,19,19,25.5,25.5,25.5,25.5,25.5,25.5,19.5,19.5,19.5,16.5,16.5,16.5,16.5,16.5,11,11,11,11}'),
+    (38, '{20.5,20.5,20.5,20.5,19.5,19.5,19.5,19.5,15,17,17,17,11,11,11,11,20,20,23.5,23.5,22.5,22.5,22.5,22.5,22.5,22.5,22.5,15.5,16.5,16.5,16.5,16.5,14,14,14,14,28,28,28,28,30,30,30,30,26.5,16.5,16.5,16.5,17.5,17.5,17.5,17.5,22.5,22.5,25.5,25.5,12.5,12.5,12.5,12.5,17.5,17.5,17.5,21.5,24.5,24.5,24.5,24.5,31,31,31,31,24,24,24,24,19,19,19,19,8.5,4,4,4,6,6,6,6,19,19,25.5,25.5,25.5,25.5,25.5,25.5,19.5,19.5,19.5,16.5,16.5,16.5,16.5,16.5,11,11,11,11}'),
+    (39, '{20.5,20.5,20.5,20.5,19.5,19.5,19.5,19.5,15,17,17,17,11,11,11,11,20,20,23.5,23.5,22.5,22.5,22.5,22.5,22.5,22.5,22.5,15.5,16.5,16.5,16.5,16.5,14,14,14,14,28,28,28,28,30,30,30,30,26.5,16.5,16.5,16.5,17.5,17.5,17.5,17.5,22.5,22.5,25.5,25.5,12.5,12.5,12.5,12.5,17.5,17.5,17.5,21.5,24.5,24.5,24.5,24.5,31,31,31,31,24,24,24,24,19,19,19,19,8.5,4,4,4,6,6,6,6,19,19,25.5,25.5,25.5,25.5,25.5,25.5,19.5,19.5,19.5,16.5,16.5,16.5,16.5,16.5,11,11,11,11}'),
+    (40, '{24.5,24.5,24.5,24.5,17.5,17.5,17.5,17.5,18.5,20.5,20.5,20.5,25,25,25,25,16,16,19.5,19.5,28.5,28.5,28.5,28.5,26.5,26.5,26.5,19.5,12.5,12.5,12.5,12.5,14.5,14.5,14.5,14.5,30,30,30,30,28,28,28,28,34,24,24,24,21.5,21.5,21.5,21.5,8.5,8.5,11.5,11.5,24.5,24.5,24.5,24.5,19.5,19.5,19.5,23.5,20.5,20.5,20.5,20.5,23.5,23.5,23.5,23.5,18,18,18,18,17,17,17,17,24,19.5,19.5,19.5,18,18,18,18,5,5,11.5,11.5,19.5,19.5,19.5,19.5,25.5,25.5,25.5,22.5,14.5,14.5,14.5,14.5,21.5,21.5,21.5,21.5}'),
+    (41, '{24.5,24.5,24.5,24.5,17.5,17.5,17.5,17.5,18.5,20.5,20.5,20.5,25,25,25,25,16,16,19.5,19.5,28.5,28.5,28.5,28.5,26.5,26.5,26.5,19.5,12.5,12.5,12.5,12.5,14.5,14.5,14.5,14.5,30,30,30,30,28,28,28,28,34,24,24,24,21.5,21.5,21.5,21.5,8.5,8.5,11.5,11.5,24.5,24.5,24.5,24.5,19.5,19.5,19.5,23.5,20.5,20.5,20.5,20.5,23.5,23.5,23.5,23.5,18,18,18,18,17,17,17,17,24,19.5,19.5,19.5,18,18,18,18,5,5,11.5,11.5,19.5,19.5,19.5,19.5,25.5,25.5,25.5,22.5,14.5,14.5,14.5,14.5,21.5,21.5,21.5,21.5}'),
+    (42, '{24.5,24.5,24.5,24.5,17.5,17.5,17.5,17.5,18.5,20.5,20.5,20.5,25,25,25,25,16,16,19.5,19.5,28.5,28.5,28.5,28.5,26.5,26.5,26.5,19.5,12.5,12.5,12.5,12.5,14.5,14.5,14.5,14.5,30,30,30,30,28,28,28,28,34,24,24,24,21.5,21.5,21.5,21.5,8.5,8.5,11.5,11.5,24.5,24.5,24.5,24.5,19.5,19.5,19.5,23.5,20.5,20.5,20.5,20.5,23.5,23.5,23.5,23.5,18,18,18,18,17,17,17,17,24,19.5,19.5,19.5,18,18,18,18,5,5,11.5,11.5,19.5,19.5,19.5,19.5,25.5,25.5,25.5,22.5,14.5,14.5,14.5,14.5,21.5,21.5,21.5,21.5}'),
+    (43, '{24.5,24.5,24.5,24.5,17.5,17.5,17.5,17.5,18.5,20.5,20.5,20.5,25,25,25,25,16,16,19.5,19.5,28.5,28.5,28.5,28.5,26.5,26.5,26.5,19.5,12.5,12.5,12.5,12.5,14.5,14.5,14.5,14.5,30,30,30,30,28,28,28,28,34,24,24,24,21.5,21.5,21.5,21.5,8.5,8.5,11.5,11.5,24.5,24.5,24.5,24.5,19.5,19.5,19.5,23.5,20.5,20.5,20.5,20.5,23.5,23.5,23.5,23.5,18,18,18,18,17,17,17,17,24,19.5,19.5,19.5,18,18,18,18,5,5,11.5,11.5,19.5,19.5,19.5,19.5,25.5,25.5,25.5,22.5,14.5,14.5,14.5,14.5,21.5,21.5,21.5,21.5}'),
+    (44, '{14,14,14,14,25.5,25.5,25.5,25.5,20.5,22.5,22.5,22.5,26.5,26.5,26.5,26.5,24,24,27.5,27.5,21.5,21.5,21.5,21.5,20.5,20.5,20.5,13.5,22.5,22.5,22.5,22.5,16.5,16.5,16.5,16.5,26.5,26.5,26.5,26.5,34,34,34,34,28,18,18,18,16,16,16,16,14.5,14.5,17.5,17.5,25.5,25.5,25.5,25.5,17.5,17.5,17.5,21.5,29.5,29.5,29.5,29.5,16.5,16.5,16.5,16.5,9.5,9.5,9.5,9.5,25,25,25,25,25,20.5,20.5,20.5,19.5,19.5,19.5,19.5,12,12,18.5,18.5,10.5,10.5,10.5,10.5,16.5,16.5,16.5,13.5,24.5,24.5,24.5,24.5,21.5,21.5,21.5,21.5}'),
+    (45, '{8,8,8,8,19.5,19.5,19.5,19.5,14.5,20,20,20,24,24,24,24,21.5,21.5,30.5,30.5,24.5,24.5,24.5,24.5,23.5,23.5,23.5,17,26,26,26,26,20,20,20,20,15.5,15.5,15.5,15.5,23,23,23,23,17,28,28,28,26,26,26,26,24.5,24.5,17.5,17.5,25.5,25.5,25.5,25.5,17.5,17.5,17.5,18,26,26,26,26,13,13,13,13,13,13,13,13,28.5,28.5,28.5,28.5,28.5,24,24,24,23,23,23,23,15.5,15.5,17.5,17.5,9.5,9.5,9.5,9.5,15.5,15.5,15.5,16.5,27.5,27.5,27.5,27.5,24.5,24.5,24.5,24.5}'),
+    (46, '{8,8,8,8,19.5,19.5,19.5,19.5,14.5,20,20,20,24,24,24,24,21.5,21.5,30.5,30.5,24.5,24.5,24.5,24.5,23.5,23.5,23.5,17,26,26,26,26,20,20,20,20,15.5,15.5,15.5,15.5,23,23,23,23,17,28,28,28,26,26,26,26,24.5,24.5,17.5,17.5,25.5,25.5,25.5,25.5,17.5,17.5,17.5,18,26,26,26,26,13,13,13,13,13,13,13,13,28.5,28.5,28.5,28.5,28.5,24,24,24,23,23,23,23,15.5,15.5,17.5,17.5,9.5,9.5,9.5,9.5,15.5,15.5,15.5,16.5,27.5,27.5,27.5,27.5,24.5,24.5,24.5,24.5}'),
+    (47, '{8,8,8,8,19.5,19.5,19.5,19.5,14.5,20,20,20,24,24,24,24,21.5,21.5,30.5,30.5,24.5,24.5,24.5,24.5,23.5,23.5,23.5,17,26,26,26,26,20,20,20,20,15.5,15.5,15.5,15.5,23,23,23,23,17,28,28,28,26,26,26,26,24.5,24.5,17.5,17.5,25.5,25.5,25.5,25.5,17.5,17.5,17.5,18,26,26,26,26,13,13,13,13,13,13,13,13,28.5,28.5,28.5,28.5,28.5,24,24,24,23,23,23,23,15.5,15.5,17.5,17.5,9.5,9.5,9.5,9.5,15.5,15.5,15.5,16.5,27.5,27.5,27.5,27.5,24.5,24.5,24.5,24.5}'),
+    (48, '{8,8,8,8,19,19,19,19,15.5,21,21,21,24,24,24,24,24,24,33,33,24.5,24.5,24.5,24.5,24.5,24.5,24.5,18,27,27,27,27,21,21,21,21,16.5,16.5,16.5,16.5,21.5,21.5,21.5,21.5,16,27,27,27,28,28,28,28,28,28,21,21,27.5,27.5,27.5,27.5,19.5,19.5,19.5,20,26,26,26,26,13,13,13,13,14,14,14,14,27,27,27,27,28.5,24,24,24,24,24,24,24,18,18,20,20,9.5,9.5,9.5,9.5,15.5,15.5,15.5,16.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5}'),
+    (49, '{8,8,8,8,19,19,19,19,15.5,21,21,21,24,24,24,24,24,24,33,33,24.5,24.5,24.5,24.5,24.5,24.5,24.5,18,27,27,27,27,21,21,21,21,16.5,16.5,16.5,16.5,21.5,21.5,21.5,21.5,16,27,27,27,28,28,28,28,28,28,21,21,27.5,27.5,27.5,27.5,19.5,19.5,19.5,20,26,26,26,26,13,13,13,13,14,14,14,14,27,27,27,27,28.5,24,24,24,24,24,24,24,18,18,20,20,9.5,9.5,9.5,9.5,15.5,15.5,15.5,16.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5}'),
+    (50, '{8,8,8,8,19,19,19,19,15.5,21,21,21,24,24,24,24,24,24,33,33,24.5,24.5,24.5,24.5,24.5,24.5,24.5,18,27,27,27,27,21,21,21,21,16.5,16.5,16.5,16.5,21.5,21.5,21.5,21.5,16,27,27,27,28,28,28,28,28,28,21,21,27.5,27.5,27.5,27.5,19.5,19.5,19.5,20,26,26,26,26,13,13,13,13,14,14,14,14,27,27,27,27,28.5,24,24,24,24,24,24,24,18,18,20,20,9.5,9.5,9.5,9.5,15.5,15.5,15.5,16.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5}'),
+    (51, '{8,8,8,8,19,19,19,19,15.5,21,21,21,24,24,24,24,24,24,33,33,24.5,24.5,24.5,24.5,24.5,24.5,24.5,18,27,27,27,27,21,21,21,21,16.5,16.5,16.5,16.5,21.5,21.5,21.5,21.5,16,27,27,27,28,28,28,28,28,28,21,21,27.5,27.5,27.5,27.5,19.5,19.5,19.5,20,26,26,26,26,13,13,13,13,14,14,14,14,27,27,27,27,28.5,24,24,24,24,24,24,24,18,18,20,20,9.5,9.5,9.5,9.5,15.5,15.5,15.5,16.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5}'),
+    (52, '{12,12,12,12,3,3,3,3,17,22.5,22.5,22.5,19,19,19,19,12,12,21,21,27,27,27,27,26.5,26.5,26.5,20,12,12,12,12,25,25,25,25,21.5,21.5,21.5,21.5,7.5,7.5,7.5,7.5,13.5,24.5,24.5,24.5,28,28,28,28,28,28,21,21,21,21,21,21,27.5,27.5,27.5,28,12,12,12,12,25,25,25,25,26,26,26,26,12,12,12,12,21,16.5,16.5,16.5,18,18,18,18,15,15,17,17,25,25,25,25,17.5,17.5,17.5,18.5,9.5,9.5,9.5,9.5,19.5,19.5,19.5,19.5}'),
+    (53, '{12,12,12,12,3,3,3,3,17,22.5,22.5,22.5,19,19,19,19,12,12,21,21,27,27,27,27,26.5,26.5,26.5,20,12,12,12,12,25,25,25,25,21.5,21.5,21.5,21.5,7.5,7.5,7.5,7.5,13.5,24.5,24.5,24.5,28,28,28,28,28,28,21,21,21,21,21,21,27.5,27.5,27.5,28,12,12,12,12,25,25,25,25,26,26,26,26,12,12,12,12,21,16.5,16.5,16.5,18,18,18,18,15,15,17,17,25,25,25,25,17.5,17.5,17.5,18.5,9.5,9.5,9.5,9.5,19.5,19.5,19.5,19.5}'),
+    (54, '{21.5,21.5,21.5,21.5,12.5,12.5,12.5,12.5,26.5,21.5,21.5,21.5,18,18,18,18,11,11,14,14,20,20,20,20,19.5,19.5,19.5,19.5,11.5,11.5,11.5,11.5,24.5,24.5,24.5,24.5,24.5,24.5,24.5,24.5,10.5,10.5,10.5,10.5,16.5,16.5,16.5,16.5,20,20,20,20,20,20,28,28,28,28,28,28,34.5,34.5,34.5,23.5,7.5,7.5,7.5,7.5,20.5,20.5,20.5,20.5,26,26,26,26,12,12,12,12,21,23.5,23.5,23.5,25,25,25,25,22,22,18,18,26,26,26,26,18.5,18.5,18.5,11.5,2.5,2.5,2.5,2.5,12.5,12.5,12.5,12.5}'),
+    (55, '{21.5,21.5,21.5,21.5,12.5,12.5,12.5,12.5,26.5,21.5,21.5,21.5,18,18,18,18,11,11,14,14,20,20,20,20,19.5,19.5,19.5,19.5,11.5,11.5,11.5,11.5,24.5,24.5,24.5,24.5,24.5,24.5,24.5,24.5,10.5,10.5,10.5,10.5,16.5,16.5,16.5,16.5,20,20,20,20,20,20,28,28,28,28,28,28,34.5,34.5,34.5,23.5,7.5,7.5,7.5,7.5,20.5,20.5,20.5,20.5,26,26,26,26,12,12,12,12,21,23.5,23.5,23.5,25,25,25,25,22,22,18,18,26,26,26,26,18.5,18.5,18.5,11.5,2.5,2.5,2.5,2.5,12.5,12.5,12.5,12.5}'),
+    (56, '{25.5,25.5,25.5,25.5,28.5,28.5,28.5,28.5,15.5,10.5,10.5,10.5,13.5,13.5,13.5,13.5,23,23,26,26,27,27,27,27,27,27,27,27,26.5,26.5,26.5,26.5,12.5,12.5,12.5,12.5,11.5,11.5,11.5,11.5,24.5,24.5,24.5,24.5,25.5,25.5,25.5,25.5,26.5,26.5,26.5,26.5,20,20,28,28,28,28,28,28,20,20,20,9,21.5,21.5,21.5,21.5,16.5,16.5,16.5,16.5,22,22,22,22,27,27,27,27,19,21.5,21.5,21.5,21.5,21.5,21.5,21.5,25,25,21,21,20,20,20,20,26,26,26,19,19.5,19.5,19.5,19.5,11.5,11.5,11.5,11.5}'),
+    (57, '{25.5,25.5,25.5,25.5,28.5,28.5,28.5,28.5,15.5,10.5,10.5,10.5,13.5,13.5,13.5,13.5,23,23,26,26,27,27,27,27,27,27,27,27,26.5,26.5,26.5,26.5,12.5,12.5,12.5,12.5,11.5,11.5,11.5,11.5,24.5,24.5,24.5,24.5,25.5,25.5,25.5,25.5,26.5,26.5,26.5,26.5,20,20,28,28,28,28,28,28,20,20,20,9,21.5,21.5,21.5,21.5,16.5,16.5,16.5,16.5,22,22,22,22,27,27,27,27,19,21.5,21.5,21.5,21.5,21.5,21.5,21.5,25,25,21,21,20,20,20,20,26,26,26,19,19.5,19.5,19.5,19.5,11.5,11.5,11.5,11.5}'),
+    (58, '{25.5,25.5,25.5,25.5,28.5,28.5,28.5,28.5,15.5,10.5,10.5,10.5,13.5,13.5,13.5,13.5,23,23,26,26,27,27,27,27,27,27,27,27,26.5,26.5,26.5,26.5,12.5,12.5,12.5,12.5,11.5,11.5,11.5,11.5,24.5,24.5,24.5,24.5,25.5,25.5,25.5,25.5,26.5,26.5,26.5,26.5,20,20,28,28,28,28,28,28,20,20,20,9,21.5,21.5,21.5,21.5,16.5,16.5,16.5,16.5,22,22,22,22,27,27,27,27,19,21.5,21.5,21.5,21.5,21.5,21.5,21.5,25,25,21,21,20,20,20,20,26,26,26,19,19.5,19.5,19.5,19.5,11.5,11.5,11.5,11.5}'),
+    (59, '{25.5,25.5,25.5,25.5,28.5,28.5,28.5,28.5,15.5,10.5,10.5,10.5,13.5,13.5,13.5,13.5,23,23,26,26,27,27,27,27,27,27,27,27,26.5,26.5,26.5,26.5,12.5,12.5,12.5,12.5,11.5,11.5,11.5,11.5,24.5,24.5,24.5,24.5,25.5,25.5,25.5,25.5,26.5,26.5,26.5,26.5,20,20,28,28,28,28,28,28,20,20,20,9,21.5,21.5,21.5,21.5,16.5,16.5,16.5,16.5,22,22,22,22,27,27,27,27,19,21.5,21.5,21.5,21.5,21.5,21.5,21.5,25,25,21,21,20,20,20,20,26,26,26,19,19.5,19.5,19.5,19.5,11.5,11.5,11.5,11.5}'),
+    (60, '{21.5,21.5,21.5,21.5,20.5,20.5,20.5,20.5,18.5,13.5,13.5,13.5,8.5,8.5,8.5,8.5,17.5,17.5,20.5,20.5,20,20,20,20,21,21,21,21,21,21,21,21,16.5,16.5,16.5,16.5,16.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,16.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,26.5,26.5,34.5,34.5,20,20,20,20,28,28,28,17,17,17,17,17,20.5,20.5,20.5,20.5,26,26,26,26,20,20,20,20,13,15.5,15.5,15.5,15.5,15.5,15.5,15.5,28.5,28.5,24.5,24.5,26,26,26,26,20,20,20,13,12,12,12,12,4.5,4.5,4.5,4.5}'),
+    (61, '{21.5,21.5,21.5,21.5,20.5,20.5,20.5,20.5,18.5,13.5,13.5,13.5,8.5,8.5,8.5,8.5,17.5,17.5,20.5,20.5,20,20,20,20,21,21,21,21,21,21,21,21,16.5,16.5,16.5,16.5,16.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,16.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,26.5,26.5,34.5,34.5,20,20,20,20,28,28,28,17,17,17,17,17,20.5,20.5,20.5,20.5,26,26,26,26,20,20,20,20,13,15.5,15.5,15.5,15.5,15.5,15.5,15.5,28.5,28.5,24.5,24.5,26,26,26,26,20,20,20,13,12,12,12,12,4.5,4.5,4.5,4.5}'),
+    (62, '{21.5,21.5,21.5,21.5,20.5,20.5,20.5,20.5,18.5,13.5,13.5,13.5,8.5,8.5,8.5,8.5,17.5,17.5,20.5,20.5,20,20,20,20,21,21,21,21,21,21,21,21,16.5,16.5,16.5,16.5,16.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,16.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,26.5,26.5,34.5,34.5,20,20,20,20,28,28,28,17,17,17,17,17,20.5,20.5,20.5,20.5,26,26,26,26,20,20,20,20,13,15.5,15.5,15.5,15.5,15.5,15.5,15.5,28.5,28.5,24.5,24.5,26,26,26,26,20,20,20,13,12,12,12,12,4.5,4.5,4.5,4.5}'),
+    (63, '{18.5,18.5,18.5,18.5,17.5,17.5,17.5,17.5,15.5,20.5,20.5,20.5,15.5,15.5,15.5,15.5,24.5,24.5,15,15,14.5,14.5,14.5,14.5,15.5,15.5,15.5,19,19,19,19,19,14.5,14.5,14.5,14.5,22.5,22.5,22.5,22.5,24.5,24.5,24.5,24.5,22.5,19,19,19,21,21,21,21,29,29,24.5,24.5,10,10,10,10,18,18,18,28,28,28,28,28,31.5,31.5,31.5,31.5,23.5,23.5,23.5,23.5,17.5,17.5,17.5,17.5,10.5,13,13,13,13,13,13,13,26,26,26,26,27.5,27.5,27.5,27.5,21.5,21.5,21.5,19,18,18,18,18,10.5,10.5,10.5,10.5}'),
+    (64, '{25.5,25.5,25.5,25.5,16.5,16.5,16.5,16.5,19.5,24.5,24.5,24.5,29.5,29.5,29.5,29.5,21.5,21.5,12,12,18,18,18,18,22.5,22.5,22.5,26,17,17,17,17,21,21,21,21,25.5,25.5,25.5,25.5,22.5,22.5,22.5,22.5,31.5,28,28,28,27,27,27,27,13,13,8.5,8.5,22.5,22.5,22.5,22.5,18,18,18,28,28,28,28,28,31,31,31,31,17.5,17.5,17.5,17.5,16.5,16.5,16.5,16.5,24.5,27,27,27,27,27,27,27,13,13,13,13,23,23,23,23,27.5,27.5,27.5,25,19,19,19,19,26,26,26,26}'),
+    (65, '{25.5,25.5,25.5,25.5,16.5,16.5,16.5,16.5,19.5,24.5,24.5,24.5,29.5,29.5,29.5,29.5,21.5,21.5,12,12,18,18,18,18,22.5,22.5,22.5,26,17,17,17,17,21,21,21,21,25.5,25.5,25.5,25.5,22.5,22.5,22.5,22.5,31.5,28,28,28,27,27,27,27,13,13,8.5,8.5,22.5,22.5,22.5,22.5,18,18,18,28,28,28,28,28,31,31,31,31,17.5,17.5,17.5,17.5,16.5,16.5,16.5,16.5,24.5,27,27,27,27,27,27,27,13,13,13,13,23,23,23,23,27.5,27.5,27.5,25,19,19,19,19,26,26,26,26}'),
+    (66, '{25.5,25.5,25.5,25.5,16.5,16.5,16.5,16.5,19.5,24.5,24.5,24.5,29.5,29.5,29.5,29.5,21.5,21.5,12,12,18,18,18,18,22.5,22.5,22.5,26,17,17,17,17,21,21,21,21,25.5,25.5,25.5,25.5,22.5,22.5,22.5,22.5,31.5,28,28,28,27,27,27,27,13,13,8.5,8.5,22.5,22.5,22.5,22.5,18,18,18,28,28,28,28,28,31,31,31,31,17.5,17.5,17.5,17.5,16.5,16.5,16.5,16.5,24.5,27,27,27,27,27,27,27,13,13,13,13,23,23,23,23,27.5,27.5,27.5,25,19,19,19,19,26,26,26,26}'),
+    (67, '{25.5,25.5,25.5,25.5,16.5,16.5,16.5,16.5,19.5,24.5,24.5,24.5,29.5,29.5,29.5,29.5,21.5,21.5,12,12,18,18,18,18,22.5,22.5,22.5,26,17,17,17,17,21,21,21,21,25.5,25.5,25.5,25.5,22.5,22.5,22.5,22.5,31.5,28,28,28,27,27,27,27,13,13,8.5,8.5,22.5,22.5,22.5,22.5,18,18,18,28,28,28,28,28,31,31,31,31,17.5,17.5,17.5,17.5,16.5,16.5,16.5,16.5,24.5,27,27,27,27,27,27,27,13,13,13,13,23,23,23,23,27.5,27.5,27.5,25,19,19,19,19,26,26,26,26}'),
+    (68, '{14,14,14,14,18.5,18.5,18.5,18.5,24.5,29.5,29.5,29.5,23.5,23.5,23.5,23.5,24.5,24.5,15,15,4,4,4,4,8,8,8,11.5,20,20,20,20,26,26,26,26,32,32,32,32,24.5,24.5,24.5,24.5,17.5,14,14,14,14,14,14,14,26,26,21.5,21.5,17.5,17.5,17.5,17.5,21.5,21.5,21.5,31.5,31,31,31,31,28,28,28,28,16,16,16,16,18.5,18.5,18.5,18.5,18.5,21,21,21,22,22,22,22,26,26,26,26,20,20,20,20,12,12,12,9.5,21,21,21,21,21,21,21,21}'),
+    (69, '{14,14,14,14,18.5,18.5,18.5,18.5,24.5,29.5,29.5,29.5,23.5,23.5,23.5,23.5,24.5,24.5,15,15,4,4,4,4,8,8,8,11.5,20,20,20,20,26,26,26,26,32,32,32,32,24.5,24.5,24.5,24.5,17.5,14,14,14,14,14,14,14,26,26,21.5,21.5,17.5,17.5,17.5,17.5,21.5,21.5,21.5,31.5,31,31,31,31,28,28,28,28,16,16,16,16,18.5,18.5,18.5,18.5,18.5,21,21,21,22,22,22,22,26,26,26,26,20,20,20,20,12,12,12,9.5,21,21,21,21,21,21,21,21}'),
+    (70, '{14,14,14,14,18.5,18.5,18.5,18.5,24.5,29.5,29.5,29.5,23.5,23.5,23.5,23.5,24.5,24.5,15,15,4,4,4,4,8,8,8,11.5,20,20,20,20,26,26,26,26,32,32,32,32,24.5,24.5,24.5,24.5,17.5,14,14,14,14,14,14,14,26,26,21.5,21.5,17.5,17.5,17.5,17.5,21.5,21.5,21.5,31.5,31,31,31,31,28,28,28,28,16,16,16,16,18.5,18.5,18.5,18.5,18.5,21,21,21,22,22,22,22,26,26,26,26,20,20,20,20,12,12,12,9.5,21,21,21,21,21,21,21,21}'),
+    (71, '{14,14,14,14,18.5,18.5,18.5,18.5,24.5,29.5,29.5,29.5,23.5,23.5,23.5,23.5,24.5,24.5,15,15,4,4,4,4,8,8,8,11.5,20,20,20,20,26,26,26,26,32,32,32,32,24.5,24.5,24.5,24.5,17.5,14,14,14,14,14,14,14,26,26,21.5,21.5,17.5,17.5,17.5,17.5,21.5,21.5,21.5,31.5,31,31,31,31,28,28,28,28,16,16,16,16,18.5,18.5,18.5,18.5,18.5,21,21,21,22,22,22,22,26,26,26,26,20,20,20,20,12,12,12,9.5,21,21,21,21,21,21,21,21}'),
+    (72, '{12,12,12,12,19,19,19,19,22.5,18,18,18,13,13,13,13,14,14,23,23,16,16,16,16,15,15,15,9,16,16,16,16,23.5,23.5,23.5,23.5,24,24,24,24,18,18,18,18,9.5,14,14,14,15,15,15,15,27,27,27,27,23,23,23,23,27,27,27,22.5,16.5,16.5,16.5,16.5,15,15,15,15,28,28,28,28,28,28,28,28,25.5,14.5,14.5,14.5,16.5,16.5,16.5,16.5,20.5,20.5,29.5,29.5,22.5,22.5,22.5,22.5,15.5,15.5,15.5,15,24,24,24,24,26.5,26.5,26.5,26.5}'),
+    (73, '{12,12,12,12,19,19,19,19,22.5,18,18,18,13,13,13,13,14,14,23,23,16,16,16,16,15,15,15,9,16,16,16,16,23.5,23.5,23.5,23.5,24,24,24,24,18,18,18,18,9.5,14,14,14,15,15,15,15,27,27,27,27,23,23,23,23,27,27,27,22.5,16.5,16.5,16.5,16.5,15,15,15,15,28,28,28,28,28,28,28,28,25.5,14.5,14.5,14.5,16.5,16.5,16.5,16.5,20.5,20.5,29.5,29.5,22.5,22.5,22.5,22.5,15.5,15.5,15.5,15,24,24,24,24,26.5,26.5,26.5,26.5}'),
+    (74, '{12,12,12,12,19,19,19,19,22.5,18,18,18,13,13,13,13,14,14,23,23,16,16,16,16,15,15,15,9,16,16,16,16,23.5,23.5,23.5,23.5,24,24,24,24,18,18,18,18,9.5,14,14,14,15,15,15,15,27,27,27,27,23,23,23,23,27,27,27,22.5,16.5,16.5,16.5,16.5,15,15,15,15,28,28,28,28,28,28,28,28,25.5,14.5,14.5,14.5,16.5,16.5,16.5,16.5,20.5,20.5,29.5,29.5,22.5,22.5,22.5,22.5,15.5,15.5,15.5,15,24,24,24,24,26.5,26.5,26.5,26.5}'),
+    (75, '{12,12,12,12,19,19,19,19,22.5,18,18,18,13,13,13,13,14,14,23,23,16,16,16,16,15,15,15,9,16,16,16,16,23.5,23.5,23.5,23.5,24,24,24,24,18,18,18,18,9.5,14,14,14,15,15,15,15,27,27,27,27,23,23,23,23,27,27,27,22.5,16.5,16.5,16.5,16.5,15,15,15,15,28,28,28,28,28,28,28,28,25.5,14.5,14.5,14.5,16.5,16.5,16.5,16.5,20.5,20.5,29.5,29.5,22.5,22.5,22.5,22.5,15.5,15.5,15.5,15,24,24,24,24,26.5,26.5,26.5,26.5}'),
+    (76, '{25,25,25,25,18,18,18,18,17,12.5,12.5,12.5,19,19,19,19,10,10,19,19,28,28,28,28,28,28,28,22,11,11,11,11,17,17,17,17,19,19,19,19,17,17,17,17,25,29.5,29.5,29.5,27,27,27,27,13,13,13,13,27,27,27,27,21,21,21,16.5,14.5,14.5,14.5,14.5,17.5,17.5,17.5,17.5,28,28,28,28,28,28,28,28,35,24,24,24,22.5,22.5,22.5,22.5,7.5,7.5,16.5,16.5,25.5,25.5,25.5,25.5,30.5,30.5,30.5,30,22,22,22,22,30,30,30,30}'),
+    (77, '{25,25,25,25,18,18,18,18,17,12.5,12.5,12.5,19,19,19,19,10,10,19,19,28,28,28,28,28,28,28,22,11,11,11,11,17,17,17,17,19,19,19,19,17,17,17,17,25,29.5,29.5,29.5,27,27,27,27,13,13,13,13,27,27,27,27,21,21,21,16.5,14.5,14.5,14.5,14.5,17.5,17.5,17.5,17.5,28,28,28,28,28,28,28,28,35,24,24,24,22.5,22.5,22.5,22.5,7.5,7.5,16.5,16.5,25.5,25.5,25.5,25.5,30.5,30.5,30.5,30,22,22,22,22,30,30,30,30}'),
+    (78, '{25,25,25,25,18,18,18,18,17,12.5,12.5,12.5,19,19,19,19,10,10,19,19,28,28,28,28,28,28,28,22,11,11,11,11,17,17,17,17,19,19,19,19,17,17,17,17,25,29.5,29.5,29.5,27,27,27,27,13,13,13,13,27,27,27,27,21,21,21,16.5,14.5,14.5,14.5,14.5,17.5,17.5,17.5,17.5,28,28,28,28,28,28,28,28,35,24,24,24,22.5,22.5,22.5,22.5,7.5,7.5,16.5,16.5,25.5,25.5,25.5,25.5,30.5,30.5,30.5,30,22,22,22,22,30,30,30,30}'),
+    (79, '{25,25,25,25,18,18,18,18,17,12.5,12.5,12.5,19,19,19,19,10,10,19,19,28,28,28,28,28,28,28,22,11,11,11,11,17,17,17,17,19,19,19,19,17,17,17,17,25,29.5,29.5,29.5,27,27,27,27,13,13,13,13,27,27,27,27,21,21,21,16.5,14.5,14.5,14.5,14.5,17.5,17.5,17.5,17.5,28,28,28,28,28,28,28,28,35,24,24,24,22.5,22.5,22.5,22.5,7.5,7.5,16.5,16.5,25.5,25.5,25.5,25.5,30.5,30.5,30.5,30,22,22,22,22,30,30,30,30}'),
+    (80, '{22.5,22.5,22.5,22.5,25,25,25,25,12,7.5,7.5,7.5,10.5,10.5,10.5,10.5,16,16,25,25,27,27,27,27,27,27,27,21,22,22,22,22,8,8,8,8,8.5,8.5,8.5,8.5,24,24,24,24,25,29.5,29.5,29.5,28.5,28.5,28.5,28.5,22,22,22,22,19,19,19,19,14,14,14,9.5,22.5,22.5,22.5,22.5,17.5,17.5,17.5,17.5,25.5,25.5,25.5,25.5,35,35,35,35,28,17,17,17,15,15,15,15,15.5,15.5,24.5,24.5,24.5,24.5,24.5,24.5,30.5,30.5,30.5,30,30,30,30,30,21,21,21,21}'),
+    (81, '{26,26,26,26,28.5,28.5,28.5,28.5,15.5,14,14,14,17,17,17,17,22.5,22.5,20.5,20.5,22.5,22.5,22.5,22.5,22.5,22.5,22.5,25,26,26,26,26,12,12,12,12,3,3,3,3,18.5,18.5,18.5,18.5,19.5,25,25,25,24,24,24,24,17.5,17.5,25.5,25.5,22.5,22.5,22.5,22.5,17.5,17.5,17.5,12,25,25,25,25,20,20,20,20,14.5,14.5,14.5,14.5,24,24,24,24,17,28,28,28,26,26,26,26,26.5,26.5,18.5,18.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,28.5,28.5,28.5,28.5,28.5,19.5,19.5,19.5,19.5}'),
+    (82, '{26,26,26,26,28.5,28.5,28.5,28.5,15.5,14,14,14,17,17,17,17,22.5,22.5,20.5,20.5,22.5,22.5,22.5,22.5,22.5,22.5,22.5,25,26,26,26,26,12,12,12,12,3,3,3,3,18.5,18.5,18.5,18.5,19.5,25,25,25,24,24,24,24,17.5,17.5,25.5,25.5,22.5,22.5,22.5,22.5,17.5,17.5,17.5,12,25,25,25,25,20,20,20,20,14.5,14.5,14.5,14.5,24,24,24,24,17,28,28,28,26,26,26,26,26.5,26.5,18.5,18.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,28.5,28.5,28.5,28.5,28.5,19.5,19.5,19.5,19.5}'),
+    (83, '{26,26,26,26,28.5,28.5,28.5,28.5,15.5,14,14,14,17,17,17,17,22.5,22.5,20.5,20.5,22.5,22.5,22.5,22.5,22.5,22.5,22.5,25,26,26,26,26,12,12,12,12,3,3,3,3,18.5,18.5,18.5,18.5,19.5,25,25,25,24,24,24,24,17.5,17.5,25.5,25.5,22.5,22.5,22.5,22.5,17.5,17.5,17.5,12,25,25,25,25,20,20,20,20,14.5,14.5,14.5,14.5,24,24,24,24,17,28,28,28,26,26,26,26,26.5,26.5,18.5,18.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,28.5,28.5,28.5,28.5,28.5,19.5,19.5,19.5,19.5}'),
+    (84, '{28,28,28,28,28,28,28,28,13.5,12,12,12,19,19,19,19,27,27,25,25,23.5,23.5,23.5,23.5,24.5,24.5,24.5,27,24,24,24,24,14,14,14,14,5,5,5,5,18,18,18,18,19.5,25,25,25,25,25,25,25,19,19,27,27,23.5,23.5,23.5,23.5,17.5,17.5,17.5,12,26,26,26,26,21,21,21,21,16.5,16.5,16.5,16.5,23.5,23.5,23.5,23.5,16,27,27,27,28,28,28,28,29,29,21,21,20.5,20.5,20.5,20.5,24.5,24.5,24.5,28.5,28.5,28.5,28.5,28.5,21.5,21.5,21.5,21.5}'),
+    (85, '{28,28,28,28,28,28,28,28,13.5,12,12,12,19,19,19,19,27,27,25,25,23.5,23.5,23.5,23.5,24.5,24.5,24.5,27,24,24,24,24,14,14,14,14,5,5,5,5,18,18,18,18,19.5,25,25,25,25,25,25,25,19,19,27,27,23.5,23.5,23.5,23.5,17.5,17.5,17.5,12,26,26,26,26,21,21,21,21,16.5,16.5,16.5,16.5,23.5,23.5,23.5,23.5,16,27,27,27,28,28,28,28,29,29,21,21,20.5,20.5,20.5,20.5,24.5,24.5,24.5,28.5,28.5,28.5,28.5,28.5,21.5,21.5,21.5,21.5}'),
+    (86, '{28,28,28,28,28,28,28,28,13.5,12,12,12,19,19,19,19,27,27,25,25,23.5,23.5,23.5,23.5,24.5,24.5,24.5,27,24,24,24,24,14,14,14,14,5,5,5,5,18,18,18,18,19.5,25,25,25,25,25,25,25,19,19,27,27,23.5,23.5,23.5,23.5,17.5,17.5,17.5,12,26,26,26,26,21,21,21,21,16.5,16.5,16.5,16.5,23.5,23.5,23.5,23.5,16,27,27,27,28,28,28,28,29,29,21,21,20.5,20.5,20.5,20.5,24.5,24.5,24.5,28.5,28.5,28.5,28.5,28.5,21.5,21.5,21.5,21.5}'),
+    (87, '{28,28,28,28,28,28,28,28,13.5,12,12,12,19,19,19,19,27,27,25,25,23.5,23.5,23.5,23.5,24.5,24.5,24.5,27,24,24,24,24,14,14,14,14,5,5,5,5,18,18,18,18,19.5,25,25,25,25,25,25,25,19,19,27,27,23.5,23.5,23.5,23.5,17.5,17.5,17.5,12,26,26,26,26,21,21,21,21,16.5,16.5,16.5,16.5,23.5,23.5,23.5,23.5,16,27,27,27,28,28,28,28,29,29,21,21,20.5,20.5,20.5,20.5,24.5,24.5,24.5,28.5,28.5,28.5,28.5,28.5,21.5,21.5,21.5,21.5}'),
+    (88, '{21,21,21,21,11,11,11,11,26,24.5,24.5,24.5,21,21,21,21,14,14,12,12,18,18,18,18,17.5,17.5,17.5,20,12,12,12,12,25,25,25,25,18,18,18,18,4,4,4,4,11,16.5,16.5,16.5,19,19,19,19,16,16,24,24,27,27,27,27,30.5,30.5,30.5,25,12,12,12,12,25,25,25,25,20.5,20.5,20.5,20.5,7.5,7.5,7.5,7.5,15.5,26.5,26.5,26.5,29,29,29,29,28,28,20,20,25,25,25,25,20.5,20.5,20.5,24.5,13.5,13.5,13.5,13.5,21.5,21.5,21.5,21.5}'),
+    (89, '{21,21,21,21,11,11,11,11,26,24.5,24.5,24.5,21,21,21,21,14,14,12,12,18,18,18,18,17.5,17.5,17.5,20,12,12,12,12,25,25,25,25,18,18,18,18,4,4,4,4,11,16.5,16.5,16.5,19,19,19,19,16,16,24,24,27,27,27,27,30.5,30.5,30.5,25,12,12,12,12,25,25,25,25,20.5,20.5,20.5,20.5,7.5,7.5,7.5,7.5,15.5,26.5,26.5,26.5,29,29,29,29,28,28,20,20,25,25,25,25,20.5,20.5,20.5,24.5,13.5,13.5,13.5,13.5,21.5,21.5,21.5,21.5}'),
+    (90, '{19,19,19,19,9,9,9,9,24,28.5,28.5,28.5,25,25,25,25,18,18,13,13,19,19,19,19,18.5,18.5,18.5,12.5,4.5,4.5,4.5,4.5,17.5,17.5,17.5,17.5,24.5,24.5,24.5,24.5,10.5,10.5,10.5,10.5,17.5,16.5,16.5,16.5,19,19,19,19,16,16,18,18,21,21,21,21,24.5,24.5,24.5,25,12,12,12,12,25,25,25,25,28.5,28.5,28.5,28.5,15.5,15.5,15.5,15.5,23.5,16.5,16.5,16.5,19,19,19,19,18,18,28,28,33,33,33,33,28.5,28.5,28.5,17,6,6,6,6,14,14,14,14}'),
+    (91, '{19,19,19,19,9,9,9,9,24,28.5,28.5,28.5,25,25,25,25,18,18,13,13,19,19,19,19,18.5,18.5,18.5,12.5,4.5,4.5,4.5,4.5,17.5,17.5,17.5,17.5,24.5,24.5,24.5,24.5,10.5,10.5,10.5,10.5,17.5,16.5,16.5,16.5,19,19,19,19,16,16,18,18,21,21,21,21,24.5,24.5,24.5,25,12,12,12,12,25,25,25,25,28.5,28.5,28.5,28.5,15.5,15.5,15.5,15.5,23.5,16.5,16.5,16.5,19,19,19,19,18,18,28,28,33,33,33,33,28.5,28.5,28.5,17,6,6,6,6,14,14,14,14}'),
+    (92, '{14,14,14,14,19,19,19,19,25,29.5,29.5,29.5,24.5,24.5,24.5,24.5,27,27,22,22,12,12,12,12,13,13,13,7,13.5,13.5,13.5,13.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,18.5,18.5,18.5,18.5,9.5,8.5,8.5,8.5,8.5,8.5,8.5,8.5,24,24,26,26,20,20,20,20,26,26,26,26.5,22,22,22,22,19,19,19,19,21.5,21.5,21.5,21.5,24.5,24.5,24.5,24.5,23.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,23,23,33,33,28,28,28,28,19,19,19,7.5,14,14,14,14,16,16,16,16}'),
+    (93, '{14,14,14,14,19,19,19,19,25,29.5,29.5,29.5,24.5,24.5,24.5,24.5,27,27,22,22,12,12,12,12,13,13,13,7,13.5,13.5,13.5,13.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,18.5,18.5,18.5,18.5,9.5,8.5,8.5,8.5,8.5,8.5,8.5,8.5,24,24,26,26,20,20,20,20,26,26,26,26.5,22,22,22,22,19,19,19,19,21.5,21.5,21.5,21.5,24.5,24.5,24.5,24.5,23.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,23,23,33,33,28,28,28,28,19,19,19,7.5,14,14,14,14,16,16,16,16}'),
+    (94, '{14,14,14,14,19,19,19,19,25,29.5,29.5,29.5,24.5,24.5,24.5,24.5,27,27,22,22,12,12,12,12,13,13,13,7,13.5,13.5,13.5,13.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,18.5,18.5,18.5,18.5,9.5,8.5,8.5,8.5,8.5,8.5,8.5,8.5,24,24,26,26,20,20,20,20,26,26,26,26.5,22,22,22,22,19,19,19,19,21.5,21.5,21.5,21.5,24.5,24.5,24.5,24.5,23.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,23,23,33,33,28,28,28,28,19,19,19,7.5,14,14,14,14,16,16,16,16}'),
+    (95, '{14,14,14,14,19,19,19,19,25,29.5,29.5,29.5,24.5,24.5,24.5,24.5,27,27,22,22,12,12,12,12,13,13,13,7,13.5,13.5,13.5,13.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,18.5,18.5,18.5,18.5,9.5,8.5,8.5,8.5,8.5,8.5,8.5,8.5,24,24,26,26,20,20,20,20,26,26,26,26.5,22,22,22,22,19,19,19,19,21.5,21.5,21.5,21.5,24.5,24.5,24.5,24.5,23.5,16.5,16.5,16.5,18.5,18.5,18.5,18.5,23,23,33,33,28,28,28,28,19,19,19,7.5,14,14,14,14,16,16,16,16}'),
+    (96, '{15,15,15,15,23,23,23,23,18,22.5,22.5,22.5,29.5,29.5,29.5,29.5,28.5,28.5,23.5,23.5,17,17,17,17,16,16,16,10,18,18,18,18,11.5,11.5,11.5,11.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,15.5,14.5,14.5,14.5,13.5,13.5,13.5,13.5,16.5,16.5,18.5,18.5,25,25,25,25,20,20,20,20.5,25.5,25.5,25.5,25.5,11,11,11,11,14.5,14.5,14.5,14.5,29.5,29.5,29.5,29.5,29.5,22.5,22.5,22.5,21.5,21.5,21.5,21.5,18.5,18.5,28.5,28.5,19,19,19,19,28,28,28,16.5,21.5,21.5,21.5,21.5,18,18,18,18}'),
+    (97, '{15,15,15,15,23,23,23,23,18,22.5,22.5,22.5,29.5,29.5,29.5,29.5,28.5,28.5,23.5,23.5,17,17,17,17,16,16,16,10,18,18,18,18,11.5,11.5,11.5,11.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,15.5,14.5,14.5,14.5,13.5,13.5,13.5,13.5,16.5,16.5,18.5,18.5,25,25,25,25,20,20,20,20.5,25.5,25.5,25.5,25.5,11,11,11,11,14.5,14.5,14.5,14.5,29.5,29.5,29.5,29.5,29.5,22.5,22.5,22.5,21.5,21.5,21.5,21.5,18.5,18.5,28.5,28.5,19,19,19,19,28,28,28,16.5,21.5,21.5,21.5,21.5,18,18,18,18}'),
+    (98, '{15,15,15,15,23,23,23,23,18,22.5,22.5,22.5,29.5,29.5,29.5,29.5,28.5,28.5,23.5,23.5,17,17,17,17,16,16,16,10,18,18,18,18,11.5,11.5,11.5,11.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,15.5,14.5,14.5,14.5,13.5,13.5,13.5,13.5,16.5,16.5,18.5,18.5,25,25,25,25,20,20,20,20.5,25.5,25.5,25.5,25.5,11,11,11,11,14.5,14.5,14.5,14.5,29.5,29.5,29.5,29.5,29.5,22.5,22.5,22.5,21.5,21.5,21.5,21.5,18.5,18.5,28.5,28.5,19,19,19,19,28,28,28,16.5,21.5,21.5,21.5,21.5,18,18,18,18}'),
+    (99, '{14.5,14.5,14.5,14.5,22.5,22.5,22.5,22.5,17.5,20,20,20,27,27,27,27,26,26,25.5,25.5,19,19,19,19,18,18,18,16,24,24,24,24,17.5,17.5,17.5,17.5,18.5,18.5,18.5,18.5,24.5,24.5,24.5,24.5,15.5,17.5,17.5,17.5,16.5,16.5,16.5,16.5,19.5,19.5,12.5,12.5,19,19,19,19,14,14,14,19,24,24,24,24,9.5,9.5,9.5,9.5,16,16,16,16,31,31,31,31,31,29.5,29.5,29.5,28.5,28.5,28.5,28.5,25.5,25.5,18,18,8.5,8.5,8.5,8.5,17.5,17.5,17.5,28,33,33,33,33,29.5,29.5,29.5,29.5}'),
+    (100, '{22.5,22.5,22.5,22.5,16.5,16.5,16.5,16.5,19.5,22,22,22,26,26,26,26,17,17,16.5,16.5,26.5,26.5,26.5,26.5,27,27,27,25,18,18,18,18,20,20,20,20,18.5,18.5,18.5,18.5,16.5,16.5,16.5,16.5,26.5,28.5,28.5,28.5,26.5,26.5,26.5,26.5,10.5,10.5,3.5,3.5,19.5,19.5,19.5,19.5,13,13,13,18,18,18,18,18,21,21,21,21,25,25,25,25,23,23,23,23,31,29.5,29.5,29.5,28.5,28.5,28.5,28.5,14.5,14.5,7,7,15,15,15,15,22.5,22.5,22.5,33,28,28,28,28,33,33,33,33}'),
+    (101, '{22.5,22.5,22.5,22.5,16.5,16.5,16.5,16.5,19.5,22,22,22,26,26,26,26,17,17,16.5,16.5,26.5,26.5,26.5,26.5,27,27,27,25,18,18,18,18,20,20,20,20,18.5,18.5,18.5,18.5,16.5,16.5,16.5,16.5,26.5,28.5,28.5,28.5,26.5,26.5,26.5,26.5,10.5,10.5,3.5,3.5,19.5,19.5,19.5,19.5,13,13,13,18,18,18,18,18,21,21,21,21,25,25,25,25,23,23,23,23,31,29.5,29.5,29.5,28.5,28.5,28.5,28.5,14.5,14.5,7,7,15,15,15,15,22.5,22.5,22.5,33,28,28,28,28,33,33,33,33}'),
+    (102, '{22.5,22.5,22.5,22.5,16.5,16.5,16.5,16.5,19.5,22,22,22,26,26,26,26,17,17,16.5,16.5,26.5,26.5,26.5,26.5,27,27,27,25,18,18,18,18,20,20,20,20,18.5,18.5,18.5,18.5,16.5,16.5,16.5,16.5,26.5,28.5,28.5,28.5,26.5,26.5,26.5,26.5,10.5,10.5,3.5,3.5,19.5,19.5,19.5,19.5,13,13,13,18,18,18,18,18,21,21,21,21,25,25,25,25,23,23,23,23,31,29.5,29.5,29.5,28.5,28.5,28.5,28.5,14.5,14.5,7,7,15,15,15,15,22.5,22.5,22.5,33,28,28,28,28,33,33,33,33}'),
+    (103, '{22.5,22.5,22.5,22.5,16.5,16.5,16.5,16.5,19.5,22,22,22,26,26,26,26,17,17,16.5,16.5,26.5,26.5,26.5,26.5,27,27,27,25,18,18,18,18,20,20,20,20,18.5,18.5,18.5,18.5,16.5,16.5,16.5,16.5,26.5,28.5,28.5,28.5,26.5,26.5,26.5,26.5,10.5,10.5,3.5,3.5,19.5,19.5,19.5,19.5,13,13,13,18,18,18,18,18,21,21,21,21,25,25,25,25,23,23,23,23,31,29.5,29.5,29.5,28.5,28.5,28.5,28.5,14.5,14.5,7,7,15,15,15,15,22.5,22.5,22.5,33,28,28,28,28,33,33,33,33}'),
+    (104, '{26,26,26,26,26.5,26.5,26.5,26.5,12.5,15,15,15,20,20,20,20,28,28,27.5,27.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5,24.5,27,27,27,27,13,13,13,13,13,13,13,13,24.5,24.5,24.5,24.5,24.5,26.5,26.5,26.5,27.5,27.5,27.5,27.5,20.5,20.5,13.5,13.5,12.5,12.5,12.5,12.5,5.5,5.5,5.5,10.5,26,26,26,26,21,21,21,21,27.5,27.5,27.5,27.5,32,32,32,32,23,21.5,21.5,21.5,22.5,22.5,22.5,22.5,22.5,22.5,15,15,17,17,17,17,20,20,20,30.5,34,34,34,34,28,28,28,28}'),
+    (105, '{26,26,26,26,26.5,26.5,26.5,26.5,12.5,15,15,15,20,20,20,20,28,28,27.5,27.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5,24.5,27,27,27,27,13,13,13,13,13,13,13,13,24.5,24.5,24.5,24.5,24.5,26.5,26.5,26.5,27.5,27.5,27.5,27.5,20.5,20.5,13.5,13.5,12.5,12.5,12.5,12.5,5.5,5.5,5.5,10.5,26,26,26,26,21,21,21,21,27.5,27.5,27.5,27.5,32,32,32,32,23,21.5,21.5,21.5,22.5,22.5,22.5,22.5,22.5,22.5,15,15,17,17,17,17,20,20,20,30.5,34,34,34,34,28,28,28,28}'),
+    (106, '{26,26,26,26,26.5,26.5,26.5,26.5,12.5,15,15,15,20,20,20,20,28,28,27.5,27.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5,24.5,27,27,27,27,13,13,13,13,13,13,13,13,24.5,24.5,24.5,24.5,24.5,26.5,26.5,26.5,27.5,27.5,27.5,27.5,20.5,20.5,13.5,13.5,12.5,12.5,12.5,12.5,5.5,5.5,5.5,10.5,26,26,26,26,21,21,21,21,27.5,27.5,27.5,27.5,32,32,32,32,23,21.5,21.5,21.5,22.5,22.5,22.5,22.5,22.5,22.5,15,15,17,17,17,17,20,20,20,30.5,34,34,34,34,28,28,28,28}'),
+    (107, '{26,26,26,26,26.5,26.5,26.5,26.5,12.5,15,15,15,20,20,20,20,28,28,27.5,27.5,26.5,26.5,26.5,26.5,26.5,26.5,26.5,24.5,27,27,27,27,13,13,13,13,13,13,13,13,24.5,24.5,24.5,24.5,24.5,26.5,26.5,26.5,27.5,27.5,27.5,27.5,20.5,20.5,13.5,13.5,12.5,12.5,12.5,12.5,5.5,5.5,5.5,10.5,26,26,26,26,21,21,21,21,27.5,27.5,27.5,27.5,32,32,32,32,23,21.5,21.5,21.5,22.5,22.5,22.5,22.5,22.5,22.5,15,15,17,17,17,17,20,20,20,30.5,34,34,34,34,28,28,28,28}')
+) AS row_scores (boy_pada, points_by_girl_pada)
+CROSS JOIN LATERAL unnest(row_scores.points_by_girl_pada::real[]) WITH ORDINALITY AS scores (points, ordinality)
+ON CONFLICT (boy_pada, girl_pada) DO UPDATE SET points = EXCLUDED.points;
@@ -0,0 +1,9 @@
+-- Full astro features (nakshatra, rasi, koot attributes, manglik) as computed by
+-- astro_features.compute_astro_features, stamped with the engine version so rows
+-- are recomputed only when ASTRO_FEATURE_VERSION changes.
+ALTER TABLE profiles
+    ADD COLUMN IF NOT EXISTS astro_features JSONB,
+    ADD COLUMN IF NOT EXISTS astro_features_version SMALLINT,
+    ADD COLUMN IF NOT EXISTS manglik BOOLEAN;
+
+CREATE INDEX IF NOT EXISTS profiles_astro_features_version_idx ON profiles (astro_features_version);
@@ -0,0 +1,31 @@
+-- Content-hash identity of a profile: sha256 of the normalized name, dob
+-- (YYYY-MM-DD), tob (HH:MM) and place. Names and places are compared
+-- case-insensitively with runs of whitespace collapsed. Callers pass dob and
+-- tob formatted with to_char, never ::text, whose output depends on the
+-- session DateStyle. Existing rows are hashed by 0007, and the unique index
+-- that lets writers use INSERT ... ON CONFLICT is built by 0008.
+CREATE OR REPLACE FUNCTION profile_identity_hash(name TEXT, dob TEXT, tob TEXT, place TEXT)
+RETURNS BYTEA LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT sha256(convert_to(concat_ws(E'\x1f',
+        lower(regexp_replace(btrim(coalesce(name, '')), '\s+', ' ', 'g')),
+        coalesce(dob, ''),
+        coalesce(left(tob, 5), ''),
+        lower(regexp_replace(btrim(coalesce(place, '')), '\s+', ' ', 'g'))
+    ), 'UTF8'))
+$$;
+
+ALTER TABLE profiles ADD COLUMN IF NOT EXISTS identity_hash BYTEA;
+
+-- Every writer gets the hash, including the Supabase Table Editor
+CREATE OR REPLACE FUNCTION profiles_set_identity_hash() RETURNS TRIGGER LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.identity_hash := profile_identity_hash(
+        NEW.name, to_char(NEW.dob::date, 'YYYY-MM-DD'), to_char(NEW.tob::time, 'HH24:MI'), NEW.place
+    );
+    RETURN NEW;
+END
+$$;
+
+DROP TRIGGER IF EXISTS profiles_identity_hash ON profiles;
+CREATE TRIGGER profiles_identity_hash BEFORE INSERT OR UPDATE OF name, dob, tob, place ON profiles
+    FOR EACH ROW EXECUTE FUNCTION profiles_set_identity_hash();
@@ -0,0 +1,58 @@
+-- migrate: no-transaction
+-- Hash rows written before 0006 and merge duplicates, committing every
+-- 10000 rows/groups so locks and WAL stay bounded on a large table. Safe to
+-- rerun after an interruption: hashed rows are skipped.
+-- The oldest row (lowest id) of a duplicate group is kept and takes lat/lon
+-- and occupation from the newest duplicate that has them when its own are
+-- missing. Rebuild the compatibility matrix afterwards if one is in use, as
+-- merged ids disappear.
+DO $$
+DECLARE
+    batch_size CONSTANT INT := 10000;
+    last_id profiles.id%TYPE;
+    merged INT;
+BEGIN
+    LOOP
+        WITH batch AS (
+            SELECT id FROM profiles WHERE last_id IS NULL OR id > last_id ORDER BY id LIMIT batch_size
+        ), hashed AS (
+            UPDATE profiles p SET identity_hash = profile_identity_hash(
+                p.name, to_char(p.dob::date, 'YYYY-MM-DD'), to_char(p.tob::time, 'HH24:MI'), p.place
+            )
+            FROM batch b WHERE p.id = b.id AND p.identity_hash IS NULL
+        )
+        SELECT max(id) INTO last_id FROM batch;
+        EXIT WHEN last_id IS NULL;
+        COMMIT;
+    END LOOP;
+
+    LOOP
+        WITH groups AS (
+            SELECT identity_hash, (array_agg(id ORDER BY id))[1] AS keep_id
+            FROM profiles WHERE identity_hash IS NOT NULL
+            GROUP BY identity_hash HAVING count(*) > 1
+            LIMIT batch_size
+        ), duplicates AS (
+            SELECT g.keep_id, d.id, d.lat, d.lon, d.occupation
+            FROM groups g JOIN profiles d ON d.identity_hash = g.identity_hash AND d.id <> g.keep_id
+        ), fill AS (
+            SELECT keep_id,
+                (array_agg(lat ORDER BY id DESC) FILTER (WHERE lat IS NOT NULL AND lon IS NOT NULL))[1] AS lat,
+                (array_agg(lon ORDER BY id DESC) FILTER (WHERE lat IS NOT NULL AND lon IS NOT NULL))[1] AS lon,
+                (array_agg(occupation ORDER BY id DESC) FILTER (WHERE occupation IS NOT NULL))[1] AS occupation
+            FROM duplicates GROUP BY keep_id
+        ), kept AS (
+            UPDATE profiles p SET
+                lat = CASE WHEN p.lat IS NULL OR p.lon IS NULL THEN coalesce(f.lat, p.lat) ELSE p.lat END,
+                lon = CASE WHEN p.lat IS NULL OR p.lon IS NULL THEN coalesce(f.lon, p.lon) ELSE p.lon END,
+                occupation = coalesce(p.occupation, f.occupation)
+            FROM fill f WHERE p.id = f.keep_id
+        )
+        DELETE FROM profiles WHERE id IN (SELECT id FROM duplicates);
+        GET DIAGNOSTICS merged = ROW_COUNT;
+        EXIT WHEN merged = 0;
+        RAISE NOTICE 'Merged % duplicate profiles', merged;
+        COMMIT;
+    END LOOP;
+END
+$$;
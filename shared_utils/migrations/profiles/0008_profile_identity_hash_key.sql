@@ -0,0 +1,4 @@
+-- migrate: no-transaction
+-- Built without blocking writes. If the build fails it leaves an INVALID
+-- index behind; drop profiles_identity_hash_key before running migrate again.
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS profiles_identity_hash_key ON profiles (identity_hash);
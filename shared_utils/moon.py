@@ -0,0 +1,205 @@
+import logging
+from typing import Dict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default timezone offset (hours) used by format_dob_for_api
+DEFAULT_TZ_OFFSET = 5.5
+
+NAKSHATRA_SPAN = 360.0 / 27
+PADA_SPAN = NAKSHATRA_SPAN / 4
+RASI_SPAN = 30.0
+
+J2000 = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+
+# Lahiri ayanamsa as defined by the Indian Calendar Reform Committee
+# (23°15'00.658" on 21 March 1956, less nutation), carried by general precession
+LAHIRI_T0 = 2435553.5
+LAHIRI_AYANAMSA_T0 = 23.245524743
+
+# Approximate ΔT (TT - UT, seconds) by year, interpolated linearly
+_DELTA_T_YEARS = np.array(
+    [1900, 1910, 1920, 1930, 1940, 1950, 1960, 1970, 1980, 1990, 2000, 2010, 2020, 2030]
+)
+_DELTA_T_SECONDS = np.array(
+    [-2.7, 10.4, 21.2, 24.0, 24.3, 29.1, 33.1, 40.2, 50.5, 56.9, 63.8, 66.1, 69.4, 72.0]
+)
+
+# Periodic terms for the Moon's longitude (Meeus, Astronomical Algorithms, table 47.A).
+# Columns: multiples of D, M, M', F and the coefficient in 1e-6 degrees.
+_LONGITUDE_TERMS = np.array(
+    [
+        [0, 0, 1, 0, 6288774],
+        [2, 0, -1, 0, 1274027],
+        [2, 0, 0, 0, 658314],
+        [0, 0, 2, 0, 213618],
+        [0, 1, 0, 0, -185116],
+        [0, 0, 0, 2, -114332],
+        [2, 0, -2, 0, 58793],
+        [2, -1, -1, 0, 57066],
+        [2, 0, 1, 0, 53322],
+        [2, -1, 0, 0, 45758],
+        [0, 1, -1, 0, -40923],
+        [1, 0, 0, 0, -34720],
+        [0, 1, 1, 0, -30383],
+        [2, 0, 0, -2, 15327],
+        [0, 0, 1, 2, -12528],
+        [0, 0, 1, -2, 10980],
+        [4, 0, -1, 0, 10675],
+        [0, 0, 3, 0, 10034],
+        [4, 0, -2, 0, 8548],
+        [2, 1, -1, 0, -7888],
+        [2, 1, 0, 0, -6766],
+        [1, 0, -1, 0, -5163],
+        [1, 1, 0, 0, 4987],
+        [2, -1, 1, 0, 4036],
+        [2, 0, 2, 0, 3994],
+        [4, 0, 0, 0, 3861],
+        [2, 0, -3, 0, 3665],
+        [0, 1, -2, 0, -2689],
+        [2, 0, -1, 2, -2602],
+        [2, -1, -2, 0, 2390],
+        [1, 0, 1, 0, -2348],
+        [2, -2, 0, 0, 2236],
+        [0, 1, 2, 0, -2120],
+        [0, 2, 0, 0, -2069],
+        [2, -2, -1, 0, 2048],
+        [2, 0, 1, -2, -1773],
+        [2, 0, 0, 2, -1595],
+        [4, -1, -1, 0, 1215],
+        [0, 0, 2, 2, -1110],
+        [3, 0, -1, 0, -892],
+        [2, 1, 1, 0, -810],
+        [4, -1, -2, 0, 759],
+        [0, 2, -1, 0, -713],
+        [2, 2, -1, 0, -700],
+        [2, 1, -2, 0, 691],
+        [2, -1, 0, -2, 596],
+        [4, 0, 1, 0, 549],
+        [0, 0, 4, 0, 537],
+        [4, -1, 0, 0, 520],
+        [1, 0, -2, 0, -487],
+        [2, 1, 0, -2, -399],
+        [0, 0, 2, -2, -381],
+        [1, 1, 1, 0, 351],
+        [3, 0, -2, 0, -340],
+        [4, 0, -3, 0, 330],
+        [2, -1, 2, 0, 327],
+        [0, 2, 1, 0, -323],
+        [1, 1, -1, 0, 299],
+        [2, 0, 3, 0, 294],
+    ],
+    dtype=np.float64,
+)
+_TERM_MULTIPLES = _LONGITUDE_TERMS[:, :4]
+_TERM_COEFFICIENTS = _LONGITUDE_TERMS[:, 4]
+_TERM_M_POWER = np.abs(_LONGITUDE_TERMS[:, 1])
+
+
+def julian_days(dob, tob, tz_offset=DEFAULT_TZ_OFFSET) -> np.ndarray:
+    """
+    Julian day (UT) for arrays of local birth date/time.
+
+    Args:
+        dob: 'YYYY-MM-DD' strings
+        tob: 'HH:MM' strings
+        tz_offset: offset from UTC in hours (scalar or array)
+    """
+    dates = np.asarray(dob, dtype="datetime64[D]")
+    tob = np.asarray(tob, dtype=str)
+    hours = np.char.partition(tob, ":")
+    minutes = hours[..., 0].astype(np.int64) * 60 + hours[..., 2].astype(np.int64)
+    local_minutes = (dates - np.datetime64("1970-01-01", "D")).astype(
+        np.int64
+    ) * 1440 + minutes
+    utc_minutes = local_minutes - np.asarray(tz_offset, dtype=np.float64) * 60
+    return UNIX_EPOCH_JD + utc_minutes / 1440.0
+
+
+def delta_t_days(jd_ut) -> np.ndarray:
+    """Approximate TT - UT in days"""
+    year = 2000.0 + (np.asarray(jd_ut, dtype=np.float64) - J2000) / 365.25
+    return np.interp(year, _DELTA_T_YEARS, _DELTA_T_SECONDS) / 86400.0
+
+
+def tropical_moon_longitude(jd_tt) -> np.ndarray:
+    """Geocentric ecliptic longitude of the Moon (mean equinox of date, degrees)"""
+    t = (np.asarray(jd_tt, dtype=np.float64) - J2000) / 36525.0
+    t2 = t * t
+    t3 = t2 * t
+    t4 = t3 * t
+
+    mean_longitude = (
+        218.3164477 + 481267.88123421 * t - 0.0015786 * t2 + t3 / 538841 - t4 / 65194000
+    )
+    elongation = (
+        297.8501921 + 445267.1114034 * t - 0.0018819 * t2 + t3 / 545868 - t4 / 113065000
+    )
+    sun_anomaly = 357.5291092 + 35999.0502909 * t - 0.0001536 * t2 + t3 / 24490000
+    moon_anomaly = (
+        134.9633964 + 477198.8675055 * t + 0.0087414 * t2 + t3 / 69699 - t4 / 14712000
+    )
+    latitude_argument = (
+        93.2720950 + 483202.0175233 * t - 0.0036539 * t2 - t3 / 3526000 + t4 / 863310000
+    )
+    a1 = 119.75 + 131.849 * t
+    a2 = 53.09 + 479264.290 * t
+
+    eccentricity = 1 - 0.002516 * t - 0.0000074 * t2
+
+    # (..., 4) @ (4, terms) -> argument of every periodic term for every date
+    arguments = np.radians(
+        np.stack([elongation, sun_anomaly, moon_anomaly, latitude_argument], axis=-1)
+    )
+    phases = arguments @ _TERM_MULTIPLES.T
+    amplitudes = _TERM_COEFFICIENTS * eccentricity[..., None] ** _TERM_M_POWER
+    sigma_l = (amplitudes * np.sin(phases)).sum(axis=-1)
+    sigma_l += (
+        3958 * np.sin(np.radians(a1))
+        + 1962 * np.sin(np.radians(mean_longitude - latitude_argument))
+        + 318 * np.sin(np.radians(a2))
+    )
+    return np.mod(mean_longitude + sigma_l / 1e6, 360.0)
+
+
+def lahiri_ayanamsa(jd_tt) -> np.ndarray:
+    """Mean Lahiri ayanamsa in degrees"""
+    t = (np.asarray(jd_tt, dtype=np.float64) - J2000) / 36525.0
+    t0 = (LAHIRI_T0 - J2000) / 36525.0
+    precession = (5028.796195 * (t - t0) + 1.1054348 * (t * t - t0 * t0)) / 3600.0
+    return LAHIRI_AYANAMSA_T0 + precession
+
+
+def sidereal_moon_longitude(jd_ut) -> np.ndarray:
+    """Sidereal (Lahiri) longitude of the Moon in degrees for Julian days in UT"""
+    jd_tt = np.asarray(jd_ut, dtype=np.float64) + delta_t_days(jd_ut)
+    return np.mod(tropical_moon_longitude(jd_tt) - lahiri_ayanamsa(jd_tt), 360.0)
+
+
+def moon_positions(
+    dob, tob, tz_offset=DEFAULT_TZ_OFFSET, lat=None, lon=None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute moon nakshatra, pada and rasi for arrays of birth data without any network call.
+
+    The moon position is geocentric, as used for kundli matching, so lat/lon
+    do not affect the result; they are accepted so callers can pass profile
+    rows through unchanged.
+
+    Returns:
+        Dict with 'longitude' (sidereal degrees), 'nakshatra' (0-26),
+        'pada' (1-4) and 'rasi' (0-11) arrays
+    """
+    longitude = sidereal_moon_longitude(julian_days(dob, tob, tz_offset))
+    nakshatra = np.minimum((longitude // NAKSHATRA_SPAN).astype(np.int8), 26)
+    pada = (np.mod(longitude, NAKSHATRA_SPAN) // PADA_SPAN).astype(np.int8) + 1
+    rasi = np.minimum((longitude // RASI_SPAN).astype(np.int8), 11)
+    return {
+        "longitude": longitude,
+        "nakshatra": nakshatra,
+        "pada": np.minimum(pada, 4),
+        "rasi": rasi,
+    }
@@ -0,0 +1,350 @@
+import os
+import sys
+import csv
+import json
+import time
+import asyncio
+import logging
+import argparse
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from astro_features import profile_feature_columns, valid_birth_data
+from geocode import close_http_client, geocode_place, normalize_place
+from profile_store import ProfileStore, profile_store
+
+logger = logging.getLogger(__name__)
+
+# Profiles per multi-row upsert
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "1000"))
+# Processes computing astro features; 0 computes them in a thread of the ingesting process
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", str(os.cpu_count() or 1)))
+
+PROFILE_FIELDS = ("name", "dob", "tob", "place", "gender", "occupation", "lat", "lon")
+SHARED_UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _clean(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the profile fields, with blank strings as None and lat/lon as floats"""
+    profile = {}
+    for field in PROFILE_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str):
+            value = value.strip() or None
+        profile[field] = value
+    for field in ("lat", "lon"):
+        try:
+            profile[field] = None if profile[field] is None else float(profile[field])
+        except (TypeError, ValueError):
+            profile[field] = None
+    if profile["gender"]:
+        profile["gender"] = profile["gender"].lower()
+    return profile
+
+
+def read_profiles(path: str, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream profiles from a CSV file with a header row or a JSONL file, one at a time.
+
+    The format follows the file extension unless `fmt` ('csv' or 'jsonl') is
+    given. Unknown columns are dropped.
+    """
+    fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+    with open(path, newline="" if fmt == "csv" else None, encoding="utf-8") as f:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                yield _clean({(k or "").strip().lower(): v for k, v in row.items()})
+        else:
+            for line in f:
+                if line.strip():
+                    yield _clean(json.loads(line))
+
+
+def valid_profile(profile: Dict[str, Any]) -> bool:
+    return (
+        bool(profile["name"])
+        and profile["gender"] in ("male", "female")
+        and valid_birth_data(profile)
+    )
+
+
+class Checkpoint:
+    """
+    Progress of one ingestion run: how many input records are fully written.
+
+    Saved atomically (write to a temporary file, then rename), so a crash
+    leaves either the previous or the new checkpoint.
+    """
+
+    def __init__(self, path: Optional[str], source: str):
+        self.path = path
+        self.source = os.path.abspath(source)
+        self.records = 0
+        self.stats: Dict[str, int] = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                saved = json.load(f)
+            if saved.get("source") != self.source:
+                raise ValueError(
+                    f"Checkpoint {path} belongs to {saved.get('source')}, not {self.source}"
+                )
+            self.records = saved["records"]
+            self.stats = saved.get("stats", {})
+
+    def save(self, records: int, stats: Dict[str, int]):
+        self.records = records
+        self.stats = dict(stats)
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"source": self.source, "records": records, "stats": self.stats}, f
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+async def _lookup(place: str, remote: bool) -> Optional[Dict[str, float]]:
+    try:
+        return await geocode_place(place, remote=remote)
+    except Exception as e:
+        logger.warning(f"Geocoding {place!r} failed: {e}")
+        return None
+
+
+async def geocode_profiles(
+    profiles: List[Dict[str, Any]],
+    known_places: Dict[str, asyncio.Task],
+    remote: bool = True,
+) -> int:
+    """
+    Fill in missing lat/lon from the geocode cache and gazetteer (and Nominatim
+    when `remote`). `known_places` holds one lookup per distinct place for the
+    whole run, shared by batches in flight; returns the number of profiles
+    that got coordinates.
+    """
+    missing = [
+        profile
+        for profile in profiles
+        if (profile["lat"] is None or profile["lon"] is None)
+        and normalize_place(profile["place"] or "")
+    ]
+    for profile in missing:
+        key = normalize_place(profile["place"])
+        if key not in known_places:
+            known_places[key] = asyncio.ensure_future(_lookup(profile["place"], remote))
+    lookups = {
+        key: known_places[key]
+        for key in {normalize_place(profile["place"]) for profile in missing}
+    }
+    await asyncio.gather(*lookups.values())
+
+    geocoded = 0
+    for profile in missing:
+        coordinates = lookups[normalize_place(profile["place"])].result()
+        if coordinates:
+            profile["lat"], profile["lon"] = coordinates["lat"], coordinates["lon"]
+            geocoded += 1
+    return geocoded
+
+
+def _init_worker(path: str):
+    if path not in sys.path:
+        sys.path.append(path)
+
+
+def _batches(
+    records: Iterator[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def ingest(
+    path: str,
+    fmt: Optional[str] = None,
+    batch_size: int = INGEST_BATCH_SIZE,
+    workers: int = INGEST_WORKERS,
+    checkpoint_path: Optional[str] = None,
+    remote_geocode: bool = True,
+    store: ProfileStore = profile_store,
+) -> Dict[str, Any]:
+    """
+    Load profiles from a CSV/JSONL file into the profile store.
+
+    Batches are geocoded, get their astro features computed in a process
+    pool and are written with one multi-row upsert each; several batches are
+    in flight at once. The checkpoint records how many input records are
+    written, counting only batches with every earlier batch also written, so
+    a rerun with the same checkpoint resumes after them. Re-applied batches
+    are harmless since writes are upserts.
+
+    Returns counts of records read, written (inserted/updated), skipped as
+    invalid and geocoded, plus elapsed seconds and records per second.
+    """
+    checkpoint = Checkpoint(checkpoint_path, path)
+    stats = {
+        "read": 0,
+        "inserted": 0,
+        "updated": 0,
+        "skipped": 0,
+        "geocoded": 0,
+        **checkpoint.stats,
+    }
+    if checkpoint.records:
+        logger.info(f"Resuming {path} after {checkpoint.records} records")
+
+    loop = asyncio.get_running_loop()
+    executor: Optional[Executor] = None
+    if workers > 0:
+        executor = ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(SHARED_UTILS_DIR,)
+        )
+    known_places: Dict[str, asyncio.Task] = {}
+    # Enough batches in flight to keep the workers and the database busy
+    slots = asyncio.Semaphore(max(workers, 1) + 2)
+    finished: Dict[int, Tuple[int, Dict[str, int]]] = {}
+    next_to_commit = 0
+    committed_records = checkpoint.records
+    started = time.perf_counter()
+    started_records = checkpoint.records
+
+    async def process(batch: List[Dict[str, Any]]) -> Dict[str, int]:
+        counts = {
+            "read": len(batch),
+            "geocoded": await geocode_profiles(batch, known_places, remote_geocode),
+        }
+        profiles = [profile for profile in batch if valid_profile(profile)]
+        counts["skipped"] = len(batch) - len(profiles)
+        if executor is not None:
+            features = await loop.run_in_executor(
+                executor, profile_feature_columns, profiles
+            )
+        else:
+            features = await asyncio.to_thread(profile_feature_columns, profiles)
+        counts["inserted"], counts["updated"] = await store.upsert_profiles(
+            profiles, features
+        )
+        return counts
+
+    def commit(index: int, records: int, counts: Dict[str, int]):
+        nonlocal next_to_commit, committed_records
+        finished[index] = (records, counts)
+        while next_to_commit in finished:
+            records, counts = finished.pop(next_to_commit)
+            for key, value in counts.items():
+                stats[key] += value
+            committed_records += records
+            next_to_commit += 1
+            checkpoint.save(committed_records, stats)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Ingested {committed_records} records ({stats['inserted']} inserted, {stats['updated']} updated, "
+            f"{stats['skipped']} skipped), {(committed_records - started_records) / max(elapsed, 1e-9):.0f} records/s"
+        )
+
+    async def run(index: int, batch: List[Dict[str, Any]]):
+        try:
+            commit(index, len(batch), await process(batch))
+        finally:
+            slots.release()
+
+    records = read_profiles(path, fmt)
+    # Skip what the checkpoint says is already written
+    for _ in zip(range(checkpoint.records), records):
+        pass
+
+    tasks = set()
+    try:
+        await store.migrate()
+        for index, batch in enumerate(_batches(records, batch_size)):
+            await slots.acquire()
+            task = asyncio.create_task(run(index, batch))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            # Stop reading once a batch failed; its checkpoint is not advanced
+            failed = [t for t in tasks if t.done() and t.exception()]
+            if failed:
+                raise failed[0].exception()
+        if tasks:
+            await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - started
+    return {
+        **stats,
+        "records": committed_records,
+        "seconds": round(elapsed, 2),
+        "records_per_second": round(
+            (committed_records - started_records) / max(elapsed, 1e-9), 1
+        ),
+    }
+
+
+async def _run(args: argparse.Namespace) -> Dict[str, Any]:
+    try:
+        return await ingest(
+            args.path,
+            fmt=args.format,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            checkpoint_path=args.checkpoint,
+            remote_geocode=not args.offline_geocode,
+        )
+    finally:
+        await close_http_client()
+        await profile_store.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Bulk load profiles from CSV or JSONL into the profile store"
+    )
+    parser.add_argument("path", help="CSV with a header row, or JSONL (.jsonl/.ndjson)")
+    parser.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        help="Input format (default: from the file extension)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=INGEST_BATCH_SIZE, help="Profiles per upsert"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=INGEST_WORKERS,
+        help="Astro feature processes (0: none)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Progress file; rerunning with it resumes where the last run stopped",
+    )
+    parser.add_argument(
+        "--offline-geocode",
+        action="store_true",
+        help="Resolve places from the gazetteer and geocode cache only, without Nominatim",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    stats = asyncio.run(_run(args))
+    print(json.dumps(stats))
+    logger.info(
+        "Rebuild the compatibility matrix (`python shared_utils/compatibility_matrix.py`) "
+        "and the feature store (`python shared_utils/feature_store.py`) if they are in use"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,682 @@
+import os
+import sys
+import json
+import math
+import asyncio
+import argparse
+import uuid
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+import asyncpg
+
+from astro_features import (
+    ASTRO_FEATURE_VERSION,
+    ensure_astro_features,
+    features_current,
+    profile_feature_columns,
+)
+
+logger = logging.getLogger(__name__)
+
+PROFILE_POOL_MIN_SIZE = int(os.getenv("PROFILE_POOL_MIN_SIZE", "1"))
+PROFILE_POOL_MAX_SIZE = int(os.getenv("PROFILE_POOL_MAX_SIZE", "10"))
+PROFILE_COMMAND_TIMEOUT = float(os.getenv("PROFILE_COMMAND_TIMEOUT", "30"))
+# Rows per keyset page when streaming candidates
+PROFILE_PAGE_SIZE = int(os.getenv("PROFILE_PAGE_SIZE", "1000"))
+
+# geo_cell indexes profiles by 1-degree grid cell (see migrations/profiles/0003).
+# Beyond this many cells the distance filter skips the cell index and only checks distance
+GEO_MAX_CELLS = 4096
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "migrations", "profiles"
+)
+# First line of a migration that must run outside a transaction
+NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+
+# Columns downstream agents need for matching and display
+CANDIDATE_COLUMNS = (
+    "id",
+    "name",
+    "dob",
+    "tob",
+    "place",
+    "gender",
+    "occupation",
+    "lat",
+    "lon",
+    "astro_features",
+)
+
+# Astro columns written on insert and by backfill_astro_features, see astro_features.profile_feature_columns
+ASTRO_COLUMNS = (
+    "moon_nakshatra",
+    "moon_pada",
+    "moon_rasi",
+    "nakshatra_pada",
+    "manglik",
+    "astro_features_version",
+    "astro_features",
+)
+
+# Select expressions that return the same JSON-friendly values whether dob/tob
+# are stored as date/time or as ISO text, under any DateStyle
+_COLUMN_SQL = {
+    "id": "id",
+    "name": "name",
+    "dob": "to_char(dob::date, 'YYYY-MM-DD') AS dob",
+    "tob": "to_char(tob::time, 'HH24:MI') AS tob",
+    "place": "place",
+    "gender": "gender",
+    "occupation": "occupation",
+    "lat": "lat::float8 AS lat",
+    "lon": "lon::float8 AS lon",
+    "moon_nakshatra": "moon_nakshatra",
+    "moon_pada": "moon_pada",
+    "moon_rasi": "moon_rasi",
+    "nakshatra_pada": "nakshatra_pada",
+    "manglik": "manglik",
+    "astro_features_version": "astro_features_version",
+    "astro_features": "astro_features",
+}
+
+
+def select_list(columns: Iterable[str]) -> str:
+    """SQL select list for a column projection; rejects unknown columns"""
+    unknown = [c for c in columns if c not in _COLUMN_SQL]
+    if unknown:
+        raise ValueError(f"Unknown profile columns: {unknown}")
+    return ", ".join(_COLUMN_SQL[c] for c in columns)
+
+
+def record_to_profile(record: asyncpg.Record) -> Dict[str, Any]:
+    profile = dict(record)
+    if isinstance(profile.get("id"), uuid.UUID):
+        profile["id"] = str(profile["id"])
+    return profile
+
+
+async def _init_connection(conn: asyncpg.Connection):
+    await conn.set_type_codec(
+        "jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+    )
+
+
+def _as_date(value: Any) -> Optional[date]:
+    if value is None or isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _as_time(value: Any):
+    if value is None or not isinstance(value, str):
+        return value
+    return datetime.strptime(value[:5], "%H:%M").time()
+
+
+def _as_float(value: Any) -> Optional[float]:
+    return None if value in (None, "") else float(value)
+
+
+def identity_hash_sql(first_param: int) -> str:
+    """
+    SQL for the identity hash of the four identity_args() parameters from
+    $first_param on; profile_identity_hash() is defined in migrations/profiles/0006
+    """
+    return f"profile_identity_hash(${first_param}, ${first_param + 1}, ${first_param + 2}, ${first_param + 3})"
+
+
+def identity_args(profile: Dict[str, Any]) -> tuple:
+    """name, dob, tob and place as text the way the stored columns are hashed"""
+    dob, tob = profile.get("dob"), profile.get("tob")
+    try:
+        dob = None if dob is None else _as_date(dob).isoformat()
+    except ValueError:
+        dob = str(dob)
+    try:
+        tob = None if tob is None else _as_time(tob).strftime("%H:%M")
+    except ValueError:
+        tob = str(tob)
+    return profile.get("name"), dob, tob, profile.get("place")
+
+
+# Upsert on the profile identity. A matched row gets the new gender,
+# occupation and astro columns, keeps lat/lon when the new ones are missing,
+# and is left alone when none of that changes
+_ON_IDENTITY_CONFLICT = (
+    "ON CONFLICT (identity_hash) DO UPDATE SET gender = EXCLUDED.gender, occupation = EXCLUDED.occupation, "
+    "lat = coalesce(EXCLUDED.lat, profiles.lat), lon = coalesce(EXCLUDED.lon, profiles.lon), "
+    + ", ".join(f"{column} = EXCLUDED.{column}" for column in ASTRO_COLUMNS)
+    + " WHERE (profiles.gender, profiles.occupation, profiles.lat, profiles.lon, profiles.astro_features_version) "
+    "IS DISTINCT FROM (EXCLUDED.gender, EXCLUDED.occupation, coalesce(EXCLUDED.lat, profiles.lat), "
+    "coalesce(EXCLUDED.lon, profiles.lon), EXCLUDED.astro_features_version)"
+)
+
+
+def geo_cells(lat: float, lon: float, radius_km: float) -> Optional[List[int]]:
+    """
+    geo_cell values of every grid cell within `radius_km` of (lat, lon).
+
+    Covers the bounding box of the circle, wrapping at the antimeridian.
+    Returns None when the box is too large for a cell lookup to help.
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    lat_min, lat_max = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+    rows = range(math.floor(lat_min + 90), math.floor(lat_max + 90) + 1)
+
+    widest = max(abs(lat_min), abs(lat_max))
+    dlon = 180.0 if widest >= 89.9 else dlat / math.cos(math.radians(widest))
+    if dlon >= 180:
+        columns = range(360)
+    else:
+        start = math.floor(lon - dlon + 180)
+        columns = [c % 360 for c in range(start, math.floor(lon + dlon + 180) + 1)]
+
+    if len(rows) * len(columns) > GEO_MAX_CELLS:
+        return None
+    return [row * 360 + column for row in rows for column in columns]
+
+
+def _years_before(day: date, years: int) -> date:
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        # 29 February in a non-leap year
+        return day.replace(year=day.year - years, day=28)
+
+
+def candidate_filter_sql(filters: Optional[Dict[str, Any]], first_param: int) -> tuple:
+    """
+    SQL conditions and parameters for optional candidate filters.
+
+    Supported keys: 'lat', 'lon' and 'max_distance_km' (great-circle distance,
+    prefiltered on the geo_cell index), 'min_age' / 'max_age' (whole years,
+    as a dob range), 'occupation' (a name or list of names, case-insensitive)
+    and 'min_guna' with the user's 'nakshatra_pada' (Guna Milan points looked
+    up in the guna_scores table).
+    Parameter placeholders start at $first_param. Returns (sql, params) where sql
+    is "" or begins with " AND ".
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+
+    def param(value: Any) -> str:
+        params.append(value)
+        return f"${first_param + len(params) - 1}"
+
+    filters = filters or {}
+    radius = filters.get("max_distance_km")
+    if (
+        radius is not None
+        and filters.get("lat") is not None
+        and filters.get("lon") is not None
+    ):
+        lat, lon, radius = float(filters["lat"]), float(filters["lon"]), float(radius)
+        cells = geo_cells(lat, lon, radius)
+        if cells is not None:
+            conditions.append(f"geo_cell = ANY({param(cells)}::int[])")
+        lat_param, lon_param = param(lat), param(lon)
+        conditions.append(
+            f"2 * {EARTH_RADIUS_KM} * asin(least(1, sqrt("
+            f"power(sin(radians(lat - {lat_param}::float8) / 2), 2) + "
+            f"cos(radians({lat_param}::float8)) * cos(radians(lat)) * "
+            f"power(sin(radians(lon - {lon_param}::float8) / 2), 2)))) <= {param(radius)}::float8"
+        )
+
+    today = filters.get("today") or date.today()
+    if filters.get("min_age") is not None:
+        conditions.append(
+            f"dob <= {param(_years_before(today, int(filters['min_age'])))}::date"
+        )
+    if filters.get("max_age") is not None:
+        # Still max_age until the day before the next birthday
+        earliest = _years_before(today, int(filters["max_age"]) + 1) + timedelta(days=1)
+        conditions.append(f"dob >= {param(earliest)}::date")
+
+    if (
+        filters.get("min_guna") is not None
+        and filters.get("nakshatra_pada") is not None
+    ):
+        # The user is scored as the boy, as in kundli_match_agent
+        conditions.append(
+            f"nakshatra_pada IN (SELECT girl_pada FROM guna_scores "
+            f"WHERE boy_pada = {param(int(filters['nakshatra_pada']))}::smallint "
+            f"AND points >= {param(float(filters['min_guna']))}::real)"
+        )
+
+    occupation = filters.get("occupation")
+    if occupation:
+        names = [occupation] if isinstance(occupation, str) else list(occupation)
+        conditions.append(
+            f"lower(occupation) = ANY({param([n.strip().lower() for n in names])}::text[])"
+        )
+
+    return "".join(f" AND {c}" for c in conditions), params
+
+
+class ProfileStore:
+    """
+    Async access to the profiles table over an asyncpg connection pool.
+
+    asyncpg prepares every distinct query once per pooled connection and
+    reuses the prepared statement on later calls. Queries only select the
+    columns callers ask for.
+    """
+
+    def __init__(
+        self,
+        dsn: Optional[str] = None,
+        min_size: int = PROFILE_POOL_MIN_SIZE,
+        max_size: int = PROFILE_POOL_MAX_SIZE,
+        schema: Optional[str] = None,
+    ):
+        self._dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.schema = schema
+        self._pool: Optional[asyncpg.Pool] = None
+
+    @property
+    def dsn(self) -> str:
+        # Postgres connection string of the profiles database (Supabase: Project Settings > Database).
+        # Read lazily so agents may call load_dotenv() after importing this module
+        return (
+            self._dsn
+            if self._dsn is not None
+            else os.getenv("PROFILES_DATABASE_URL", "")
+        )
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.dsn)
+
+    async def pool(self) -> asyncpg.Pool:
+        """Create the pool on first use"""
+        if self._pool is None:
+            if not self.dsn:
+                raise RuntimeError("PROFILES_DATABASE_URL is not set")
+            server_settings = {"search_path": self.schema} if self.schema else None
+            self._pool = await asyncpg.create_pool(
+                self.dsn,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                command_timeout=PROFILE_COMMAND_TIMEOUT,
+                server_settings=server_settings,
+                init=_init_connection,
+            )
+            logger.info(f"Profile store pool created (max_size={self.max_size})")
+        return self._pool
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def migrate(self) -> List[str]:
+        """
+        Apply pending SQL files from migrations/profiles in name order; returns the applied names.
+
+        Each file runs in its own transaction, except files starting with
+        NO_TRANSACTION_MARKER: those hold a single statement that manages its
+        own transactions (a DO block committing per batch, CREATE INDEX
+        CONCURRENTLY) and must be safe to rerun if interrupted.
+        """
+        pool = await self.pool()
+        applied = []
+        async with pool.acquire() as conn:
+            await conn.execute(
+                "CREATE TABLE IF NOT EXISTS profile_schema_migrations ("
+                "name TEXT PRIMARY KEY, applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+            )
+            done = {
+                r["name"]
+                for r in await conn.fetch("SELECT name FROM profile_schema_migrations")
+            }
+            for name in sorted(os.listdir(MIGRATIONS_DIR)):
+                if not name.endswith(".sql") or name in done:
+                    continue
+                with open(os.path.join(MIGRATIONS_DIR, name)) as f:
+                    sql = f.read()
+                if sql.startswith(NO_TRANSACTION_MARKER):
+                    await conn.execute(sql)
+                    await conn.execute(
+                        "INSERT INTO profile_schema_migrations (name) VALUES ($1)", name
+                    )
+                else:
+                    async with conn.transaction():
+                        await conn.execute(sql)
+                        await conn.execute(
+                            "INSERT INTO profile_schema_migrations (name) VALUES ($1)",
+                            name,
+                        )
+                logger.info(f"Applied profile migration {name}")
+                applied.append(name)
+        return applied
+
+    async def fetch_all(
+        self, columns: Iterable[str] = CANDIDATE_COLUMNS
+    ) -> List[Dict[str, Any]]:
+        pool = await self.pool()
+        rows = await pool.fetch(f"SELECT {select_list(columns)} FROM profiles")
+        return [record_to_profile(r) for r in rows]
+
+    async def fetch_by_gender(
+        self, gender: str, columns: Iterable[str] = CANDIDATE_COLUMNS
+    ) -> List[Dict[str, Any]]:
+        pool = await self.pool()
+        rows = await pool.fetch(
+            f"SELECT {select_list(columns)} FROM profiles WHERE gender = $1", gender
+        )
+        return [record_to_profile(r) for r in rows]
+
+    async def fetch_page(
+        self,
+        gender: str,
+        after_id: Optional[Any] = None,
+        limit: int = PROFILE_PAGE_SIZE,
+        columns: Iterable[str] = CANDIDATE_COLUMNS,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        One page of profiles of a gender in id order, starting after `after_id`.
+
+        Pages with a keyset cursor on (gender, id) rather than OFFSET, so each
+        page is an index range scan however deep into the table it is. The id
+        column is always selected since it is the cursor. `filters` are as for
+        candidate_filter_sql().
+        """
+        columns = list(columns)
+        if "id" not in columns:
+            columns.insert(0, "id")
+        pool = await self.pool()
+        if after_id is None:
+            filter_sql, params = candidate_filter_sql(filters, 3)
+            rows = await pool.fetch(
+                f"SELECT {select_list(columns)} FROM profiles WHERE gender = $1{filter_sql} ORDER BY id LIMIT $2",
+                gender,
+                limit,
+                *params,
+            )
+        else:
+            filter_sql, params = candidate_filter_sql(filters, 4)
+            rows = await pool.fetch(
+                f"SELECT {select_list(columns)} FROM profiles "
+                f"WHERE gender = $1 AND id > $2{filter_sql} ORDER BY id LIMIT $3",
+                gender,
+                after_id,
+                limit,
+                *params,
+            )
+        return [record_to_profile(r) for r in rows]
+
+    async def iter_candidates(
+        self,
+        gender: str,
+        chunk_size: int = PROFILE_PAGE_SIZE,
+        columns: Iterable[str] = CANDIDATE_COLUMNS,
+        filters: Optional[Dict[str, Any]] = None,
+        after_id: Optional[Any] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream profiles of a gender matching `filters` with ids above `after_id` as lists of at most `chunk_size` rows"""
+        columns = list(columns)
+        while True:
+            page = await self.fetch_page(gender, after_id, chunk_size, columns, filters)
+            if not page:
+                return
+            yield page
+            if len(page) < chunk_size:
+                return
+            after_id = page[-1]["id"]
+
+    async def find_profile(
+        self, profile: Dict[str, Any], columns: Iterable[str] = CANDIDATE_COLUMNS
+    ) -> Optional[Dict[str, Any]]:
+        """Existing profile with the same identity (name, place, dob and tob, see identity_hash_sql)"""
+        pool = await self.pool()
+        record = await pool.fetchrow(
+            f"SELECT {select_list(columns)} FROM profiles WHERE identity_hash = {identity_hash_sql(1)}",
+            *identity_args(profile),
+        )
+        return record_to_profile(record) if record is not None else None
+
+    async def find_profile_id(self, profile: Dict[str, Any]) -> Optional[Any]:
+        """Id of an existing profile with the same identity"""
+        found = await self.find_profile(profile, ("id",))
+        return found["id"] if found else None
+
+    async def upsert_profile(self, profile: Dict[str, Any]) -> Tuple[Any, bool]:
+        """
+        Insert a profile with its astro features, or update the row with the
+        same identity in the same statement. Returns (id, inserted).
+
+        An existing row keeps its lat/lon when the new ones are missing and is
+        only rewritten when something changed.
+        """
+        features = profile_feature_columns([profile])[0] or {}
+        pool = await self.pool()
+        record = await pool.fetchrow(
+            f"INSERT INTO profiles (name, dob, tob, place, gender, occupation, lat, lon, {', '.join(ASTRO_COLUMNS)}) "
+            "VALUES ($1, $2::date, $3::time, $4, $5, $6, $7::float8, $8::float8, "
+            f"$9, $10, $11, $12, $13, $14, $15) {_ON_IDENTITY_CONFLICT} RETURNING id, (xmax = 0) AS inserted",
+            profile.get("name"),
+            _as_date(profile.get("dob")),
+            _as_time(profile.get("tob")),
+            profile.get("place"),
+            profile.get("gender"),
+            profile.get("occupation"),
+            _as_float(profile.get("lat")),
+            _as_float(profile.get("lon")),
+            *(features.get(column) for column in ASTRO_COLUMNS),
+        )
+        if record is None:
+            # Unchanged existing row
+            return await self.find_profile_id(profile), False
+        return record["id"], record["inserted"]
+
+    async def insert_profile(self, profile: Dict[str, Any]) -> Any:
+        """Insert a profile with its astro features (or update the same identity) and return its id"""
+        profile_id, _ = await self.upsert_profile(profile)
+        return profile_id
+
+    async def upsert_profiles(
+        self,
+        profiles: List[Dict[str, Any]],
+        features: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> Tuple[int, int]:
+        """
+        Insert or update many profiles in one statement; returns (inserted, updated).
+
+        Rows are matched on the identity hash as in upsert_profile, which also
+        decides what an update changes; unchanged rows count as neither.
+        `features` are the rows' profile_feature_columns when already
+        computed. Within the batch the last profile with a given identity wins.
+        """
+        if features is None:
+            features = profile_feature_columns(profiles)
+        if not profiles:
+            return 0, 0
+        features = [feature or {} for feature in features]
+
+        values = [
+            [profile.get("name") for profile in profiles],
+            [_as_date(profile.get("dob")) for profile in profiles],
+            [_as_time(profile.get("tob")) for profile in profiles],
+            [profile.get("place") for profile in profiles],
+            [profile.get("gender") for profile in profiles],
+            [profile.get("occupation") for profile in profiles],
+            [_as_float(profile.get("lat")) for profile in profiles],
+            [_as_float(profile.get("lon")) for profile in profiles],
+        ] + [[feature.get(column) for feature in features] for column in ASTRO_COLUMNS]
+        columns = ", ".join(
+            ("name", "dob", "tob", "place", "gender", "occupation", "lat", "lon")
+            + ASTRO_COLUMNS
+        )
+        types = (
+            "text",
+            "date",
+            "time",
+            "text",
+            "text",
+            "text",
+            "float8",
+            "float8",
+            "smallint",
+            "smallint",
+            "smallint",
+            "smallint",
+            "boolean",
+            "smallint",
+            "jsonb",
+        )
+        unnest = ", ".join(f"${i}::{t}[]" for i, t in enumerate(types, start=1))
+
+        pool = await self.pool()
+        # ON CONFLICT may touch a row once per statement, so duplicates within
+        # the batch are dropped first, keeping the last
+        record = await pool.fetchrow(
+            f"WITH input AS (SELECT *, profile_identity_hash(name, to_char(dob, 'YYYY-MM-DD'), to_char(tob, 'HH24:MI'), place) AS identity_hash "
+            f"FROM unnest({unnest}) WITH ORDINALITY AS t({columns}, ord)), "
+            f"written AS (INSERT INTO profiles ({columns}) "
+            f"SELECT DISTINCT ON (identity_hash) {columns} FROM input ORDER BY identity_hash, ord DESC "
+            f"{_ON_IDENTITY_CONFLICT} RETURNING (xmax = 0) AS inserted) "
+            "SELECT count(*) FILTER (WHERE inserted) AS inserted, count(*) FILTER (WHERE NOT inserted) AS updated "
+            "FROM written",
+            *values,
+        )
+        return record["inserted"], record["updated"]
+
+    async def save_astro_features(
+        self, profile_id: Any, profile: Dict[str, Any]
+    ) -> bool:
+        """Store the profile's astro features on an existing row; False if the birth data is invalid"""
+        features = profile_feature_columns([profile])[0]
+        if features is None:
+            return False
+        pool = await self.pool()
+        await pool.execute(
+            "UPDATE profiles SET moon_nakshatra = $2, moon_pada = $3, moon_rasi = $4, nakshatra_pada = $5, "
+            "manglik = $6, astro_features_version = $7, astro_features = $8 WHERE id = $1",
+            profile_id,
+            *(features[column] for column in ASTRO_COLUMNS),
+        )
+        return True
+
+    async def backfill_astro_features(self, batch_size: int = PROFILE_PAGE_SIZE) -> int:
+        """
+        Compute astro features for profiles that have none, were computed by
+        another ASTRO_FEATURE_VERSION, or lack the lagna check although lat/lon
+        are now known. Returns the number of profiles updated.
+        """
+        pool = await self.pool()
+        updated = 0
+        after_id = None
+        while True:
+            rows = await pool.fetch(
+                f"SELECT {select_list(('id', 'dob', 'tob', 'lat', 'lon'))} FROM profiles "
+                "WHERE dob IS NOT NULL AND tob IS NOT NULL "
+                "AND (astro_features_version IS DISTINCT FROM $3 "
+                "OR (lat IS NOT NULL AND astro_features #> '{manglik,from_lagna}' = 'null'::jsonb)) "
+                "AND ($1::bigint IS NULL OR id > $1) ORDER BY id LIMIT $2",
+                after_id,
+                batch_size,
+                ASTRO_FEATURE_VERSION,
+            )
+            if not rows:
+                return updated
+            profiles = [record_to_profile(r) for r in rows]
+            batch = [
+                (p["id"], *(f[column] for column in ASTRO_COLUMNS))
+                for p, f in zip(profiles, profile_feature_columns(profiles))
+                if f
+            ]
+            if batch:
+                await pool.executemany(
+                    "UPDATE profiles SET moon_nakshatra = $2, moon_pada = $3, moon_rasi = $4, nakshatra_pada = $5, "
+                    "manglik = $6, astro_features_version = $7, astro_features = $8 WHERE id = $1",
+                    batch,
+                )
+            updated += len(batch)
+            after_id = profiles[-1]["id"]
+            logger.info(f"Backfilled astro features for {updated} profiles")
+
+    async def insert_if_absent(self, profile: Dict[str, Any]) -> bool:
+        """Insert the profile unless one with the same identity exists; returns True if inserted"""
+        _, inserted = await self.upsert_profile(profile)
+        return inserted
+
+
+# Shared per agent process
+profile_store = ProfileStore()
+
+
+async def attach_astro_features(user_profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Attach locally computed astro features to the profile. Features already
+    stored for this profile are reused unless the engine version changed,
+    in which case the stored ones are replaced.
+    """
+    profile = dict(user_profile)
+    stored = None
+    if profile_store.configured:
+        try:
+            stored = await profile_store.find_profile(
+                profile, ("id", "lat", "lon", "astro_features")
+            )
+        except Exception as e:
+            logger.warning(f"Profile lookup failed: {e}")
+
+    if stored and features_current({**profile, **stored}):
+        profile["astro_features"] = stored["astro_features"]
+        return profile
+
+    # Stored lat/lon allow the lagna based manglik check before geocoding
+    source = {**(stored or {}), **profile}
+    source.pop("astro_features", None)
+    features = ensure_astro_features([source])[0]
+    if features is None:
+        logger.warning("Invalid birth data, astro features not computed")
+        return profile
+    profile["astro_features"] = features
+
+    if stored:
+        try:
+            await profile_store.save_astro_features(
+                stored["id"], {**source, "astro_features": features}
+            )
+        except Exception as e:
+            logger.warning(f"Saving astro features failed: {e}")
+    return profile
+
+
+async def _run_command(command: str):
+    try:
+        if command in ("migrate", "backfill"):
+            applied = await profile_store.migrate()
+            logger.info(f"Applied {len(applied)} profile migrations")
+        if command == "backfill":
+            updated = await profile_store.backfill_astro_features()
+            logger.info(f"Backfilled astro features for {updated} profiles")
+    finally:
+        await profile_store.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Maintain the profiles database (PROFILES_DATABASE_URL)"
+    )
+    parser.add_argument(
+        "command",
+        choices=["migrate", "backfill"],
+        help="migrate: apply pending migrations; backfill: also compute missing or stale astro features",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run_command(args.command))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,15 @@
 import os
+import time
+import asyncio
 import httpx
 import logging
-from datetime import datetime
-from typing import Dict, Any
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
 from dotenv import load_dotenv
+from rate_limit import TokenBucket
+from resilience import get_endpoint
+from result_cache import ResultCache, DEFAULT_CACHE_DIR
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -25,53 +31,316 @@ else:
     # If no .env file found, try loading from current directory
     load_dotenv()
 
-async def get_access_token():
-    """Get OAuth2 access token from Prokerala"""
+TOKEN_URL = "https://api.prokerala.com/token"
+KUNDLI_MATCHING_URL = "https://api.prokerala.com/v2/astrology/kundli-matching"
+
+# Connection pool settings for the shared HTTP client
+PROKERALA_MAX_CONNECTIONS = int(os.getenv("PROKERALA_MAX_CONNECTIONS", "20"))
+PROKERALA_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("PROKERALA_MAX_KEEPALIVE_CONNECTIONS", "10")
+)
+PROKERALA_KEEPALIVE_EXPIRY = float(os.getenv("PROKERALA_KEEPALIVE_EXPIRY", "30"))
+PROKERALA_TIMEOUT = float(os.getenv("PROKERALA_TIMEOUT", "15"))
+PROKERALA_CONNECT_TIMEOUT = float(os.getenv("PROKERALA_CONNECT_TIMEOUT", "5"))
+PROKERALA_HTTP2 = os.getenv("PROKERALA_HTTP2", "true").lower() == "true"
+
+# Request rate allowed by the Prokerala plan (requests per second and burst size)
+PROKERALA_RATE_LIMIT = float(os.getenv("PROKERALA_RATE_LIMIT", "5"))
+PROKERALA_BURST = float(os.getenv("PROKERALA_BURST", "5"))
+
+rate_limiter = TokenBucket(PROKERALA_RATE_LIMIT, PROKERALA_BURST)
+
+# Race a second kundli match request against one slower than the p95 latency
+PROKERALA_HEDGE = os.getenv("PROKERALA_HEDGE", "false").lower() == "true"
+
+# Circuit breaker, retries and hedging for kundli match requests; every
+# attempt, retries and hedges included, waits for the rate limiter
+kundli_match_endpoint = get_endpoint(
+    "prokerala", hedge=PROKERALA_HEDGE, throttle=rate_limiter.acquire
+)
+
+# Kundli match results are cached per normalized birth-data pair
+PROKERALA_API_VERSION = "v2"
+PROKERALA_AYANAMSA = 1  # Lahiri
+PROKERALA_CACHE_ENABLED = os.getenv("PROKERALA_CACHE_ENABLED", "true").lower() == "true"
+PROKERALA_CACHE_PATH = os.getenv(
+    "PROKERALA_CACHE_PATH", os.path.join(DEFAULT_CACHE_DIR, "kundli_match.sqlite3")
+)
+PROKERALA_CACHE_TTL = float(os.getenv("PROKERALA_CACHE_TTL", str(30 * 24 * 3600)))
+PROKERALA_CACHE_MEMORY_SIZE = int(os.getenv("PROKERALA_CACHE_MEMORY_SIZE", "10000"))
+PROKERALA_CACHE_MAX_ROWS = int(os.getenv("PROKERALA_CACHE_MAX_ROWS", "1000000"))
+
+_match_cache: Optional[ResultCache] = None
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Long-lived keep-alive client shared by all Prokerala calls in this process"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        http2 = PROKERALA_HTTP2 and http2_available()
+        _http_client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=PROKERALA_MAX_CONNECTIONS,
+                max_keepalive_connections=PROKERALA_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=PROKERALA_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(PROKERALA_TIMEOUT, connect=PROKERALA_CONNECT_TIMEOUT),
+        )
+        logger.info(
+            f"Created Prokerala HTTP client (http2={http2}, max_connections={PROKERALA_MAX_CONNECTIONS})"
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared client; call once on agent or batch job shutdown"""
+    global _http_client
+    token_manager.close()
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.info("Closed Prokerala HTTP client")
+    _http_client = None
+
+
+# Refresh this many seconds before the token's expires_in runs out
+TOKEN_REFRESH_MARGIN = float(os.getenv("PROKERALA_TOKEN_REFRESH_MARGIN", "60"))
+
+
+async def fetch_access_token() -> Optional[Dict[str, Any]]:
+    """Request a new OAuth2 access token from Prokerala, returns the token response or None"""
     logger.info("Attempting to get Prokerala access token...")
     try:
         client_id = os.getenv("PROKERALA_CLIENT_ID")
         client_secret = os.getenv("PROKERALA_CLIENT_SECRET")
-        
+
         if not client_id or not client_secret:
-            logger.error("PROKERALA_CLIENT_ID or PROKERALA_CLIENT_SECRET not found in environment variables!")
+            logger.error(
+                "PROKERALA_CLIENT_ID or PROKERALA_CLIENT_SECRET not found in environment variables!"
+            )
             return None
-        
+
         logger.info("Making token request to Prokerala API...")
-        async with httpx.AsyncClient() as client:
-            data = {
-                "grant_type": "client_credentials",
-                "client_id": client_id,
-                "client_secret": client_secret
-            }
-            response = await client.post("https://api.prokerala.com/token", data=data)
-            result = response.json()
-            
-            access_token = result.get("access_token")
-            if access_token:
-                logger.info("Successfully obtained access token")
-            else:
-                logger.error("No access token in response")
-                return None
-        return access_token
+        data = {
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret,
+        }
+        response = await get_http_client().post(TOKEN_URL, data=data)
+        result = response.json()
+
+        if result.get("access_token"):
+            logger.info("Successfully obtained access token")
+        else:
+            logger.error("No access token in response")
+            return None
+        return result
     except Exception as e:
         logger.error(f"Error getting access token: {e}")
         return None
 
+
+class TokenManager:
+    """
+    Process-wide cache for the Prokerala access token.
+
+    The token is reused until TOKEN_REFRESH_MARGIN seconds before it expires.
+    Concurrent callers share a single refresh, and a background task renews
+    the token ahead of expiry so match calls rarely wait on the token endpoint.
+    """
+
+    def __init__(self, refresh_margin: float = TOKEN_REFRESH_MARGIN):
+        self.refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "cache_hits": 0,
+            "fetches": 0,
+            "fetch_failures": 0,
+            "background_refreshes": 0,
+            "fetch_seconds_total": 0.0,
+            "fetch_seconds_max": 0.0,
+            "last_fetch_seconds": 0.0,
+        }
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._token is not None
+            and time.monotonic() < self._expires_at - self.refresh_margin
+        )
+
+    async def get_token(self) -> Optional[str]:
+        """Return a cached token, fetching a new one if it is missing or about to expire"""
+        if self._is_fresh():
+            self.stats["cache_hits"] += 1
+            return self._token
+
+        async with self._get_lock():
+            # Another caller may have refreshed while we were waiting
+            if self._is_fresh():
+                self.stats["cache_hits"] += 1
+                return self._token
+            await self._refresh()
+        return self._token
+
+    async def _refresh(self):
+        started = time.perf_counter()
+        result = await fetch_access_token()
+        elapsed = time.perf_counter() - started
+
+        self.stats["fetches"] += 1
+        self.stats["fetch_seconds_total"] += elapsed
+        self.stats["fetch_seconds_max"] = max(self.stats["fetch_seconds_max"], elapsed)
+        self.stats["last_fetch_seconds"] = elapsed
+
+        if not result:
+            self.stats["fetch_failures"] += 1
+            self._token = None
+            self._expires_at = 0.0
+            return
+
+        expires_in = float(result.get("expires_in", 3600))
+        self._token = result["access_token"]
+        self._expires_at = time.monotonic() + expires_in
+        self._schedule_background_refresh(expires_in - self.refresh_margin)
+
+    def _schedule_background_refresh(self, delay: float):
+        if (
+            self._refresh_task
+            and not self._refresh_task.done()
+            and self._refresh_task is not asyncio.current_task()
+        ):
+            self._refresh_task.cancel()
+        if delay > 0:
+            self._refresh_task = asyncio.create_task(self._refresh_later(delay))
+
+    async def _refresh_later(self, delay: float):
+        await asyncio.sleep(delay)
+        async with self._get_lock():
+            self.stats["background_refreshes"] += 1
+            await self._refresh()
+
+    def invalidate(self):
+        """Drop the cached token, e.g. after the API rejected it"""
+        self._token = None
+        self._expires_at = 0.0
+
+    def close(self):
+        """Cancel the background refresh; the next get_token() fetches as needed"""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+
+
+token_manager = TokenManager()
+
+
+async def get_access_token() -> Optional[str]:
+    """Get OAuth2 access token from Prokerala, cached until shortly before it expires"""
+    return await token_manager.get_token()
+
+
+def get_token_stats() -> Dict[str, Any]:
+    """Token fetch counters and latency, for load tests and diagnostics"""
+    return dict(token_manager.stats)
+
+
+def get_match_cache() -> Optional[ResultCache]:
+    """Shared kundli match result cache, or None when disabled or unavailable"""
+    global _match_cache, PROKERALA_CACHE_ENABLED
+    if _match_cache is None and PROKERALA_CACHE_ENABLED:
+        try:
+            _match_cache = ResultCache(
+                PROKERALA_CACHE_PATH,
+                table="kundli_match",
+                memory_size=PROKERALA_CACHE_MEMORY_SIZE,
+                ttl=PROKERALA_CACHE_TTL,
+                max_rows=PROKERALA_CACHE_MAX_ROWS,
+            )
+        except Exception as e:
+            logger.error(f"Kundli match cache disabled: {e}")
+            PROKERALA_CACHE_ENABLED = False
+    return _match_cache
+
+
+def get_match_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/eviction counters of the kundli match cache"""
+    cache = get_match_cache()
+    return cache.stats() if cache else {}
+
+
+def normalize_birth_data(data: Dict[str, Any]) -> str:
+    """Canonical form of dob/tob/coordinates; coordinates are rounded to ~10 m"""
+    return "|".join(
+        [
+            format_dob_for_api(data["dob"], data["tob"]),
+            f"{float(data['lat']):.4f}",
+            f"{float(data['lon']):.4f}",
+        ]
+    )
+
+
+def match_cache_key(user_data: Dict[str, Any], candidate_data: Dict[str, Any]) -> str:
+    return "|".join(
+        [
+            PROKERALA_API_VERSION,
+            str(PROKERALA_AYANAMSA),
+            normalize_birth_data(user_data),
+            normalize_birth_data(candidate_data),
+        ]
+    )
+
+
+def retry_after_seconds(response: httpx.Response, default: float = 1.0) -> float:
+    """Parse a Retry-After header given either in seconds or as an HTTP date"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
 def format_dob_for_api(dob: str, tob: str) -> str:
     """Convert date and time to ISO 8601 format for Prokerala API"""
     try:
         # Parse date and time
         date_obj = datetime.strptime(dob, "%Y-%m-%d")
         time_obj = datetime.strptime(tob, "%H:%M")
-        
+
         # Combine date and time
         combined = date_obj.replace(
-            hour=time_obj.hour,
-            minute=time_obj.minute,
-            second=0,
-            microsecond=0
+            hour=time_obj.hour, minute=time_obj.minute, second=0, microsecond=0
         )
-        
+
         # Format as ISO 8601 with timezone
         formatted = combined.strftime("%Y-%m-%dT%H:%M:%S+05:30")
         return formatted
@@ -81,76 +350,102 @@ def format_dob_for_api(dob: str, tob: str) -> str:
         logger.info(f"Using fallback format: {fallback}")
         return fallback
 
-async def get_kundli_match(user_data: Dict[str, Any], candidate_data: Dict[str, Any]) -> Dict[str, Any]:
+
+async def get_kundli_match(
+    user_data: Dict[str, Any], candidate_data: Dict[str, Any]
+) -> Dict[str, Any]:
     """
     Get kundli matching using Prokerala API
-    
+
     Args:
         user_data: Dict with 'dob', 'tob', 'lat', 'lon'
         candidate_data: Dict with 'dob', 'tob', 'lat', 'lon'
-    
+
     Returns:
         Dict with compatibility analysis
     """
     logger.info("Starting kundli matching process...")
-    
+
+    cache = get_match_cache()
+    cache_key = None
+    if cache:
+        try:
+            cache_key = match_cache_key(user_data, candidate_data)
+            cached = await cache.aget(cache_key)
+            if cached is not None:
+                return cached
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping match cache: {e}")
+            cache_key = None
+
     try:
         token = await get_access_token()
         if not token:
             logger.error("Failed to get access token for kundli matching")
             return {"error": "Failed to get access token"}
-        
+
         logger.info("Got access token, making kundli matching request...")
         headers = {"Authorization": f"Bearer {token}"}
-        url = "https://api.prokerala.com/v2/astrology/kundli-matching"
-        
+        url = KUNDLI_MATCHING_URL
+
         # Format dates for API
         user_dob = format_dob_for_api(user_data["dob"], user_data["tob"])
         candidate_dob = format_dob_for_api(candidate_data["dob"], candidate_data["tob"])
-        
+
         params = {
-            "ayanamsa": 1,  # Lahiri ayanamsa
+            "ayanamsa": PROKERALA_AYANAMSA,
             "boy_dob": user_dob,
             "boy_coordinates": f"{user_data['lat']},{user_data['lon']}",
             "girl_dob": candidate_dob,
             "girl_coordinates": f"{candidate_data['lat']},{candidate_data['lon']}",
-            "la": "en"
+            "la": "en",
         }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
-            
-            result = response.json()
-            
-            if result.get("status") == "ok":
-                data = result.get("data", {})
-                guna_milan = data.get("guna_milan", {})
-                message = data.get("message", {})
-                
-                # Calculate compatibility score (out of 100)
-                total_points = guna_milan.get("total_points", 0)
-                max_points = guna_milan.get("maximum_points", 36)
-                compatibility_score = int((total_points / max_points) * 100)
-                
-                return {
-                    "compatibility_score": compatibility_score,
-                    "total_points": total_points,
-                    "maximum_points": max_points,
-                    "message": message.get("description", ""),
-                    "message_type": message.get("type", "neutral"),
-                    "raw_response": data
-                }
-            else:
-                error_msg = f"API Error: {result.get('message', 'Unknown error')}"
-                logger.error(error_msg)
-                return {
-                    "error": error_msg,
-                    "compatibility_score": 0
-                }
-                
+
+        async def request() -> httpx.Response:
+            response = await get_http_client().get(url, params=params, headers=headers)
+            if response.status_code == 429:
+                delay = retry_after_seconds(response)
+                logger.warning(f"Prokerala rate limit hit, pausing for {delay:.1f}s")
+                # Pause every concurrent caller, not just this one
+                rate_limiter.pause(delay)
+            if response.status_code == 429 or response.status_code >= 500:
+                # Transient: the endpoint retries it within the shared retry budget
+                response.raise_for_status()
+            return response
+
+        response = await kundli_match_endpoint.call(request)
+
+        if response.status_code == 401:
+            token_manager.invalidate()
+
+        result = response.json()
+
+        if result.get("status") == "ok":
+            data = result.get("data", {})
+            guna_milan = data.get("guna_milan", {})
+            message = data.get("message", {})
+
+            # Calculate compatibility score (out of 100)
+            total_points = guna_milan.get("total_points", 0)
+            max_points = guna_milan.get("maximum_points", 36)
+            compatibility_score = int((total_points / max_points) * 100)
+
+            match = {
+                "compatibility_score": compatibility_score,
+                "total_points": total_points,
+                "maximum_points": max_points,
+                "message": message.get("description", ""),
+                "message_type": message.get("type", "neutral"),
+                "raw_response": data,
+            }
+            if cache_key:
+                await cache.aset(cache_key, match)
+            return match
+        else:
+            error_msg = f"API Error: {result.get('message', 'Unknown error')}"
+            logger.error(error_msg)
+            return {"error": error_msg, "compatibility_score": 0}
+
     except Exception as e:
         logger.error(f"Error in kundli matching: {e}")
-        return {
-            "error": f"Request failed: {str(e)}",
-            "compatibility_score": 0
-        }
+        return {"error": f"Request failed: {str(e)}", "compatibility_score": 0}
@@ -0,0 +1,289 @@
+import os
+import json
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from candidate_batch import batch_column, from_batch, is_batch
+
+logger = logging.getLogger(__name__)
+
+# JSON file with {"default": {...}, "tenants": {"<tenant>": {...}}}; each entry overrides DEFAULT_RANKING
+RANKING_CONFIG_PATH = os.getenv("RANKING_CONFIG_PATH", "")
+
+EARTH_RADIUS_KM = 6371.0088
+
+DEFAULT_RANKING = {
+    "weights": {
+        # Share of the 36 Guna Milan points
+        "guna": 1.0,
+        # Penalties when the koota scores zero
+        "nadi_dosha": 0.25,
+        "bhakoot_dosha": 0.15,
+        # Penalties scaled to 0-1 by distance_scale_km and age_gap_scale_years
+        "distance": 0.1,
+        "age_gap": 0.1,
+        # Bonus scaled by the occupation affinity (0-1)
+        "occupation": 0.05,
+    },
+    "distance_scale_km": 1000.0,
+    "age_gap_scale_years": 10.0,
+    # Doshas that exclude a candidate outright, e.g. ["nadi"]
+    "hard_vetoes": [],
+    # {"<occupation>": {"<occupation>": affinity}}; the same occupation scores 1
+    "occupation_affinity": {},
+}
+
+_ranking_config: Optional[Dict[str, Any]] = None
+
+
+def load_ranking_config() -> Dict[str, Any]:
+    """Per-tenant ranking config from RANKING_CONFIG_PATH, read once"""
+    global _ranking_config
+    if _ranking_config is None:
+        _ranking_config = {}
+        if RANKING_CONFIG_PATH:
+            try:
+                with open(RANKING_CONFIG_PATH) as f:
+                    _ranking_config = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"Ignoring ranking config {RANKING_CONFIG_PATH}: {e}")
+    return _ranking_config
+
+
+def _merge(base: Dict[str, Any], override: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    merged = dict(base)
+    for key, value in (override or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def ranking_settings(
+    tenant: Optional[str] = None, overrides: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """DEFAULT_RANKING with the config file's default, the tenant's entry and `overrides` applied in turn"""
+    config = load_ranking_config()
+    settings = _merge(DEFAULT_RANKING, config.get("default"))
+    if tenant:
+        settings = _merge(settings, (config.get("tenants") or {}).get(tenant))
+    return _merge(settings, overrides)
+
+
+def _column(
+    results: Union[List[Dict[str, Any]], Dict[str, Any]], name: str
+) -> Union[List[Any], np.ndarray]:
+    """One field of every result; packed batch columns come back as NumPy arrays"""
+    if is_batch(results):
+        try:
+            return batch_column(results, name)
+        except KeyError:
+            return [None] * results["count"]
+    parent, child = name.split(".", 1)
+    return [(result.get(parent) or {}).get(child) for result in results]
+
+
+def _float_array(values: Union[List[Any], np.ndarray]) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64)
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def _dob_days(values: List[Any]) -> np.ndarray:
+    """Days since 1970-01-01 for 'YYYY-MM-DD' strings, NaN where missing or invalid"""
+    try:
+        dates = np.array(values, dtype="datetime64[D]")
+        return np.where(np.isnat(dates), np.nan, dates.astype(np.int64))
+    except ValueError:
+        pass
+    # Fall back to parsing one by one when some value is malformed
+    days = np.full(len(values), np.nan)
+    for i, value in enumerate(values):
+        try:
+            days[i] = date.fromisoformat(value).toordinal() - 719163
+        except (TypeError, ValueError):
+            pass
+    return days
+
+
+def _occupation_affinity(
+    user_occupation: Optional[str], occupations: List[Any], table: Dict[str, Any]
+) -> np.ndarray:
+    if not user_occupation:
+        return np.zeros(len(occupations))
+    user_occupation = user_occupation.strip().lower()
+    row = {
+        k.strip().lower(): float(v)
+        for k, v in (table.get(user_occupation) or {}).items()
+    }
+    row.setdefault(user_occupation, 1.0)
+    # Normalize each distinct occupation once
+    affinity = {
+        o: row.get(o.strip().lower(), 0.0) if isinstance(o, str) else 0.0
+        for o in set(occupations)
+    }
+    return np.fromiter(
+        map(affinity.__getitem__, occupations), dtype=np.float64, count=len(occupations)
+    )
+
+
+def match_features(
+    user_profile: Dict[str, Any],
+    results: Union[List[Dict[str, Any]], Dict[str, Any]],
+    settings: Optional[Dict[str, Any]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Feature vectors for kundli_match_agent results, given as a list or a columnar batch.
+
+    Returns 'guna' (share of the maximum points), 'nadi_dosha' and
+    'bhakoot_dosha' (1.0 when the koota scored zero), 'distance_km' between
+    the birth coordinates, 'age_gap_years', 'occupation' affinity and
+    'valid' (False for results that could not be scored) and 'good'
+    (message_type 'good').
+    """
+    settings = settings or DEFAULT_RANKING
+    total = _float_array(_column(results, "compatibility.total_points"))
+    maximum = _float_array(_column(results, "compatibility.maximum_points"))
+    message_types = np.array(
+        _column(results, "compatibility.message_type"), dtype=object
+    )
+    guna = np.nan_to_num(
+        total / np.where(np.isnan(maximum) | (maximum == 0), 36.0, maximum)
+    )
+
+    koot_points = [
+        (details or {}).get("koot_points") or {}
+        for details in _column(results, "compatibility.details")
+    ]
+    nadi = np.array(
+        [points.get("nadi", np.nan) for points in koot_points], dtype=np.float64
+    )
+    bhakoot = np.array(
+        [points.get("bhakoot", np.nan) for points in koot_points], dtype=np.float64
+    )
+
+    lat = np.radians(_float_array(_column(results, "match.lat")))
+    lon = np.radians(_float_array(_column(results, "match.lon")))
+    if user_profile.get("lat") is not None and user_profile.get("lon") is not None:
+        user_lat, user_lon = (
+            np.radians(float(user_profile["lat"])),
+            np.radians(float(user_profile["lon"])),
+        )
+        a = (
+            np.sin((lat - user_lat) / 2) ** 2
+            + np.cos(lat) * np.cos(user_lat) * np.sin((lon - user_lon) / 2) ** 2
+        )
+        distance_km = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    else:
+        distance_km = np.full(len(lat), np.nan)
+
+    user_days = _dob_days([user_profile.get("dob")])[0]
+    age_gap_years = (
+        np.abs(_dob_days(_column(results, "match.dob")) - user_days) / 365.25
+    )
+
+    return {
+        "guna": guna,
+        "nadi_dosha": (nadi == 0).astype(np.float64),
+        "bhakoot_dosha": (bhakoot == 0).astype(np.float64),
+        "distance_km": distance_km,
+        "age_gap_years": age_gap_years,
+        "occupation": _occupation_affinity(
+            user_profile.get("occupation"),
+            _column(results, "match.occupation"),
+            settings["occupation_affinity"],
+        ),
+        "valid": (message_types != "error")
+        & (message_types != None)  # noqa: E711
+        & ~np.isnan(total),
+        "good": message_types == "good",
+    }
+
+
+def rank_scores(
+    features: Dict[str, np.ndarray], settings: Optional[Dict[str, Any]] = None
+) -> np.ndarray:
+    """
+    Weighted score per result; higher is better, -inf for invalid or hard-vetoed results.
+
+    Unknown distances and ages add no penalty.
+    """
+    settings = settings or DEFAULT_RANKING
+    weights = settings["weights"]
+    distance = np.nan_to_num(
+        np.minimum(features["distance_km"] / settings["distance_scale_km"], 1.0)
+    )
+    age_gap = np.nan_to_num(
+        np.minimum(features["age_gap_years"] / settings["age_gap_scale_years"], 1.0)
+    )
+    scores = (
+        weights.get("guna", 0) * features["guna"]
+        - weights.get("nadi_dosha", 0) * features["nadi_dosha"]
+        - weights.get("bhakoot_dosha", 0) * features["bhakoot_dosha"]
+        - weights.get("distance", 0) * distance
+        - weights.get("age_gap", 0) * age_gap
+        + weights.get("occupation", 0) * features["occupation"]
+    )
+    excluded = ~features["valid"]
+    for dosha in settings["hard_vetoes"]:
+        excluded |= features[f"{dosha}_dosha"] > 0
+    return np.where(excluded, -np.inf, scores)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k best finite scores, best first, ties in input order"""
+    candidates = np.flatnonzero(np.isfinite(scores))
+    if k <= 0 or candidates.size == 0:
+        return candidates[:0]
+    if candidates.size > k:
+        # argpartition finds the k-th best score in O(N); ties at that score are
+        # filled in input order, and only the k winners are sorted
+        values = scores[candidates]
+        threshold = values[np.argpartition(-values, k - 1)[k - 1]]
+        above = candidates[values > threshold]
+        candidates = np.concatenate(
+            [above, candidates[values == threshold][: k - above.size]]
+        )
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+def rank_results(
+    user_profile: Dict[str, Any],
+    results: Union[List[Dict[str, Any]], Dict[str, Any]],
+    top_k: int,
+    tenant: Optional[str] = None,
+    overrides: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    The top_k results by weighted score, best first, each with 'rank_score' added.
+
+    As with plain ranking, good matches are preferred: when any result has
+    message_type 'good' only those are ranked, otherwise the single best
+    result is returned.
+    """
+    settings = ranking_settings(tenant, overrides)
+    features = match_features(user_profile, results, settings)
+    scores = rank_scores(features, settings)
+    good = features["good"]
+    if (good & np.isfinite(scores)).any():
+        indices = top_k_indices(np.where(good, scores, -np.inf), top_k)
+    else:
+        indices = top_k_indices(scores, 1)
+
+    indices = indices.tolist()
+    records = (
+        from_batch(results, indices)
+        if is_batch(results)
+        else [results[i] for i in indices]
+    )
+    ranked = []
+    for i, record in zip(indices, records):
+        result = dict(record)
+        result["rank_score"] = round(float(scores[i]), 4)
+        ranked.append(result)
+    return ranked
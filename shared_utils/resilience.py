@@ -0,0 +1,351 @@
+import os
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Consecutive transient failures after which an endpoint's circuit opens
+RESILIENCE_FAILURE_THRESHOLD = int(os.getenv("RESILIENCE_FAILURE_THRESHOLD", "5"))
+# Seconds an open circuit rejects calls before a single probe call is let through
+RESILIENCE_OPEN_SECONDS = float(os.getenv("RESILIENCE_OPEN_SECONDS", "30"))
+# Retries per call after a transient failure, with full-jitter exponential backoff
+RESILIENCE_MAX_RETRIES = int(os.getenv("RESILIENCE_MAX_RETRIES", "2"))
+RESILIENCE_BACKOFF_BASE = float(os.getenv("RESILIENCE_BACKOFF_BASE", "0.2"))
+RESILIENCE_BACKOFF_MAX = float(os.getenv("RESILIENCE_BACKOFF_MAX", "2"))
+# Process-wide retry budget: every call earns RATIO retries, at most MAX are banked,
+# and PER_SECOND are earned regardless of traffic. Hedged requests spend it too.
+RESILIENCE_RETRY_BUDGET_RATIO = float(os.getenv("RESILIENCE_RETRY_BUDGET_RATIO", "0.2"))
+RESILIENCE_RETRY_BUDGET_MAX = float(os.getenv("RESILIENCE_RETRY_BUDGET_MAX", "10"))
+RESILIENCE_RETRY_BUDGET_PER_SECOND = float(
+    os.getenv("RESILIENCE_RETRY_BUDGET_PER_SECOND", "1")
+)
+# Hedging sends a second request once the first has taken longer than the
+# endpoint's p95 latency over the last LATENCY_WINDOW successful calls
+RESILIENCE_LATENCY_WINDOW = int(os.getenv("RESILIENCE_LATENCY_WINDOW", "200"))
+RESILIENCE_HEDGE_MIN_SAMPLES = int(os.getenv("RESILIENCE_HEDGE_MIN_SAMPLES", "20"))
+RESILIENCE_HEDGE_MIN_DELAY = float(os.getenv("RESILIENCE_HEDGE_MIN_DELAY", "0.05"))
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit is open"""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(
+            f"{endpoint} is unavailable (circuit open, retry in {retry_in:.0f}s)"
+        )
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+def is_transient(error: BaseException) -> bool:
+    """Timeouts, connection errors, 429 and 5xx responses; anything else is the caller's problem"""
+    if isinstance(
+        error, (CircuitOpenError, httpx.TransportError, asyncio.TimeoutError)
+    ):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive failures; open ->
+    half-open after `open_seconds`, where one probe call decides whether the
+    circuit closes again or reopens.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = RESILIENCE_FAILURE_THRESHOLD,
+        open_seconds: float = RESILIENCE_OPEN_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+        self._probing = False
+
+    def retry_in(self) -> float:
+        return (
+            max(0.0, self.opened_at + self.open_seconds - time.monotonic())
+            if self.state == OPEN
+            else 0.0
+        )
+
+    @property
+    def available(self) -> bool:
+        """Whether a call would currently be let through"""
+        if self.state == OPEN:
+            return self.retry_in() == 0
+        return self.state == CLOSED or not self._probing
+
+    def allow(self) -> bool:
+        """Take permission for one call; in half-open state only one probe is allowed at a time"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if self.retry_in() > 0:
+                return False
+            self.state = HALF_OPEN
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def release(self):
+        """Give back a probe permission without an outcome, e.g. when the call was cancelled"""
+        self._probing = False
+
+    def record_success(self):
+        if self.state != CLOSED:
+            logger.info("Circuit closed")
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        self._probing = False
+        self.failures += 1
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.failures >= self.failure_threshold
+        ):
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self.opens += 1
+
+
+class RetryBudget:
+    """
+    Token bucket bounding retries across all endpoints, so a struggling
+    upstream sees at most about (1 + ratio) times the normal request rate.
+    """
+
+    def __init__(
+        self,
+        ratio: float = RESILIENCE_RETRY_BUDGET_RATIO,
+        capacity: float = RESILIENCE_RETRY_BUDGET_MAX,
+        per_second: float = RESILIENCE_RETRY_BUDGET_PER_SECOND,
+    ):
+        self.ratio = ratio
+        self.capacity = capacity
+        self.per_second = per_second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self.exhausted = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.per_second
+        )
+        self._updated = now
+
+    def deposit(self):
+        """Credit one first attempt"""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one retry, False when the budget is used up"""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        self.exhausted += 1
+        return False
+
+
+class LatencyWindow:
+    """Latencies of the most recent successful calls"""
+
+    def __init__(self, size: int = RESILIENCE_LATENCY_WINDOW):
+        self._samples: deque = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, seconds: float):
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+retry_budget = RetryBudget()
+
+
+def backoff_delay(
+    retry: int,
+    base: float = RESILIENCE_BACKOFF_BASE,
+    cap: float = RESILIENCE_BACKOFF_MAX,
+) -> float:
+    """Full-jitter backoff before the given retry (1-based)"""
+    return random.uniform(0, min(cap, base * 2 ** (retry - 1)))
+
+
+class Endpoint:
+    """
+    Guards calls to one external API.
+
+    call() runs an attempt function through the circuit breaker, retries
+    transient failures while the shared retry budget allows, and with
+    `hedge` set races a second attempt against one slower than the p95
+    latency. Attempt functions must raise on failure (see is_transient) and
+    are safe to cancel. `throttle`, e.g. a rate limiter's acquire, is awaited
+    before every attempt and is not counted in the latency.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        hedge: bool = False,
+        max_retries: int = RESILIENCE_MAX_RETRIES,
+        breaker: Optional[CircuitBreaker] = None,
+        budget: Optional[RetryBudget] = None,
+        throttle: Optional[Callable[[], Awaitable[Any]]] = None,
+    ):
+        self.name = name
+        self.hedge = hedge
+        self.throttle = throttle
+        self.max_retries = max_retries
+        self.breaker = breaker or CircuitBreaker()
+        self.budget = budget or retry_budget
+        self.latency = LatencyWindow()
+        self.stats = {
+            "calls": 0,
+            "failures": 0,
+            "retries": 0,
+            "rejected": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+        }
+
+    @property
+    def available(self) -> bool:
+        return self.breaker.available
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds after which a hedged attempt is sent, None while hedging is off or latency is unknown"""
+        if not self.hedge or len(self.latency) < RESILIENCE_HEDGE_MIN_SAMPLES:
+            return None
+        return max(RESILIENCE_HEDGE_MIN_DELAY, self.latency.percentile(0.95))
+
+    async def _throttled(self, attempt: Callable[[], Awaitable[Any]]) -> Any:
+        if self.throttle:
+            await self.throttle()
+        return await attempt()
+
+    async def _hedged(self, attempt: Callable[[], Awaitable[Any]]) -> Any:
+        first = asyncio.ensure_future(attempt())
+        tasks = {first}
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                # Hedge only while healthy; a probe or a spent budget waits for the first attempt
+                if not done and self.breaker.state == CLOSED and self.budget.withdraw():
+                    self.stats["hedges"] += 1
+                    tasks.add(asyncio.ensure_future(self._throttled(attempt)))
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self.stats["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def call(self, attempt: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the first successful attempt's result; raises CircuitOpenError while the circuit is open"""
+        self.stats["calls"] += 1
+        self.budget.deposit()
+        retries = 0
+        while True:
+            if not self.breaker.allow():
+                self.stats["rejected"] += 1
+                raise CircuitOpenError(self.name, self.breaker.retry_in())
+            try:
+                if self.throttle:
+                    await self.throttle()
+                started = time.monotonic()
+                result = await self._hedged(attempt)
+            except Exception as e:
+                if not is_transient(e):
+                    # The API answered; the request itself was bad
+                    self.breaker.record_success()
+                    raise
+                self.stats["failures"] += 1
+                opens = self.breaker.opens
+                self.breaker.record_failure()
+                if self.breaker.opens > opens:
+                    logger.warning(
+                        f"Circuit for {self.name} opened after {self.breaker.failures} failures: {e}"
+                    )
+                if (
+                    retries >= self.max_retries
+                    or not self.breaker.available
+                    or not self.budget.withdraw()
+                ):
+                    raise
+                retries += 1
+                self.stats["retries"] += 1
+                delay = backoff_delay(retries)
+                logger.info(
+                    f"{self.name} failed ({e!r}), retry {retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self.breaker.release()
+                raise
+            self.breaker.record_success()
+            self.latency.add(time.monotonic() - started)
+            return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        p95 = self.latency.percentile(0.95)
+        return {
+            **self.stats,
+            "state": self.breaker.state,
+            "opens": self.breaker.opens,
+            "p95_seconds": round(p95, 4) if p95 is not None else None,
+        }
+
+
+_endpoints: Dict[str, Endpoint] = {}
+
+
+def get_endpoint(name: str, **options: Any) -> Endpoint:
+    """Process-wide Endpoint for `name`; options apply when it is first created"""
+    if name not in _endpoints:
+        _endpoints[name] = Endpoint(name, **options)
+    return _endpoints[name]
+
+
+def get_resilience_stats() -> Dict[str, Any]:
+    """Breaker state, retry and hedge counters per endpoint, for load tests and diagnostics"""
+    stats = {name: endpoint.get_stats() for name, endpoint in _endpoints.items()}
+    stats["retry_budget_exhausted"] = retry_budget.exhausted
+    return stats
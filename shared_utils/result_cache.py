@@ -0,0 +1,213 @@
+import os
+import json
+import time
+import sqlite3
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv(
+    "MATCHMYSTAR_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "matchmystar"),
+)
+
+# Re-check the on-disk size every this many writes
+EVICTION_CHECK_INTERVAL = 500
+
+
+class ResultCache:
+    """
+    Two-tier cache for JSON-serializable results.
+
+    An in-memory LRU sits in front of a SQLite table. SQLite runs in WAL mode
+    with a busy timeout, so several agent processes on one host can share the
+    same file. Entries expire after `ttl` seconds, or a per-entry ttl passed
+    to set(). The memory tier is bounded by `memory_size` entries and the
+    disk tier by `max_rows`, evicting the least recently used rows.
+
+    Values returned from the memory tier are shared, treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "results",
+        memory_size: int = 10000,
+        ttl: float = 30 * 24 * 3600,
+        max_rows: int = 1_000_000,
+    ):
+        self.path = path
+        self.table = table
+        self.memory_size = memory_size
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+        self.counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+            "writes": 0,
+            "errors": 0,
+        }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table}_accessed_at ON {self.table} (accessed_at)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _memory_get(self, key: str, now: float) -> Optional[tuple]:
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._memory[key]
+                self.counters["expired"] += 1
+                return None
+            self._memory.move_to_end(key)
+            return entry
+
+    def _memory_set(self, key: str, value: Any, expires_at: float):
+        with self._memory_lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+                self.counters["memory_evictions"] += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look up a key in memory, then on disk"""
+        now = time.time()
+        entry = self._memory_get(key, now)
+        if entry is not None:
+            self.counters["memory_hits"] += 1
+            return entry[1]
+
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.counters["misses"] += 1
+                return default
+            value, expires_at = row
+            if expires_at <= now:
+                conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self.counters["expired"] += 1
+                self.counters["misses"] += 1
+                return default
+            conn.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache read failed: {e}")
+            self.counters["errors"] += 1
+            return default
+
+        value = json.loads(value)
+        self._memory_set(key, value, expires_at)
+        self.counters["disk_hits"] += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a value in both tiers"""
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        self._memory_set(key, value, expires_at)
+        try:
+            self._connection().execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, now),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache write failed: {e}")
+            self.counters["errors"] += 1
+            return
+        self.counters["writes"] += 1
+        self._writes += 1
+        if self._writes % EVICTION_CHECK_INTERVAL == 0:
+            self.evict()
+
+    def evict(self):
+        """Drop expired rows and trim the disk tier to max_rows"""
+        try:
+            conn = self._connection()
+            expired = conn.execute(
+                f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            self.counters["expired"] += expired
+            rows = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            excess = rows - self.max_rows
+            if excess > 0:
+                conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN "
+                    f"(SELECT key FROM {self.table} ORDER BY accessed_at LIMIT ?)",
+                    (excess,),
+                )
+                self.counters["disk_evictions"] += excess
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache eviction failed: {e}")
+            self.counters["errors"] += 1
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        """get() that keeps SQLite off the event loop"""
+        entry = self._memory_get(key, time.time())
+        if entry is not None:
+            self.counters["memory_hits"] += 1
+            return entry[1]
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None):
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    def clear(self):
+        with self._memory_lock:
+            self._memory.clear()
+        self._connection().execute(f"DELETE FROM {self.table}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for this process plus the current tier sizes"""
+        stats = dict(self.counters)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4)
+            if lookups
+            else 0.0
+        )
+        stats["memory_entries"] = len(self._memory)
+        try:
+            stats["disk_entries"] = (
+                self._connection()
+                .execute(f"SELECT COUNT(*) FROM {self.table}")
+                .fetchone()[0]
+            )
+        except sqlite3.Error:
+            stats["disk_entries"] = None
+        return stats
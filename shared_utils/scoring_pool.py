@@ -0,0 +1,102 @@
+import os
+import sys
+import math
+import asyncio
+import logging
+import importlib
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Processes scoring large candidate arrays; 0 scores in the calling process
+SCORING_WORKERS = int(os.getenv("SCORING_WORKERS", "0"))
+# Smallest shard sent to a worker; smaller arrays are not worth the inter-process copy
+SCORING_MIN_SHARD_SIZE = int(os.getenv("SCORING_MIN_SHARD_SIZE", "2000"))
+# Largest shard; unpickling a shard's results holds the GIL, so big shards stall the event loop
+SCORING_MAX_SHARD_SIZE = int(os.getenv("SCORING_MAX_SHARD_SIZE", "5000"))
+# Shards per worker, so a slow shard does not leave the other workers idle
+SHARDS_PER_WORKER = 4
+
+SHARED_UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def shards(
+    count: int,
+    workers: int = SCORING_WORKERS,
+    min_size: int = SCORING_MIN_SHARD_SIZE,
+    max_size: int = SCORING_MAX_SHARD_SIZE,
+) -> List[slice]:
+    """
+    Consecutive slices covering range(count) for `workers` processes.
+
+    Aims at SHARDS_PER_WORKER shards per worker of about equal size, each
+    of at least `min_size` (so few candidates give a single shard) and,
+    where that allows, at most `max_size`.
+    """
+    if count <= 0:
+        return []
+    size = math.ceil(count / max(1, workers * SHARDS_PER_WORKER))
+    size = max(1, min_size, min(size, max_size))
+    # Spread the remainder instead of leaving a last shard under min_size
+    count_shards = min(math.ceil(count / size), max(1, count // max(1, min_size)))
+    size = math.ceil(count / count_shards)
+    return [slice(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+def _init_worker(path: str, modules: Sequence[str]):
+    """Import the scoring modules once per worker, so their lookup tables stay resident between shards"""
+    if path not in sys.path:
+        sys.path.append(path)
+    for module in modules:
+        importlib.import_module(module)
+
+
+def get_scoring_pool(warm: Sequence[str] = ()) -> Optional[ProcessPoolExecutor]:
+    """
+    Process pool shared by this process, or None when SCORING_WORKERS is 0.
+
+    Workers are started on first use and import the `warm` modules up front.
+    """
+    global _pool
+    if _pool is None and SCORING_WORKERS > 0:
+        _pool = ProcessPoolExecutor(
+            SCORING_WORKERS,
+            initializer=_init_worker,
+            initargs=(SHARED_UTILS_DIR, tuple(warm)),
+        )
+        logger.info(f"Scoring pool started with {SCORING_WORKERS} workers")
+    return _pool
+
+
+async def close_scoring_pool():
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+
+
+async def map_shards(
+    executor: Executor, fn: Callable[..., Any], shard_args: Iterable[tuple]
+) -> List[Any]:
+    """
+    Run fn(*args) for every shard in the executor and return the results in shard order.
+
+    `shard_args` may be a generator; shards are submitted one at a time with
+    the event loop free in between, and the loop only awaits the workers, so
+    other requests keep being served meanwhile. Cancelling the caller cancels
+    shards not yet started.
+    """
+    loop = asyncio.get_running_loop()
+    futures = []
+    try:
+        for args in shard_args:
+            futures.append(loop.run_in_executor(executor, fn, *args))
+            await asyncio.sleep(0)
+        return await asyncio.gather(*futures)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
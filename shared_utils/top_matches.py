@@ -0,0 +1,77 @@
+import heapq
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Tuple
+
+# Matches shown when at least one is good, as in results_formatter_agent
+DEFAULT_GOOD_K = 5
+# Best bad matches shown when none is good
+DEFAULT_BAD_K = 1
+
+
+def compatibility_score(result: Dict[str, Any]) -> float:
+    """Sort key of a kundli_match_agent result"""
+    return (result.get("compatibility") or {}).get("compatibility_score", 0) or 0
+
+
+class TopMatches:
+    """
+    Streaming selection of the best kundli results.
+
+    Keeps the `good_k` best results with message_type 'good' and the `bad_k`
+    best 'bad' ones in bounded min-heaps, so N results cost O(N log K) and
+    results can be added as they are scored. Ties keep arrival order, which
+    matches a stable sort of the full list.
+    """
+
+    def __init__(
+        self,
+        good_k: int = DEFAULT_GOOD_K,
+        bad_k: int = DEFAULT_BAD_K,
+        key: Callable[[Dict[str, Any]], float] = compatibility_score,
+    ):
+        self.good_k = good_k
+        self.bad_k = bad_k
+        self.key = key
+        self.seen = 0
+        self._heaps: Dict[str, List[Tuple[float, int, Dict[str, Any]]]] = {
+            "good": [],
+            "bad": [],
+        }
+
+    def add(self, result: Dict[str, Any]):
+        message_type = (result.get("compatibility") or {}).get("message_type")
+        self.seen += 1
+        heap = self._heaps.get(message_type)
+        if heap is None:
+            return
+        limit = self.good_k if message_type == "good" else self.bad_k
+        if limit <= 0:
+            return
+        # Later arrivals rank lower on ties, so the sequence is negated
+        entry = (self.key(result), -self.seen, result)
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def extend(self, results: Iterable[Dict[str, Any]]):
+        for result in results:
+            self.add(result)
+
+    async def aextend(self, chunks: AsyncIterable[Iterable[Dict[str, Any]]]):
+        """Consume chunks of results as a producer yields them"""
+        async for chunk in chunks:
+            self.extend(chunk)
+
+    def _ranked(self, message_type: str) -> List[Dict[str, Any]]:
+        heap = self._heaps[message_type]
+        return [entry[2] for entry in sorted(heap, key=lambda e: e[:2], reverse=True)]
+
+    def good(self) -> List[Dict[str, Any]]:
+        return self._ranked("good")
+
+    def bad(self) -> List[Dict[str, Any]]:
+        return self._ranked("bad")
+
+    def results(self) -> List[Dict[str, Any]]:
+        """The good matches if there are any, otherwise the best bad ones, best first"""
+        return self.good() or self.bad()
@@ -0,0 +1,60 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import ashtakoot  # noqa: E402
+
+
+def test_koota_tables_respect_maximum_points():
+    for koota, table in ashtakoot.KOOTA_TABLES.items():
+        assert table.min() >= 0
+        assert table.max() == ashtakoot.KOOTA_MAXIMUM_POINTS[koota]
+    assert sum(ashtakoot.KOOTA_MAXIMUM_POINTS.values()) == ashtakoot.MAXIMUM_POINTS
+
+
+@pytest.mark.parametrize(
+    "boy, girl, expected_total",
+    [
+        # Same nakshatra and rasi: everything but nadi
+        ((0, 0), (0, 0), 28.0),
+        # Ashwini/Mesha with Bharani/Mesha
+        ((0, 0), (1, 0), 34.0),
+    ],
+    ids=["same nakshatra", "ashwini with bharani"],
+)
+def test_score_total(boy, girl, expected_total):
+    assert ashtakoot.score_total(*boy, *girl) == expected_total
+
+
+def test_vectorized_scoring_matches_per_pair_scoring():
+    rng = np.random.default_rng(7)
+    girl_nakshatra = rng.integers(0, 27, size=500)
+    girl_rasi = ashtakoot.rasi_from_nakshatra(
+        girl_nakshatra, rng.integers(1, 5, size=500)
+    )
+
+    batch = ashtakoot.score_kootas(5, 2, girl_nakshatra, girl_rasi)
+    for i in range(0, 500, 50):
+        single = ashtakoot.score_kootas(5, 2, girl_nakshatra[i], girl_rasi[i])
+        assert single["total_points"] == batch["total_points"][i]
+    np.testing.assert_array_equal(
+        batch["total_points"], ashtakoot.score_total(5, 2, girl_nakshatra, girl_rasi)
+    )
+
+
+def test_local_kundli_match_result_shape():
+    results = ashtakoot.local_kundli_match(0, 0, np.array([0, 1]), np.array([0, 0]))
+    assert [r["total_points"] for r in results] == [28.0, 34.0]
+    for result in results:
+        assert set(result) >= {
+            "compatibility_score",
+            "total_points",
+            "maximum_points",
+            "message",
+            "message_type",
+        }
+        assert result["message_type"] == "good"
+        assert result["compatibility_score"] == int(result["total_points"] / 36 * 100)
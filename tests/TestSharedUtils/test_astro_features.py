@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import astro_features  # noqa: E402
+import manglik  # noqa: E402
+import moon  # noqa: E402
+
+GOLDEN_FILE = os.path.join(os.path.dirname(__file__), "data", "manglik_golden.json")
+
+with open(GOLDEN_FILE) as f:
+    GOLDEN_CASES = json.load(f)["cases"]
+
+INPUTS = [case["input"] for case in GOLDEN_CASES]
+JULIAN_DAYS = moon.julian_days(
+    [i["dob"] for i in INPUTS],
+    [i["tob"] for i in INPUTS],
+    np.array([i["tz_offset"] for i in INPUTS]),
+)
+
+
+def angle_difference(a, b):
+    return np.abs(np.mod(np.asarray(a) - np.asarray(b) + 180.0, 360.0) - 180.0)
+
+
+def test_mars_and_ascendant_match_golden_set():
+    mars = manglik.sidereal_mars_longitude(JULIAN_DAYS)
+    ascendant = manglik.sidereal_ascendant(
+        JULIAN_DAYS,
+        np.array([i["lat"] for i in INPUTS]),
+        np.array([i["lon"] for i in INPUTS]),
+    )
+    assert (
+        angle_difference(mars, [c["mars_longitude"] for c in GOLDEN_CASES]).max() < 0.05
+    )
+    assert (
+        angle_difference(ascendant, [c["ascendant"] for c in GOLDEN_CASES]).max() < 0.01
+    )
+
+
+@pytest.mark.parametrize(
+    "index", range(len(GOLDEN_CASES)), ids=[i["dob"] for i in INPUTS]
+)
+def test_compute_astro_features_match_golden_set(index):
+    case = GOLDEN_CASES[index]
+    features = astro_features.compute_astro_features([case["input"]])[0]
+    assert features["version"] == astro_features.ASTRO_FEATURE_VERSION
+    assert features["rasi"]["id"] == case["moon_rasi"]
+    assert features["koot"]["nadi"] in ("Adi", "Madhya", "Antya")
+    assert features["manglik"]["mars_rasi"] == case["mars_rasi"]
+    assert features["manglik"]["from_moon"] == case["manglik"]["from_moon"]
+    assert features["manglik"]["from_lagna"] == case["manglik"]["from_lagna"]
+    assert features["manglik"]["status"] == case["manglik"]["status"]
+
+
+def test_features_without_coordinates_skip_the_lagna_and_go_stale_once_located():
+    profile = {"dob": "1990-05-17", "tob": "06:30"}
+    features = astro_features.compute_astro_features(
+        [profile, {"dob": "1990-05-17", "tob": ""}]
+    )
+    assert features[1] is None
+    assert features[0]["manglik"]["from_lagna"] is None
+    assert features[0]["manglik"]["status"] == features[0]["manglik"]["from_moon"]
+
+    profile["astro_features"] = features[0]
+    assert astro_features.features_current(profile)
+    assert not astro_features.features_current({**profile, "lat": 13.08, "lon": 80.27})
+    assert not astro_features.features_current(
+        {**profile, "astro_features": {**features[0], "version": 0}}
+    )
+
+
+def test_current_features_are_reused(monkeypatch):
+    profile = {"dob": "1990-05-17", "tob": "06:30"}
+    profile["astro_features"] = astro_features.compute_astro_features([profile])[0]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("recomputed")
+
+    monkeypatch.setattr(astro_features, "moon_positions", fail)
+    assert (
+        astro_features.ensure_astro_features([profile])[0] is profile["astro_features"]
+    )
+    assert (
+        astro_features.moon_features([profile])["nakshatra"][0]
+        == profile["astro_features"]["nakshatra"]["id"]
+    )
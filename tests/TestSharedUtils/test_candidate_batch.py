@@ -0,0 +1,103 @@
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+from candidate_batch import (
+    as_records,
+    batch_column,
+    from_batch,
+    is_batch,
+    to_batch,
+)  # noqa: E402
+
+CANDIDATES = [
+    {
+        "id": 1,
+        "name": "Priya",
+        "dob": "1995-02-02",
+        "lat": 13.0827,
+        "lon": 80.2707,
+        "astro_features": {"version": 1},
+    },
+    {
+        "id": 2,
+        "name": "Anjali",
+        "dob": "1993-08-21",
+        "lat": None,
+        "lon": None,
+        "astro_features": None,
+    },
+]
+
+
+def test_round_trip_through_json():
+    batch = json.loads(json.dumps(to_batch(CANDIDATES)))
+    assert is_batch(batch) and batch["count"] == 2
+    types = {field["name"]: field["type"] for field in batch["schema"]}
+    assert types == {
+        "id": "int64",
+        "name": "json",
+        "dob": "json",
+        "lat": "float64",
+        "lon": "float64",
+        "astro_features": "json",
+    }
+    assert from_batch(batch) == CANDIDATES
+    assert batch_column(batch, "lat")[0] == 13.0827
+    assert np.isnan(batch_column(batch, "lat")[1])
+
+
+def test_nested_results_are_split_into_columns():
+    results = [
+        {
+            "match": CANDIDATES[0],
+            "compatibility": {"total_points": 24.5, "message_type": "good"},
+        },
+        {
+            "match": CANDIDATES[1],
+            "compatibility": {
+                "total_points": 12.0,
+                "message_type": "bad",
+                "estimated": True,
+            },
+        },
+    ]
+    batch = to_batch(results)
+    assert batch_column(batch, "compatibility.total_points").tolist() == [24.5, 12.0]
+    records = from_batch(batch)
+    assert records[0]["match"] == CANDIDATES[0]
+    assert records[1]["compatibility"] == results[1]["compatibility"]
+    # Keys missing from some records come back as None
+    assert records[0]["compatibility"]["estimated"] is None
+
+
+def test_column_projection_and_plain_json():
+    batch = to_batch(CANDIDATES, columns=("id", "name"), binary=False)
+    assert batch["columns"] == {"id": [1, 2], "name": ["Priya", "Anjali"]}
+    assert as_records(batch) == [
+        {"id": 1, "name": "Priya"},
+        {"id": 2, "name": "Anjali"},
+    ]
+    assert as_records(CANDIDATES) == CANDIDATES
+    assert as_records(None) == []
+
+
+def test_batch_is_smaller_than_records():
+    candidates = [
+        {
+            "id": i,
+            "name": f"Candidate {i}",
+            "dob": "1995-02-02",
+            "tob": "12:00",
+            "place": "Chennai, India",
+            "gender": "female",
+            "occupation": "Engineer",
+            "lat": 13.0827 + i / 1e4,
+            "lon": 80.2707 - i / 1e4,
+        }
+        for i in range(1000)
+    ]
+    assert len(json.dumps(to_batch(candidates))) < 0.7 * len(json.dumps(candidates))
@@ -0,0 +1,142 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import compatibility_matrix  # noqa: E402
+from compatibility_matrix import CompatibilityMatrix, birth_features  # noqa: E402
+from ashtakoot import score_total  # noqa: E402
+
+MALES = [
+    {"id": 1, "gender": "male", "dob": "1990-05-17", "tob": "06:30"},
+    {"id": 2, "gender": "male", "dob": "1988-11-02", "tob": "23:10"},
+    {"id": 3, "gender": "male", "dob": "", "tob": "10:00"},
+]
+FEMALES = [
+    {"id": 10, "gender": "female", "dob": "1995-02-02", "tob": "12:00"},
+    {"id": 11, "gender": "female", "dob": "1993-08-21", "tob": "04:45:00"},
+]
+
+
+def expected_points(male, female):
+    m, f = birth_features([male]), birth_features([female])
+    return float(score_total(m["nakshatra"], m["rasi"], f["nakshatra"], f["rasi"])[0])
+
+
+@pytest.fixture
+def matrix(tmp_path, monkeypatch):
+    # Several passes per build
+    monkeypatch.setattr(compatibility_matrix, "MATRIX_CHUNK_CELLS", 2)
+    matrix = CompatibilityMatrix(str(tmp_path / "matrix"))
+    matrix.build(birth_features(MALES), birth_features(FEMALES), headroom=0)
+    return matrix
+
+
+def test_build_scores_every_pair(matrix):
+    scores = matrix.scores(1, "male", [10, 11, 99])
+    assert scores[0] == expected_points(MALES[0], FEMALES[0])
+    assert scores[1] == expected_points(MALES[0], FEMALES[1])
+    assert np.isnan(scores[2])
+    # Same cell read from the column side
+    assert matrix.scores(11, "female", [2])[0] == expected_points(MALES[1], FEMALES[1])
+    # Invalid birth data is unknown
+    assert np.isnan(matrix.scores(3, "male", [10, 11])).all()
+
+
+def test_add_profile_grows_past_capacity(matrix, tmp_path):
+    new_female = {"id": 12, "gender": "female", "dob": "1996-12-25", "tob": "18:20"}
+    new_male = {"id": 4, "gender": "male", "dob": "1991-01-09", "tob": "09:05"}
+    assert matrix.add_profile(new_female)
+    assert matrix.add_profile(new_male)
+    assert matrix.meta["column_capacity"] >= 3 and matrix.meta["row_capacity"] >= 4
+
+    # A separate reader sees the update and the cells scored before it
+    reader = CompatibilityMatrix(str(tmp_path / "matrix"))
+    assert reader.scores(12, "female", [1, 4]).tolist() == [
+        expected_points(MALES[0], new_female),
+        expected_points(new_male, new_female),
+    ]
+    assert reader.scores(2, "male", [10])[0] == expected_points(MALES[1], FEMALES[0])
+    row = reader.row(4, "male")
+    assert row["ids"].tolist() == [10, 11, 12]
+    assert row["points"][2] == expected_points(new_male, new_female)
+
+
+def test_add_profile_needs_a_built_matrix(tmp_path):
+    matrix = CompatibilityMatrix(str(tmp_path / "empty"))
+    assert not matrix.add_profile(MALES[0])
+    assert matrix.features(1, "male") is None
+
+
+@pytest.mark.asyncio
+async def test_profiles_without_integer_ids_are_skipped(matrix):
+    legacy = {**MALES[1], "id": "0b6f5c2e-8d1a-4b7e-9f3c-2a1d4e5f6a7b"}
+
+    class Store:
+        async def iter_candidates(self, gender, columns):
+            yield [MALES[0], legacy]
+
+    assert birth_features([legacy, MALES[0]])["id"].tolist() == [1]
+    features = await compatibility_matrix.load_features(Store(), "male")
+    assert features["id"].tolist() == [1]
+    assert not matrix.add_profile(legacy)
+
+
+def test_sharded_build_matches_single_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(compatibility_matrix, "MATRIX_CHUNK_CELLS", 4)
+    males = [
+        {
+            "id": i,
+            "gender": "male",
+            "dob": f"{1985 + i % 10}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            "tob": f"{i % 24:02d}:{(7 * i) % 60:02d}",
+        }
+        for i in range(1, 40)
+    ]
+    rows, columns = birth_features(males), birth_features(FEMALES)
+
+    single = CompatibilityMatrix(str(tmp_path / "single"))
+    single.build(rows, columns, workers=0)
+    sharded = CompatibilityMatrix(str(tmp_path / "sharded"))
+    sharded.build(rows, columns, workers=2)
+
+    for male in males:
+        assert (
+            sharded.scores(male["id"], "male", [10, 11]).tolist()
+            == single.scores(male["id"], "male", [10, 11]).tolist()
+        )
+
+
+def test_lookup_and_read_only_readers(matrix, tmp_path):
+    reader = CompatibilityMatrix(str(tmp_path / "matrix"))
+    found = reader.lookup([11, 99, 10], "female")
+
+    assert found["id"].tolist() == [11, -1, 10]
+    assert found["nakshatra"][0] == birth_features([FEMALES[1]])["nakshatra"][0]
+    assert reader.lookup([1], "female")["id"].tolist() == [-1]
+    assert not reader.points.flags.writeable
+
+
+def test_matrix_of_another_feature_version_is_ignored(matrix, tmp_path, monkeypatch):
+    monkeypatch.setattr(compatibility_matrix, "ASTRO_FEATURE_VERSION", 2)
+    reader = CompatibilityMatrix(str(tmp_path / "matrix"))
+
+    assert reader.lookup([10], "female")["id"].tolist() == [-1]
+    assert np.isnan(reader.scores(1, "male", [10])).all()
+    assert not reader.add_profile(MALES[0])
+
+
+def test_kundli_scoring_prefers_current_attached_features(matrix, monkeypatch):
+    import kundli_scoring
+    from astro_features import compute_astro_features
+
+    monkeypatch.setattr(kundli_scoring, "get_compatibility_matrix", lambda: matrix)
+    monkeypatch.setattr(kundli_scoring, "get_feature_store", lambda: None)
+    attached = {**FEMALES[0], "astro_features": compute_astro_features([FEMALES[1]])[0]}
+
+    nakshatra, _, _ = kundli_scoring.moon_features([attached, FEMALES[1]])
+
+    expected = birth_features([FEMALES[1]])["nakshatra"][0]
+    assert nakshatra.tolist() == [expected, expected]
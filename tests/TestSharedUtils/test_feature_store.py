@@ -0,0 +1,189 @@
+import os
+import sys
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import feature_store  # noqa: E402
+import kundli_scoring  # noqa: E402
+from feature_store import FeatureStore, profile_features, region_of  # noqa: E402
+from astro_features import moon_features  # noqa: E402
+
+PROFILES = [
+    {
+        "id": 1,
+        "gender": "male",
+        "dob": "1990-05-17",
+        "tob": "06:30",
+        "lat": 19.076,
+        "lon": 72.8777,
+    },
+    {
+        "id": 2,
+        "gender": "female",
+        "dob": "1995-02-02",
+        "tob": "12:00",
+        "lat": 13.0827,
+        "lon": 80.2707,
+    },
+    {
+        "id": 3,
+        "gender": "female",
+        "dob": "1993-08-21",
+        "tob": "04:45",
+        "lat": 12.9165,
+        "lon": 79.1325,
+    },
+    {
+        "id": 4,
+        "gender": "female",
+        "dob": "1996-01-01",
+        "tob": "09:00",
+        "lat": 28.6139,
+        "lon": 77.2090,
+    },
+    {
+        "id": 5,
+        "gender": "female",
+        "dob": "1994-03-03",
+        "tob": "18:20",
+        "lat": None,
+        "lon": None,
+    },
+    {
+        "id": 6,
+        "gender": "male",
+        "dob": "",
+        "tob": "10:00",
+        "lat": 51.5072,
+        "lon": -0.1276,
+    },
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FeatureStore(str(tmp_path / "features"))
+    store.build(profile_features(PROFILES))
+    return store
+
+
+def test_records_hold_the_profile_features(store):
+    records = store.lookup([2, 6, 99])
+    moon = moon_features([PROFILES[1]])
+
+    assert records["id"].tolist() == [2, 6, -1]
+    assert (records["nakshatra"][0], records["pada"][0], records["rasi"][0]) == (
+        moon["nakshatra"][0],
+        moon["pada"][0],
+        moon["rasi"][0],
+    )
+    assert records["gender"][0] == 1
+    assert records["dob_ordinal"][0] == date(1995, 2, 2).toordinal()
+    assert records["lat"][0] == np.float32(13.0827)
+    # Invalid birth data is unknown
+    assert records["nakshatra"][1] == -1 and records["dob_ordinal"][1] == 0
+    assert isinstance(store.records, np.memmap)
+
+
+def test_profiles_without_integer_ids_are_skipped():
+    legacy = {**PROFILES[1], "id": "0b6f5c2e-8d1a-4b7e-9f3c-2a1d4e5f6a7b"}
+    assert profile_features([legacy, PROFILES[0]])["id"].tolist() == [1]
+    assert len(profile_features([legacy])) == 0
+
+
+def test_partitions_are_contiguous_by_gender_and_region(store):
+    assert sorted(store.candidates("female")["id"].tolist()) == [2, 3, 4, 5]
+    assert sorted(store.candidates("male")["id"].tolist()) == [1, 6]
+
+    chennai = int(region_of(13.0827, 80.2707))
+    assert store.partition("female", chennai)["id"].tolist() == [2]
+    assert store.partition("female", -1)["id"].tolist() == [5]
+    assert sum(p["stop"] - p["start"] for p in store.partitions) == len(PROFILES)
+
+
+def test_candidates_within_distance(store):
+    assert sorted(store.candidates("female", 13.0827, 80.2707, 200)["id"].tolist()) == [
+        2,
+        3,
+    ]
+    assert store.candidates("female", 13.0827, 80.2707, 10)["id"].tolist() == [2]
+    assert sorted(
+        store.candidates("female", 13.0827, 80.2707, 2000)["id"].tolist()
+    ) == [2, 3, 4]
+    # Across the antimeridian and over a pole
+    assert store.candidates("male", 51.5, 179.9, 100).size == 0
+    assert sorted(store.candidates("male", 89.0, 0.0, 20000)["id"].tolist()) == [1, 6]
+
+
+def test_readers_switch_to_a_rebuilt_store(store, tmp_path):
+    reader = FeatureStore(store.path)
+    assert reader.lookup([7])["id"][0] == -1
+    old_records = reader.records
+
+    store.build(profile_features(PROFILES + [{**PROFILES[1], "id": 7}]))
+
+    assert reader.lookup([7])["id"][0] == 7
+    # The previous mapping stays readable after its files were unlinked
+    assert len(old_records) == len(PROFILES)
+    assert len([name for name in os.listdir(store.path) if name.endswith(".npy")]) == 2
+
+
+def test_store_of_another_feature_version_is_ignored(store):
+    meta_path = os.path.join(store.path, feature_store.META_FILE)
+    with open(meta_path) as f:
+        meta = json.load(f)
+    assert meta["astro_feature_version"] == feature_store.ASTRO_FEATURE_VERSION
+    meta["astro_feature_version"] -= 1
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+
+    reader = FeatureStore(store.path)
+    assert reader.lookup([2])["id"].tolist() == [-1]
+    assert reader.candidates("female").size == 0
+
+    store.build(profile_features(PROFILES))
+    assert reader.lookup([2])["id"].tolist() == [2]
+
+
+def test_kundli_scoring_reads_features_from_the_store(store, monkeypatch):
+    monkeypatch.setattr(feature_store, "_feature_store", store)
+    monkeypatch.setenv("FEATURE_STORE_DIR", store.path)
+    monkeypatch.setattr(kundli_scoring, "get_compatibility_matrix", lambda: None)
+    computed = []
+    monkeypatch.setattr(
+        kundli_scoring,
+        "astro_moon_features",
+        lambda profiles: computed.extend(profiles) or moon_features(profiles),
+    )
+
+    candidates = [
+        {"id": 2, "gender": "female"},
+        {"id": 99, "gender": "female", "dob": "1993-08-21", "tob": "04:45"},
+    ]
+    nakshatra, pada, rasi = kundli_scoring.moon_features(candidates)
+
+    expected = moon_features([PROFILES[1], candidates[1]])
+    assert nakshatra.tolist() == expected["nakshatra"].tolist()
+    assert rasi.tolist() == expected["rasi"].tolist()
+    # Only the profile missing from the store was computed
+    assert [c["id"] for c in computed] == [99]
+
+
+def test_kundli_scoring_prefers_current_attached_features(store, monkeypatch):
+    from astro_features import compute_astro_features
+
+    monkeypatch.setattr(kundli_scoring, "get_feature_store", lambda: store)
+    monkeypatch.setattr(kundli_scoring, "get_compatibility_matrix", lambda: None)
+    attached = {
+        **PROFILES[1],
+        "astro_features": compute_astro_features([PROFILES[2]])[0],
+    }
+
+    nakshatra, _, _ = kundli_scoring.moon_features([attached])
+
+    assert nakshatra.tolist() == moon_features([PROFILES[2]])["nakshatra"].tolist()
+    assert nakshatra[0] != store.lookup([2])["nakshatra"][0]
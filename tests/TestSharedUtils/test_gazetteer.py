@@ -0,0 +1,191 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+from gazetteer import Gazetteer, build_index  # noqa: E402
+
+GEONAMES_ROWS = [
+    # geonameid, name, asciiname, alternatenames, lat, lon, class, code, country, ..., population
+    [
+        "1264527",
+        "Chennai",
+        "Chennai",
+        "",
+        "13.08784",
+        "80.27847",
+        "P",
+        "PPLA",
+        "IN",
+        "",
+        "25",
+        "",
+        "",
+        "",
+        "4646732",
+    ],
+    [
+        "1275339",
+        "Mumbai",
+        "Mumbai",
+        "",
+        "19.07283",
+        "72.88261",
+        "P",
+        "PPLA",
+        "IN",
+        "",
+        "16",
+        "",
+        "",
+        "",
+        "12691836",
+    ],
+    [
+        "4517009",
+        "London",
+        "London",
+        "",
+        "39.88645",
+        "-83.44825",
+        "P",
+        "PPL",
+        "US",
+        "",
+        "OH",
+        "",
+        "",
+        "",
+        "10060",
+    ],
+    [
+        "2643743",
+        "London",
+        "London",
+        "",
+        "51.50853",
+        "-0.12574",
+        "P",
+        "PPLC",
+        "GB",
+        "",
+        "ENG",
+        "",
+        "",
+        "",
+        "8961989",
+    ],
+    [
+        "1259229",
+        "Pune",
+        "Pune",
+        "",
+        "18.51957",
+        "73.85535",
+        "P",
+        "PPL",
+        "IN",
+        "",
+        "16",
+        "",
+        "",
+        "",
+        "2935744",
+    ],
+    [
+        "263824",
+        "Anderi",
+        "Anderi",
+        "",
+        "38.0",
+        "23.0",
+        "P",
+        "PPL",
+        "GR",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "900",
+    ],
+    [
+        "1253102",
+        "Kanyakumari",
+        "Kanyakumari",
+        "",
+        "8.07844",
+        "77.54192",
+        "H",
+        "CAPE",
+        "IN",
+        "",
+        "25",
+        "",
+        "",
+        "",
+        "0",
+    ],
+]
+COUNTRY_ROWS = [
+    ["IN", "IND", "356", "IN", "India"],
+    ["GB", "GBR", "826", "UK", "United Kingdom"],
+    ["US", "USA", "840", "US", "United States"],
+]
+
+
+@pytest.fixture(scope="module")
+def gazetteer(tmp_path_factory):
+    root = tmp_path_factory.mktemp("gazetteer")
+    geonames = root / "cities.txt"
+    geonames.write_text("".join("\t".join(row) + "\n" for row in GEONAMES_ROWS))
+    countries = root / "countryInfo.txt"
+    countries.write_text(
+        "#ISO\tISO3\n" + "".join("\t".join(row) + "\n" for row in COUNTRY_ROWS)
+    )
+
+    # Non-populated-place features are skipped
+    assert build_index(str(geonames), str(root / "index"), str(countries)) == 6
+    return Gazetteer(str(root / "index"))
+
+
+def test_exact_lookup(gazetteer):
+    entry = gazetteer.lookup("Chennai, Tamil Nadu, India")
+    assert (entry["lat"], entry["lon"], entry["match"]) == (
+        pytest.approx(13.08784),
+        pytest.approx(80.27847),
+        "exact",
+    )
+
+
+def test_lookup_restricts_to_country_then_prefers_population(gazetteer):
+    assert gazetteer.lookup("London")["country"] == "GB"
+    assert gazetteer.lookup("London, United States")["country"] == "US"
+    assert gazetteer.lookup("london, us")["country"] == "US"
+    assert gazetteer.lookup("London, India") is None
+
+
+def test_fuzzy_lookup(gazetteer):
+    entry = gazetteer.lookup("Chenai, India")
+    assert entry["match"] == "fuzzy"
+    assert entry["lat"] == pytest.approx(13.08784)
+
+
+def test_unknown_place(gazetteer):
+    assert gazetteer.lookup("Atlantis") is None
+    assert gazetteer.lookup("Kanyakumari") is None
+
+
+def test_fuzzy_match_outside_the_named_country_is_a_miss(gazetteer):
+    assert gazetteer.lookup("Andheri")["country"] == "GR"
+    assert gazetteer.lookup("Andheri, Mumbai, India") is None
+    assert gazetteer.lookup("Andheri, India", fuzzy=False) is None
+
+
+def test_state_abbreviations_do_not_restrict_the_country(gazetteer):
+    assert gazetteer.lookup("Pune, MH")["country"] == "IN"
+    assert gazetteer.lookup("Chennai, TN")["country"] == "IN"
+    # A country name wins over an abbreviation that is also a country code
+    assert gazetteer.lookup("London, GB, United States")["country"] == "US"
+    assert gazetteer.lookup("Mumbai, US") is None
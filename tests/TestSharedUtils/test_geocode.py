@@ -0,0 +1,80 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import geocode  # noqa: E402
+from result_cache import ResultCache  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "place",
+    ["Chennai, India", "  chennai ,INDIA.", "India, Chennai", "Chennai,  India, India"],
+)
+def test_normalize_place(place):
+    assert geocode.normalize_place(place) == "chennai, india"
+
+
+@pytest.fixture
+def nominatim(monkeypatch, tmp_path):
+    calls = []
+
+    async def fake_search(place):
+        calls.append(place)
+        await asyncio.sleep(0.01)
+        if "atlantis" in place.lower():
+            return None
+        return {"lat": 13.0827, "lon": 80.2707}
+
+    monkeypatch.setattr(geocode, "nominatim_search", fake_search)
+    monkeypatch.setattr(
+        geocode,
+        "_geocode_cache",
+        ResultCache(str(tmp_path / "geocode.sqlite3"), table="geocode"),
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_upstream_call(nominatim):
+    results = await asyncio.gather(
+        *(geocode.geocode_place(p) for p in ["Chennai, India", "india, chennai"] * 5)
+    )
+
+    assert all(r == {"lat": 13.0827, "lon": 80.2707} for r in results)
+    assert len(nominatim) == 1
+
+    assert await geocode.geocode_place("CHENNAI, India") == {
+        "lat": 13.0827,
+        "lon": 80.2707,
+    }
+    assert len(nominatim) == 1
+
+
+@pytest.mark.asyncio
+async def test_unresolved_places_are_cached(nominatim):
+    assert await geocode.geocode_place("Atlantis") is None
+    assert await geocode.geocode_place("atlantis") is None
+    assert len(nominatim) == 1
+
+
+class FuzzyOnlyGazetteer:
+    def lookup(self, place, fuzzy=True):
+        return {"lat": 38.0, "lon": 23.0} if fuzzy else None
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_gazetteer_matches_only_without_remote(nominatim, monkeypatch):
+    monkeypatch.setattr(geocode, "get_gazetteer", lambda: FuzzyOnlyGazetteer())
+
+    assert await geocode.geocode_place("Andheri, India") == {
+        "lat": 13.0827,
+        "lon": 80.2707,
+    }
+    assert len(nominatim) == 1
+    assert await geocode.geocode_place("Andheri, Greece", remote=False) == {
+        "lat": 38.0,
+        "lon": 23.0,
+    }
@@ -0,0 +1,153 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import match_details  # noqa: E402
+from ashtakoot import moon_info  # noqa: E402
+from match_details import (
+    get_raw_response,
+    project_match_details,
+    raw_response_id,
+    store_raw_response,
+)  # noqa: E402
+
+# Trimmed Prokerala kundli-matching response
+PROKERALA_RESPONSE = {
+    "girl_info": {
+        "koot": {
+            "varna": "Vaishya",
+            "vasya": "Manav",
+            "tara": "Janma",
+            "yoni": "Sarpa",
+            "gana": "Deva",
+            "nadi": "Antya",
+        },
+        "nakshatra": {
+            "id": 4,
+            "name": "Mrigashira",
+            "pada": 2,
+            "lord": {"id": 4, "name": "Mars", "vedic_name": "Mangal"},
+        },
+        "rasi": {
+            "id": 1,
+            "name": "Vrishabha",
+            "lord": {"id": 5, "name": "Venus", "vedic_name": "Shukra"},
+        },
+    },
+    "boy_info": {
+        "koot": {
+            "varna": "Kshatriya",
+            "vasya": "Chatushpad",
+            "tara": "Janma",
+            "yoni": "Marjar",
+            "gana": "Rakshasa",
+            "nadi": "Madhya",
+        },
+        "nakshatra": {
+            "id": 5,
+            "name": "Ardra",
+            "pada": 1,
+            "lord": {"id": 101, "name": "Rahu", "vedic_name": "Rahu"},
+        },
+        "rasi": {
+            "id": 2,
+            "name": "Mithuna",
+            "lord": {"id": 2, "name": "Mercury", "vedic_name": "Budha"},
+        },
+    },
+    "message": {
+        "type": "good",
+        "description": "The couple has 24 out of 36 Guna Milan points.",
+    },
+    "guna_milan": {
+        "total_points": 24,
+        "maximum_points": 36,
+        "guna": [
+            {
+                "id": 1,
+                "name": "Varna Koot",
+                "obtained_points": 1,
+                "maximum_points": 1,
+                "description": "...",
+            },
+            {
+                "id": 2,
+                "name": "Vasya Koot",
+                "obtained_points": 2,
+                "maximum_points": 2,
+                "description": "...",
+            },
+            {
+                "id": 5,
+                "name": "Graha Maitri Koot",
+                "obtained_points": 5,
+                "maximum_points": 5,
+                "description": "...",
+            },
+            {
+                "id": 8,
+                "name": "Nadi Koot",
+                "obtained_points": 8,
+                "maximum_points": 8,
+                "description": "...",
+            },
+        ],
+    },
+}
+
+
+def test_project_prokerala_response():
+    details = project_match_details(PROKERALA_RESPONSE)
+    assert details["girl_info"]["nakshatra"] == {
+        "id": 4,
+        "name": "Mrigashira",
+        "lord": {"name": "Mars"},
+        "pada": 2,
+    }
+    assert details["boy_info"]["rasi"] == {
+        "id": 2,
+        "name": "Mithuna",
+        "lord": {"name": "Mercury"},
+    }
+    assert details["girl_info"]["koot"]["nadi"] == "Antya"
+    assert details["koot_points"] == {
+        "varna": 1,
+        "vashya": 2,
+        "graha_maitri": 5,
+        "nadi": 8,
+    }
+    assert details["message"]["type"] == "good"
+    assert "guna_milan" not in details
+
+
+def test_project_local_layout_is_unchanged():
+    local = {
+        "boy_info": moon_info(5, 1, 2),
+        "girl_info": moon_info(4, 2, 1),
+        "guna_milan": {"koot_points": {"nadi": 8.0, "bhakoot": 0.0}},
+        "message": {"type": "bad", "description": "Bhakoot dosha present."},
+    }
+    details = project_match_details(local)
+    assert details["girl_info"] == moon_info(4, 2, 1)
+    assert details["koot_points"] == {"nadi": 8.0, "bhakoot": 0.0}
+    assert project_match_details(None) == {}
+
+
+@pytest.mark.asyncio
+async def test_raw_response_store_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(match_details, "_raw_response_store", None)
+    monkeypatch.setattr(match_details, "RAW_RESPONSE_STORE_ENABLED", False)
+    assert await store_raw_response(PROKERALA_RESPONSE) is None
+
+    monkeypatch.setattr(match_details, "RAW_RESPONSE_STORE_ENABLED", True)
+    monkeypatch.setattr(
+        match_details, "RAW_RESPONSE_STORE_PATH", str(tmp_path / "raw.sqlite3")
+    )
+    response_id = await store_raw_response(PROKERALA_RESPONSE)
+    assert response_id == raw_response_id(
+        dict(reversed(list(PROKERALA_RESPONSE.items())))
+    )
+    assert await get_raw_response(response_id) == PROKERALA_RESPONSE
+    assert await get_raw_response("unknown") is None
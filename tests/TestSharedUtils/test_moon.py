@@ -0,0 +1,47 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import moon  # noqa: E402
+
+GOLDEN_FILE = os.path.join(
+    os.path.dirname(__file__), "data", "moon_positions_golden.json"
+)
+
+with open(GOLDEN_FILE) as f:
+    GOLDEN_CASES = json.load(f)["cases"]
+
+
+@pytest.fixture(scope="module")
+def golden_positions():
+    inputs = [case["input"] for case in GOLDEN_CASES]
+    return moon.moon_positions(
+        [i["dob"] for i in inputs],
+        [i["tob"] for i in inputs],
+        np.array([i["tz_offset"] for i in inputs]),
+        np.array([i["lat"] for i in inputs]),
+        np.array([i["lon"] for i in inputs]),
+    )
+
+
+@pytest.mark.parametrize(
+    "index", range(len(GOLDEN_CASES)), ids=[c["input"]["dob"] for c in GOLDEN_CASES]
+)
+def test_moon_positions_match_golden_set(index, golden_positions):
+    expected = GOLDEN_CASES[index]["moon_info"]
+    assert golden_positions["nakshatra"][index] == expected["nakshatra"]["id"]
+    assert golden_positions["pada"][index] == expected["nakshatra"]["pada"]
+    assert golden_positions["rasi"][index] == expected["rasi"]["id"]
+    assert golden_positions["longitude"][index] == pytest.approx(
+        expected["longitude"], abs=0.01
+    )
+
+
+def test_julian_days_apply_timezone_offset():
+    # 2000-01-01 12:00 UT is J2000.0
+    assert moon.julian_days("2000-01-01", "17:30", 5.5) == pytest.approx(moon.J2000)
+    assert moon.julian_days("2000-01-01", "12:00", 0) == pytest.approx(moon.J2000)
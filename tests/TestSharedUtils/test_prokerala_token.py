@@ -0,0 +1,56 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import prokerala  # noqa: E402
+
+
+@pytest.fixture
+def token_endpoint(monkeypatch):
+    calls = []
+
+    async def fake_fetch_access_token():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"access_token": f"token-{len(calls)}", "expires_in": 3600}
+
+    monkeypatch.setattr(prokerala, "fetch_access_token", fake_fetch_access_token)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_token_fetch(token_endpoint):
+    manager = prokerala.TokenManager(refresh_margin=60)
+
+    tokens = await asyncio.gather(*(manager.get_token() for _ in range(20)))
+
+    assert set(tokens) == {"token-1"}
+    assert len(token_endpoint) == 1
+    assert manager.stats["fetches"] == 1
+    assert manager.stats["cache_hits"] == 19
+
+
+@pytest.mark.asyncio
+async def test_token_is_refetched_inside_refresh_margin(token_endpoint):
+    manager = prokerala.TokenManager(refresh_margin=3600)
+
+    assert await manager.get_token() == "token-1"
+    assert await manager.get_token() == "token-2"
+    assert manager.stats["fetches"] == 2
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_the_background_refresh(token_endpoint):
+    manager = prokerala.TokenManager(refresh_margin=60)
+    await manager.get_token()
+    refresh = manager._refresh_task
+    assert refresh is not None and not refresh.done()
+
+    manager.close()
+    await asyncio.sleep(0)
+
+    assert refresh.cancelled()
+    assert await manager.get_token() == "token-1"
@@ -0,0 +1,140 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import ranking  # noqa: E402
+from candidate_batch import to_batch  # noqa: E402
+from ranking import (
+    match_features,
+    rank_results,
+    rank_scores,
+    ranking_settings,
+    top_k_indices,
+)  # noqa: E402
+
+USER = {"dob": "1990-05-01", "lat": 13.0827, "lon": 80.2707, "occupation": "Engineer"}
+
+
+def make_result(
+    i,
+    points,
+    message_type="good",
+    nadi=8.0,
+    bhakoot=7.0,
+    lat=13.0827,
+    lon=80.2707,
+    dob="1992-05-01",
+    occupation="Engineer",
+):
+    return {
+        "match": {
+            "id": i,
+            "dob": dob,
+            "lat": lat,
+            "lon": lon,
+            "occupation": occupation,
+        },
+        "compatibility": {
+            "compatibility_score": int(points / 36 * 100),
+            "total_points": points,
+            "maximum_points": 36,
+            "message_type": message_type,
+            "details": {"koot_points": {"nadi": nadi, "bhakoot": bhakoot}},
+        },
+    }
+
+
+RESULTS = [
+    make_result(0, 30, nadi=0.0),
+    make_result(1, 28),
+    make_result(2, 28, lat=28.6139, lon=77.2090, occupation="Doctor"),
+    make_result(3, 20, message_type="good", bhakoot=0.0, dob="1980-05-01"),
+    make_result(4, 12, message_type="bad"),
+    {
+        "match": {"id": 5},
+        "compatibility": {"compatibility_score": 0, "message_type": "error"},
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def no_config(monkeypatch):
+    monkeypatch.setattr(ranking, "_ranking_config", None)
+    monkeypatch.setattr(ranking, "RANKING_CONFIG_PATH", "")
+
+
+def test_features():
+    features = match_features(USER, RESULTS)
+    np.testing.assert_allclose(
+        features["guna"][:5], [30 / 36, 28 / 36, 28 / 36, 20 / 36, 12 / 36]
+    )
+    assert features["nadi_dosha"].tolist() == [1, 0, 0, 0, 0, 0]
+    assert features["bhakoot_dosha"].tolist() == [0, 0, 0, 1, 0, 0]
+    # Chennai to Delhi
+    assert 1750 < features["distance_km"][2] < 1770
+    assert features["distance_km"][1] == pytest.approx(0)
+    assert features["age_gap_years"][3] == pytest.approx(10, abs=0.01)
+    assert np.isnan(features["age_gap_years"][5])
+    assert features["occupation"].tolist() == [1, 1, 0, 1, 1, 0]
+    assert features["valid"].tolist() == [True] * 5 + [False]
+
+
+def test_batch_and_records_rank_alike():
+    assert rank_results(USER, to_batch(RESULTS), 3) == rank_results(USER, RESULTS, 3)
+
+
+def test_weighted_ranking_and_vetoes():
+    ranked = [r["match"]["id"] for r in rank_results(USER, RESULTS, 5)]
+    # The nadi dosha costs candidate 0 its lead; 2 loses on distance and occupation
+    assert ranked == [1, 2, 0, 3]
+    ranked = [
+        r["match"]["id"]
+        for r in rank_results(USER, RESULTS, 5, overrides={"hard_vetoes": ["nadi"]})
+    ]
+    assert ranked == [1, 2, 3]
+    # Without good matches the best bad one is returned
+    assert [r["match"]["id"] for r in rank_results(USER, RESULTS[4:], 5)] == [4]
+
+
+def test_tenant_config(tmp_path, monkeypatch):
+    path = tmp_path / "ranking.json"
+    path.write_text(
+        json.dumps(
+            {
+                "default": {"weights": {"distance": 0.0}},
+                "tenants": {
+                    "metro": {
+                        "weights": {"distance": 1.0},
+                        "occupation_affinity": {"engineer": {"doctor": 1.0}},
+                    }
+                },
+            }
+        )
+    )
+    monkeypatch.setattr(ranking, "RANKING_CONFIG_PATH", str(path))
+    assert ranking_settings()["weights"]["distance"] == 0.0
+    assert ranking_settings()["weights"]["guna"] == 1.0
+    assert ranking_settings("metro")["weights"]["distance"] == 1.0
+    assert [r["match"]["id"] for r in rank_results(USER, RESULTS, 2)] == [1, 2]
+    ranked = rank_results(USER, RESULTS, 5, tenant="metro")
+    assert [r["match"]["id"] for r in ranked][-1] == 2
+    # Guna share, minus 2 of 10 years of age gap at weight 0.1, plus the occupation bonus
+    assert ranked[0]["rank_score"] == pytest.approx(28 / 36 - 0.02 + 0.05, abs=1e-4)
+
+
+def test_top_k_indices_matches_full_sort():
+    rng = np.random.default_rng(0)
+    scores = rng.integers(0, 50, 10000).astype(np.float64)
+    scores[rng.choice(10000, 100, replace=False)] = -np.inf
+    expected = sorted(
+        np.flatnonzero(np.isfinite(scores)), key=lambda i: (-scores[i], i)
+    )[:25]
+    assert top_k_indices(scores, 25).tolist() == expected
+    assert top_k_indices(scores[:3], 10).tolist() == sorted(
+        range(3), key=lambda i: (-scores[i], i)
+    )
+    assert rank_scores(match_features(USER, []), ranking_settings()).shape == (0,)
@@ -0,0 +1,32 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+from rate_limit import TokenBucket  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate_after_burst():
+    bucket = TokenBucket(rate=20, capacity=5)
+
+    started = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(15)))
+
+    # 5 from the burst, the remaining 10 at 20/s
+    assert time.monotonic() - started == pytest.approx(0.5, abs=0.15)
+    assert bucket.stats["acquired"] == 15
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_holds_back_callers():
+    bucket = TokenBucket(rate=1000, capacity=10)
+    bucket.pause(0.2)
+
+    started = time.monotonic()
+    await bucket.acquire()
+
+    assert time.monotonic() - started >= 0.2
@@ -0,0 +1,259 @@
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import geocode  # noqa: E402
+import kundli_scoring  # noqa: E402
+import prokerala  # noqa: E402
+import resilience  # noqa: E402
+from resilience import (
+    CLOSED,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    Endpoint,
+    RetryBudget,
+    is_transient,
+)  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(resilience, "backoff_delay", lambda retry: 0)
+
+
+def server_error(status=503):
+    request = httpx.Request("GET", "https://api.example.com")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+def endpoint(**options):
+    options.setdefault("breaker", CircuitBreaker(failure_threshold=3, open_seconds=0.1))
+    options.setdefault("budget", RetryBudget(ratio=0, capacity=100, per_second=0))
+    return Endpoint("test", **options)
+
+
+def test_transient_errors():
+    assert is_transient(httpx.ConnectTimeout("slow"))
+    assert is_transient(server_error(503)) and is_transient(server_error(429))
+    assert not is_transient(server_error(404))
+    assert not is_transient(ValueError("bad"))
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried():
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        if len(calls) < 3:
+            raise httpx.ReadTimeout("slow")
+        return "ok"
+
+    guarded = endpoint(max_retries=2)
+    assert await guarded.call(attempt) == "ok"
+    assert guarded.stats["retries"] == 2
+    assert guarded.breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        raise server_error(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await endpoint().call(attempt)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_bounds_retries():
+    calls = []
+
+    async def attempt():
+        calls.append(1)
+        raise httpx.ConnectError("down")
+
+    guarded = endpoint(
+        max_retries=5,
+        budget=RetryBudget(ratio=0, capacity=2, per_second=0),
+        breaker=CircuitBreaker(failure_threshold=100),
+    )
+    with pytest.raises(httpx.ConnectError):
+        await guarded.call(attempt)
+    assert len(calls) == 3
+    assert guarded.budget.exhausted == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_rejects_and_recovers_after_probe():
+    healthy = False
+
+    async def attempt():
+        if not healthy:
+            raise httpx.ConnectError("down")
+        return "ok"
+
+    guarded = endpoint(max_retries=0)
+    for _ in range(3):
+        with pytest.raises(httpx.ConnectError):
+            await guarded.call(attempt)
+
+    assert guarded.breaker.state == "open" and not guarded.available
+    with pytest.raises(CircuitOpenError):
+        await guarded.call(attempt)
+    assert guarded.stats["rejected"] == 1
+
+    # A failed probe reopens the circuit, a successful one closes it
+    await asyncio.sleep(0.1)
+    with pytest.raises(httpx.ConnectError):
+        await guarded.call(attempt)
+    assert guarded.breaker.state == "open"
+    await asyncio.sleep(0.1)
+    healthy = True
+    assert await guarded.call(attempt) == "ok"
+    assert guarded.breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_slow_attempt_is_hedged_after_p95(monkeypatch):
+    monkeypatch.setattr(resilience, "RESILIENCE_HEDGE_MIN_SAMPLES", 5)
+    guarded = endpoint(hedge=True)
+    for _ in range(10):
+        guarded.latency.add(0.02)
+    started = []
+
+    async def attempt():
+        started.append(time.monotonic())
+        # The first request hangs, the hedged one answers quickly
+        await asyncio.sleep(5 if len(started) == 1 else 0.01)
+        return len(started)
+
+    began = time.monotonic()
+    assert await guarded.call(attempt) == 2
+    assert time.monotonic() - began < 1
+    assert started[1] - started[0] == pytest.approx(0.05, abs=0.04)
+    assert (guarded.stats["hedges"], guarded.stats["hedge_wins"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_open_prokerala_circuit_keeps_local_estimates(monkeypatch):
+    sent = []
+
+    async def fake_remote(user_profile, candidates, deadline=None):
+        sent.extend(candidates)
+        return []
+
+    breaker = CircuitBreaker(failure_threshold=1, open_seconds=60)
+    breaker.record_failure()
+    monkeypatch.setattr(kundli_scoring.kundli_match_endpoint, "breaker", breaker)
+    monkeypatch.setattr(kundli_scoring, "remote_compatibility", fake_remote)
+
+    user = {"dob": "1990-05-17", "tob": "06:30", "lat": 19.076, "lon": 72.8777}
+    candidates = [{"dob": "1995-02-02", "tob": "12:00", "lat": 13.0827, "lon": 80.2707}]
+    compatibilities = await kundli_scoring.two_stage_compatibility(
+        user, candidates, top_k=5, budget=0
+    )
+
+    assert sent == []
+    assert compatibilities[0]["estimated"] is True
+    assert compatibilities[0]["message_type"] != "error"
+
+
+class RateLimitedClient:
+    def __init__(self):
+        self.requests = 0
+
+    async def get(self, url, params=None, headers=None):
+        self.requests += 1
+        request = httpx.Request("GET", url, params=params)
+        return httpx.Response(429, headers={"Retry-After": "2"}, request=request)
+
+
+class RecordingLimiter:
+    def __init__(self):
+        self.acquired = 0
+        self.pauses = []
+
+    async def acquire(self):
+        self.acquired += 1
+
+    def pause(self, seconds):
+        self.pauses.append(seconds)
+
+
+@pytest.mark.asyncio
+async def test_persistent_rate_limit_opens_prokerala_circuit(monkeypatch):
+    client = RateLimitedClient()
+    limiter = RecordingLimiter()
+
+    async def token():
+        return "token"
+
+    budget = RetryBudget(ratio=0, capacity=100, per_second=0)
+    guarded = endpoint(max_retries=2, budget=budget, throttle=limiter.acquire)
+    monkeypatch.setattr(prokerala, "kundli_match_endpoint", guarded)
+    monkeypatch.setattr(prokerala, "rate_limiter", limiter)
+    monkeypatch.setattr(prokerala, "get_http_client", lambda: client)
+    monkeypatch.setattr(prokerala, "get_access_token", token)
+    monkeypatch.setattr(prokerala, "get_match_cache", lambda: None)
+
+    profile = {"dob": "1990-05-17", "tob": "06:30", "lat": 19.076, "lon": 72.8777}
+    assert guarded.breaker.state == CLOSED
+    result = await prokerala.get_kundli_match(profile, profile)
+
+    # One request per attempt, every retry drawn from the shared budget
+    assert "error" in result
+    assert client.requests == limiter.acquired == 3
+    assert limiter.pauses == [2.0, 2.0, 2.0]
+    assert guarded.stats["retries"] == 2 and budget._tokens == 98
+    assert guarded.breaker.state == OPEN
+
+    result = await prokerala.get_kundli_match(profile, profile)
+    assert "circuit open" in result["error"]
+    assert client.requests == limiter.acquired == 3
+
+
+@pytest.mark.asyncio
+async def test_throttle_wait_is_not_counted_as_latency():
+    async def throttle():
+        await asyncio.sleep(0.05)
+
+    async def attempt():
+        return 1
+
+    guarded = endpoint(throttle=throttle)
+    assert await guarded.call(attempt) == 1
+    assert guarded.latency.percentile(0.95) < 0.04
+
+
+class FakeGazetteer:
+    def lookup(self, place, fuzzy=True):
+        return {"lat": 19.076, "lon": 72.8777} if place == "Mumbai, India" else None
+
+
+@pytest.mark.asyncio
+async def test_geocode_falls_back_to_coarser_gazetteer_match(monkeypatch):
+    async def unavailable(place):
+        raise CircuitOpenError("nominatim", 30)
+
+    monkeypatch.setattr(geocode, "nominatim_search", unavailable)
+    monkeypatch.setattr(geocode, "get_gazetteer", lambda: FakeGazetteer())
+    monkeypatch.setattr(geocode, "get_geocode_cache", lambda: None)
+
+    assert await geocode.geocode_place("Andheri, Mumbai, India") == {
+        "lat": 19.076,
+        "lon": 72.8777,
+    }
+    with pytest.raises(CircuitOpenError):
+        await geocode.geocode_place("Atlantis, India")
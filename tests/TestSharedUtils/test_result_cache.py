@@ -0,0 +1,49 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+from result_cache import ResultCache  # noqa: E402
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"), memory_size=2)
+    cache.set("a", {"score": 1})
+    cache.set("b", {"score": 2})
+    cache.get("a")
+    cache.set("c", {"score": 3})
+
+    stats = cache.stats()
+    assert stats["memory_entries"] == 2
+    assert stats["memory_evictions"] == 1
+    # "b" was evicted from memory but is still on disk
+    assert cache.get("b") == {"score": 2}
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_disk_tier_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ResultCache(path).set("pair", {"total_points": 27.5})
+
+    other = ResultCache(path)
+    assert other.get("pair") == {"total_points": 27.5}
+    assert other.get("missing") is None
+    assert other.stats()["misses"] == 1
+
+
+def test_expired_entries_are_not_returned(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"), ttl=-1)
+    cache.set("pair", {"total_points": 10})
+
+    assert cache.get("pair") is None
+    assert cache.stats()["expired"] >= 1
+
+
+def test_evict_trims_disk_tier_to_max_rows(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"), max_rows=3)
+    for i in range(5):
+        cache.set(str(i), i)
+    cache.evict()
+
+    stats = cache.stats()
+    assert stats["disk_entries"] == 3
+    assert stats["disk_evictions"] == 2
@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+import asyncio
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import kundli_scoring  # noqa: E402
+import scoring_pool  # noqa: E402
+from scoring_pool import map_shards, shards  # noqa: E402
+from astro_features import ensure_astro_features  # noqa: E402
+
+USER = {
+    "dob": "1990-05-17",
+    "tob": "06:30",
+    "gender": "male",
+    "lat": 19.076,
+    "lon": 72.8777,
+}
+
+
+def candidates(count):
+    profiles = [
+        {
+            "id": i,
+            "name": f"Candidate {i}",
+            "gender": "female",
+            "dob": f"{1985 + i % 15}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            "tob": f"{i % 24:02d}:{i % 60:02d}",
+            "lat": 13.0827,
+            "lon": 80.2707,
+            "occupation": "Engineer",
+        }
+        for i in range(count)
+    ]
+    for profile, features in zip(profiles[::2], ensure_astro_features(profiles[::2])):
+        profile["astro_features"] = features
+    profiles[5]["dob"] = ""
+    return profiles
+
+
+def test_shards_cover_the_range_in_order():
+    parts = shards(10_000, workers=2, min_size=100, max_size=1000)
+    assert [p.start for p in parts] == list(range(0, 10_000, 1000))
+    assert parts[-1].stop == 10_000
+
+    # 2 workers x SHARDS_PER_WORKER shards when that size is within bounds
+    assert (
+        len(shards(8000, workers=2, min_size=100, max_size=5000))
+        == 2 * scoring_pool.SHARDS_PER_WORKER
+    )
+    # Too few for two shards of the minimum size
+    assert shards(150, workers=4, min_size=100, max_size=1000) == [slice(0, 150)]
+    assert shards(0, workers=4) == []
+
+
+def _slow_square(x):
+    time.sleep(0.05 * (3 - x))
+    return x * x
+
+
+@pytest.mark.asyncio
+async def test_map_shards_keeps_order_and_the_loop_free():
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(2) as pool:
+        # Later shards finish first
+        assert await map_shards(pool, _slow_square, [(0,), (1,), (2,)]) == [0, 1, 4]
+    task.cancel()
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_sharded_scoring_matches_in_process(monkeypatch):
+    monkeypatch.setattr(scoring_pool, "SCORING_WORKERS", 2)
+    monkeypatch.setattr(kundli_scoring, "SCORING_WORKERS", 2)
+    monkeypatch.setattr(kundli_scoring, "SCORING_MIN_SHARD_SIZE", 50)
+    profiles = candidates(400)
+    try:
+        sharded = await kundli_scoring.sharded_local_compatibility(USER, profiles)
+        assert scoring_pool._pool is not None
+    finally:
+        await scoring_pool.close_scoring_pool()
+
+    assert sharded == kundli_scoring.local_compatibility(USER, profiles)
+    assert sharded[5]["message_type"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_small_pools_score_in_process(monkeypatch):
+    monkeypatch.setattr(scoring_pool, "SCORING_WORKERS", 2)
+    monkeypatch.setattr(kundli_scoring, "SCORING_WORKERS", 2)
+    profiles = candidates(10)
+
+    assert await kundli_scoring.sharded_local_compatibility(
+        USER, profiles
+    ) == kundli_scoring.local_compatibility(USER, profiles)
+    assert scoring_pool._pool is None
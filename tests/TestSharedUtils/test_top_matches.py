@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+from top_matches import TopMatches  # noqa: E402
+
+
+def make_result(i, score, message_type):
+    return {
+        "match": {"id": i},
+        "compatibility": {"compatibility_score": score, "message_type": message_type},
+    }
+
+
+def sort_and_filter(results, k):
+    """The previous formatter behaviour: stable sort of everything, then the good/best-bad rule"""
+    ranked = sorted(
+        results, key=lambda r: r["compatibility"]["compatibility_score"], reverse=True
+    )
+    good = [r for r in ranked if r["compatibility"]["message_type"] == "good"]
+    if good:
+        return good[:k]
+    bad = [r for r in ranked if r["compatibility"]["message_type"] == "bad"]
+    return (
+        [max(bad, key=lambda r: r["compatibility"]["compatibility_score"])]
+        if bad
+        else []
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_full_sort(seed):
+    rng = random.Random(seed)
+    results = [
+        make_result(i, rng.randint(0, 20) * 5, rng.choice(["good", "bad", "error"]))
+        for i in range(500)
+    ]
+    selector = TopMatches(good_k=5)
+    selector.extend(results)
+    assert selector.results() == sort_and_filter(results, 5)
+    assert selector.seen == 500
+
+    no_good = [r for r in results if r["compatibility"]["message_type"] != "good"]
+    selector = TopMatches(good_k=5)
+    selector.extend(no_good)
+    assert selector.results() == sort_and_filter(no_good, 5)
+
+
+def test_errors_only():
+    selector = TopMatches()
+    selector.extend([make_result(1, 0, "error"), {"match": {}, "compatibility": {}}])
+    assert selector.results() == []
+
+
+@pytest.mark.asyncio
+async def test_incremental_chunks():
+    results = [make_result(i, i % 7 * 10, "good") for i in range(50)]
+
+    async def chunks():
+        for start in range(0, len(results), 8):
+            yield results[start : start + 8]
+
+    selector = TopMatches(good_k=3)
+    await selector.aextend(chunks())
+    assert selector.results() == sort_and_filter(results, 3)
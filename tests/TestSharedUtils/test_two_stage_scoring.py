@@ -0,0 +1,159 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared_utils"))
+import kundli_scoring  # noqa: E402
+from kundli_scoring import (  # noqa: E402
+    local_compatibility,
+    score_candidates,
+    select_for_remote,
+    two_stage_compatibility,
+)
+from resilience import CircuitBreaker  # noqa: E402
+
+USER = {"dob": "1990-05-17", "tob": "06:30", "lat": 19.076, "lon": 72.8777}
+CANDIDATES = [
+    {"dob": "1995-02-02", "tob": "12:00", "lat": 13.0827, "lon": 80.2707},
+    {"dob": "1993-08-21", "tob": "04:45", "lat": 12.9165, "lon": 79.1325},
+    {"dob": "1996-01-01", "tob": "09:00", "lat": 28.6139, "lon": 77.2090},
+    {"dob": "1994-03-03", "tob": "18:20", "lat": 22.5726, "lon": 88.3639},
+    {"dob": "1992-11-11", "tob": "23:10", "lat": 18.5204, "lon": 73.8567},
+    {"dob": "not a date", "tob": "12:00", "lat": 13.0827, "lon": 80.2707},
+]
+REMOTE_POINTS = 35
+
+
+class FakeProkerala:
+    """Stands in for get_kundli_match, failing or stalling for chosen dobs"""
+
+    def __init__(self, fail=(), slow=()):
+        self.fail = set(fail)
+        self.slow = set(slow)
+        self.calls = []
+
+    async def __call__(self, user_data, match_data):
+        self.calls.append(match_data["dob"])
+        if match_data["dob"] in self.slow:
+            await asyncio.sleep(5)
+        if match_data["dob"] in self.fail:
+            return {"error": "API Error: quota exceeded", "compatibility_score": 0}
+        return {
+            "compatibility_score": 97,
+            "total_points": REMOTE_POINTS,
+            "maximum_points": 36,
+            "message": "Excellent match",
+            "message_type": "good",
+            "raw_response": {},
+        }
+
+
+@pytest.fixture
+def prokerala(monkeypatch):
+    fake = FakeProkerala()
+    monkeypatch.setattr(kundli_scoring, "get_kundli_match", fake)
+    monkeypatch.setattr(kundli_scoring, "get_compatibility_matrix", lambda: None)
+    monkeypatch.setattr(kundli_scoring, "get_feature_store", lambda: None)
+    monkeypatch.setattr(
+        kundli_scoring.kundli_match_endpoint, "breaker", CircuitBreaker()
+    )
+    return fake
+
+
+def ranked_dobs():
+    """Candidate dobs with valid birth data, best local estimate first"""
+    estimates = local_compatibility(USER, CANDIDATES)
+    order = select_for_remote(estimates, top_k=0, budget=0)
+    return [CANDIDATES[i]["dob"] for i in order]
+
+
+def test_select_for_remote_takes_the_best_estimates_within_the_budget():
+    estimates = [
+        {"total_points": 20, "message_type": "neutral"},
+        {"total_points": 0, "message_type": "error"},
+        {"total_points": 31, "message_type": "good"},
+        {"total_points": 12.5, "message_type": "bad"},
+    ]
+    assert select_for_remote(estimates, top_k=2, budget=0) == [2, 0]
+    assert select_for_remote(estimates, top_k=0, budget=0) == [2, 0, 3]
+    assert select_for_remote(estimates, top_k=0, budget=1) == [2]
+    assert select_for_remote(estimates, top_k=2, budget=5) == [2, 0]
+
+
+@pytest.mark.asyncio
+async def test_only_the_top_k_are_confirmed_remotely(prokerala):
+    compatibilities = await two_stage_compatibility(USER, CANDIDATES, top_k=2, budget=0)
+
+    assert sorted(prokerala.calls) == sorted(ranked_dobs()[:2])
+    for candidate, compatibility in zip(CANDIDATES, compatibilities):
+        if candidate["dob"] in prokerala.calls:
+            assert compatibility["estimated"] is False
+            assert compatibility["total_points"] == REMOTE_POINTS
+        elif compatibility["message_type"] != "error":
+            assert compatibility["estimated"] is True
+    # Invalid birth data is an error, not an estimate
+    assert compatibilities[-1]["message_type"] == "error"
+    assert "estimated" not in compatibilities[-1]
+
+
+@pytest.mark.asyncio
+async def test_request_overrides_top_k_and_paid_calls(prokerala, monkeypatch):
+    monkeypatch.setattr(kundli_scoring, "KUNDLI_MATCH_BACKEND", "prokerala")
+    monkeypatch.setattr(kundli_scoring, "KUNDLI_MATCH_TOP_K", 10)
+    monkeypatch.setattr(kundli_scoring, "KUNDLI_MATCH_PAID_CALL_BUDGET", 0)
+
+    await score_candidates(USER, CANDIDATES, top_k=1)
+    assert prokerala.calls == ranked_dobs()[:1]
+
+    prokerala.calls.clear()
+    results = await score_candidates(USER, CANDIDATES, top_k=0, max_paid_calls=3)
+    assert sorted(prokerala.calls) == sorted(ranked_dobs()[:3])
+    assert [r["match"] for r in results] == CANDIDATES
+
+    prokerala.calls.clear()
+    await score_candidates(USER, CANDIDATES)
+    assert len(prokerala.calls) == len(ranked_dobs())
+
+
+@pytest.mark.asyncio
+async def test_failed_remote_calls_keep_the_local_estimate(prokerala):
+    best = ranked_dobs()[0]
+    prokerala.fail.add(best)
+    local = local_compatibility(USER, CANDIDATES)
+
+    compatibilities = await two_stage_compatibility(USER, CANDIDATES, top_k=2, budget=0)
+
+    failed = next(i for i, c in enumerate(CANDIDATES) if c["dob"] == best)
+    assert compatibilities[failed]["estimated"] is True
+    assert compatibilities[failed]["total_points"] == local[failed]["total_points"]
+    assert sum(1 for c in compatibilities if c.get("estimated") is False) == 1
+
+
+@pytest.mark.asyncio
+async def test_candidates_over_the_deadline_stay_estimated(prokerala, monkeypatch):
+    monkeypatch.setattr(kundli_scoring, "KUNDLI_MATCH_DEADLINE", 0.1)
+    slow = ranked_dobs()[1]
+    prokerala.slow.add(slow)
+
+    began = time.monotonic()
+    compatibilities = await two_stage_compatibility(USER, CANDIDATES, top_k=2, budget=0)
+
+    assert time.monotonic() - began < 2
+    by_dob = {c["dob"]: comp for c, comp in zip(CANDIDATES, compatibilities)}
+    assert by_dob[slow]["estimated"] is True
+    assert by_dob[ranked_dobs()[0]]["estimated"] is False
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_makes_no_remote_calls(prokerala, monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, open_seconds=60)
+    breaker.record_failure()
+    monkeypatch.setattr(kundli_scoring.kundli_match_endpoint, "breaker", breaker)
+
+    compatibilities = await two_stage_compatibility(USER, CANDIDATES, top_k=2, budget=0)
+
+    assert prokerala.calls == []
+    assert all(c["estimated"] for c in compatibilities[:-1])